@@ -1,5 +1,9 @@
 import openai
 import json
+try:
+    import orjson as json_fast  # C parser for LLM responses
+except ImportError:
+    import json as json_fast
 import time
 import os
 import datetime
@@ -61,6 +65,174 @@ RETRY_DELAY = 2  # seconds
 USE_MACRO_CONTEXT = True
 USE_OPTIONS_CONTEXT = True
 
+# Static classification instructions. They lead every request, byte-for-byte
+# identical, ahead of the per-call data (macro context first, headline last)
+# so the backend's automatic prompt-prefix caching can reuse them across calls.
+CLASSIFIER_SYSTEM_PROMPT = (
+    "You are a macroeconomic and options market classifier. Use macro data, options market indicators, and event tags to guide your reasoning.\n\n"
+    "Use the time awareness, economic surprise and relevance signals to better understand the urgency and magnitude of the event. "
+    "Use the event-specific tags to understand if the headline occurred during a volatile period or surprised the market. Adjust your sentiment and trade recommendation accordingly.\n\n"
+    "Based on this data, classify the event and recommend an options trade. "
+    "Consider event tags when making your recommendation. "
+    "If it's a repeat event, check if previous similar events had predictable impacts. "
+    "If it's a Fed week or CPI week, consider the heightened volatility. "
+    "If IV is high and skew is bearish (puts more expensive), favor PUTs. "
+    "If sentiment is bullish with low IV and call skew, favor CALLs. "
+    "Given this news and macro context, would you BUY or SELL this stock? Justify your directional choice in your recommendation. "
+    "Return JSON in this format: {event_type, sentiment, sector, trade, direction}"
+)
+BATCH_CLASSIFIER_SYSTEM_PROMPT = (
+    "You are a macroeconomic and options market classifier. Use macro data to guide your reasoning. "
+    "Classify each numbered headline. "
+    "Return JSON in this format: {\"classifications\": [{index, event_type, sentiment, sector, direction}]} "
+    "with exactly one entry per headline, using the headline number as index."
+)
+
+# Allowed labels, shared by the structured-output schemas below
+EVENT_TYPES = [
+    "Monetary Policy", "Inflation", "Economic Growth", "Earnings", "Trade",
+    "Geopolitical", "Fiscal Policy", "Regulation", "Other"
+]
+SENTIMENTS = ["Bullish", "Bearish", "Neutral"]
+SECTORS = [
+    "Technology", "Financials", "Energy", "Consumer", "Healthcare", "Industrials",
+    "Real Estate", "Utilities", "Materials", "Communication Services", "General"
+]
+
+# Output token bounds (the single-headline response carries a trade rationale)
+CLASSIFY_MAX_TOKENS = 256
+BATCH_MAX_TOKENS_PER_HEADLINE = 48
+# Set on DummyClassifier results (no key, dummy mode, or API failure) so callers
+# can keep keyword-rule fallbacks out of their caches
+FALLBACK_KEY = "_fallback"
+
+# Model families that accept response_format={"type": "json_schema"}
+STRUCTURED_OUTPUT_MODEL_PREFIXES = ("gpt-4o", "gpt-4.1", "gpt-5", "o1", "o3", "o4")
+# Older snapshots that reject response_format entirely (no JSON mode either)
+NO_RESPONSE_FORMAT_MODELS = (
+    "gpt-4", "gpt-4-0314", "gpt-4-0613", "gpt-4-32k", "gpt-4-32k-0314", "gpt-4-32k-0613",
+    "gpt-3.5-turbo-0301", "gpt-3.5-turbo-0613", "gpt-3.5-turbo-16k", "gpt-3.5-turbo-16k-0613",
+    "o1-mini", "o1-preview"
+)
+# Reasoning models take max_completion_tokens and only the default temperature
+REASONING_MODEL_PREFIXES = ("o1", "o3", "o4", "gpt-5")
+# Reasoning tokens count against max_completion_tokens, so give them headroom
+REASONING_TOKEN_ALLOWANCE = 2048
+
+_CLASSIFICATION_PROPERTIES = {
+    "event_type": {"type": "string", "enum": EVENT_TYPES},
+    "sentiment": {"type": "string", "enum": SENTIMENTS},
+    "sector": {"type": "string", "enum": SECTORS},
+    "direction": {"type": "string", "enum": ["BUY", "SELL"]},
+}
+
+CLASSIFICATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "macro_event_classification",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                **_CLASSIFICATION_PROPERTIES,
+                "trade": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": {"type": "string"},
+                        "option_type": {"type": "string", "enum": ["CALL", "PUT"]},
+                        "strike": {"type": "string"},
+                        "expiry": {"type": "string"},
+                        "rationale": {"type": "string"},
+                    },
+                    "required": ["ticker", "option_type", "strike", "expiry", "rationale"],
+                    "additionalProperties": False,
+                },
+            },
+            "required": ["event_type", "sentiment", "sector", "direction", "trade"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+BATCH_CLASSIFICATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "macro_event_batch_classification",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "classifications": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"index": {"type": "integer"}, **_CLASSIFICATION_PROPERTIES},
+                        "required": ["index", "event_type", "sentiment", "sector", "direction"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["classifications"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+def is_reasoning_model(model: str) -> bool:
+    """Return True for reasoning models (o-series, gpt-5 except the chat variants)."""
+    return model.startswith(REASONING_MODEL_PREFIXES) and not model.startswith("gpt-5-chat")
+
+def get_response_format(model: str, schema_format: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Pick the response_format a model accepts.
+    
+    Returns:
+        schema_format for models with structured outputs, plain JSON mode for
+        other current models, or None for models that reject response_format
+    """
+    if model in NO_RESPONSE_FORMAT_MODELS:
+        return None
+    if model.startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES):
+        return schema_format
+    return {"type": "json_object"}
+
+def get_completion_params(model: str, schema_format: Dict[str, Any], max_tokens: int) -> Dict[str, Any]:
+    """
+    Build the model-dependent chat completion parameters.
+    
+    Args:
+        model: OpenAI model name
+        schema_format: json_schema response_format to use when the model supports it
+        max_tokens: Bound on the visible output tokens
+        
+    Returns:
+        Keyword arguments for openai.chat.completions.create (besides model and messages)
+    """
+    if is_reasoning_model(model):
+        params = {"max_completion_tokens": max_tokens + REASONING_TOKEN_ALLOWANCE}
+    else:
+        params = {"temperature": 0.2, "max_tokens": max_tokens}
+    
+    response_format = get_response_format(model, schema_format)
+    if response_format is not None:
+        params["response_format"] = response_format
+    return params
+
+def parse_json_content(content: str) -> Any:
+    """
+    Parse a JSON response body.
+    
+    Models called without response_format may wrap the JSON in prose or a code
+    fence, so on a parse error the outermost {...} span is tried instead.
+    """
+    try:
+        return json_fast.loads(content)
+    except ValueError:
+        start, end = content.find("{"), content.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        return json_fast.loads(content[start:end + 1])
+
 class DummyClassifier:
     """A simple dummy classifier for testing without API calls."""
     
@@ -194,6 +366,7 @@ class DummyClassifier:
             "expiry": "30d",  # 30 days out
             "rationale": f"Dummy recommendation based on {classification['sentiment']} sentiment for {classification['sector']} sector"
         }
+        classification[FALLBACK_KEY] = True
         
         return classification
 
@@ -307,9 +480,10 @@ class OpenAIClassifier:
                 if source:
                     headline_text += f"\nSource: {source}"
                 
-                # Using the specified message format for OpenAI API
-                system_message = "You are a macroeconomic and options market classifier. Use macro data, options market indicators, and event tags to guide your reasoning."
-                user_message = f"Headline: '{headline_text}'\n\n"
+                # Static instructions go in the system message; the user message
+                # orders data from most to least shared so the prefix stays cacheable
+                system_message = CLASSIFIER_SYSTEM_PROMPT
+                user_message = ""
                 
                 if USE_MACRO_CONTEXT:
                     user_message += f"Macro Context:\n{macro_string}\n\n"
@@ -319,8 +493,6 @@ class OpenAIClassifier:
                     user_message += f"📊 Economic Surprise:\n{prompt_enhancers['delta_description']}\n\n"
                     # Add enhanced relevance weights
                     user_message += f"⚖️ Relevance Signals:\n{prompt_enhancers['relevance_weights']}\n\n"
-                    # Add instruction for enhanced context
-                    user_message += "Use these to better understand the urgency and magnitude of the event.\n\n"
                 
                 if USE_OPTIONS_CONTEXT:
                     user_message += f"Options Sentiment Context:\n{options_string}\n\n"
@@ -328,21 +500,10 @@ class OpenAIClassifier:
                 # Include event tags in the prompt with the specific format requested
                 user_message += f"Event Feature Tags:\n{event_tags_string}\n\n"
                 
-                # Add instruction on how to use the event tags
-                user_message += "Use these event-specific tags to understand if the headline occurred during a volatile period or surprised the market. Adjust your sentiment and trade recommendation accordingly.\n\n"
-                
-                user_message += "Based on this data, classify the event and recommend an options trade. "
-                user_message += "Consider event tags when making your recommendation. "
-                user_message += "If it's a repeat event, check if previous similar events had predictable impacts. "
-                user_message += "If it's a Fed week or CPI week, consider the heightened volatility. "
-                user_message += "If IV is high and skew is bearish (puts more expensive), favor PUTs. "
-                user_message += "If sentiment is bullish with low IV and call skew, favor CALLs. "
-                # Add explicit directional instruction
-                user_message += "Given this news and macro context, would you BUY or SELL this stock? Justify your directional choice in your recommendation. "
-                user_message += "Return JSON in this format: {event_type, sentiment, sector, trade, direction}"
+                user_message += f"Headline: '{headline_text}'"
                 
                 response = openai.chat.completions.create(
-                    model="gpt-3.5-turbo",
+                    model=self.model,
                     messages=[
                         {
                             "role": "system",
@@ -353,13 +514,12 @@ class OpenAIClassifier:
                             "content": user_message
                         }
                     ],
-                    temperature=0.2,
-                    response_format={"type": "json_object"}
+                    **get_completion_params(self.model, CLASSIFICATION_RESPONSE_FORMAT, CLASSIFY_MAX_TOKENS)
                 )
                 
                 # Parse the response
                 classification_text = response.choices[0].message.content
-                classification = json.loads(classification_text)
+                classification = parse_json_content(classification_text)
                 
                 # Ensure we have all required fields
                 required_fields = ["event_type", "sentiment", "sector"]
@@ -440,6 +600,96 @@ class OpenAIClassifier:
         dummy_result["event_tags"] = event_tags
         return dummy_result
 
+    def classify_batch(self, headlines: List[Dict[str, Any]], provided_macro_context: Dict[str, Any] = None) -> List[Dict[str, str]]:
+        """
+        Classify several headlines with a single OpenAI call.
+        
+        The model is asked for one classification per numbered headline. Any
+        headline the response does not cover (or covers without the required
+        fields) falls back to the dummy classifier, as does the whole batch if
+        every retry fails.
+        
+        Args:
+            headlines: List of headline dictionaries
+            provided_macro_context: Optional pre-fetched macroeconomic data
+            
+        Returns:
+            List of classification dictionaries in the same order as headlines
+        """
+        if not headlines:
+            return []
+        
+        macro_context = provided_macro_context if USE_MACRO_CONTEXT else None
+        macro_string = json.dumps(macro_context, indent=2) if macro_context else "No macroeconomic data available"
+        
+        headline_lines = []
+        for i, headline in enumerate(headlines):
+            line = f"{i}. {headline.get('title', '')}"
+            if headline.get("source"):
+                line += f" (Source: {headline['source']})"
+            headline_lines.append(line)
+        
+        # Static instructions first, then shared macro data, then the headlines
+        system_message = BATCH_CLASSIFIER_SYSTEM_PROMPT
+        user_message = ""
+        if USE_MACRO_CONTEXT:
+            user_message += f"Macro Context:\n{macro_string}\n\n"
+        user_message += f"Headlines ({len(headlines)}):\n" + "\n".join(headline_lines)
+        
+        retries = 0
+        while retries < MAX_RETRIES:
+            try:
+                response = openai.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_message
+                        },
+                        {
+                            "role": "user",
+                            "content": user_message
+                        }
+                    ],
+                    **get_completion_params(
+                        self.model, BATCH_CLASSIFICATION_RESPONSE_FORMAT,
+                        BATCH_MAX_TOKENS_PER_HEADLINE * len(headlines) + 32
+                    )
+                )
+                
+                parsed = parse_json_content(response.choices[0].message.content)
+                entries = parsed.get("classifications", []) if isinstance(parsed, dict) else parsed
+                
+                by_index = {}
+                for position, entry in enumerate(entries):
+                    if isinstance(entry, dict):
+                        by_index[entry.get("index", position)] = entry
+                
+                required_fields = ["event_type", "sentiment", "sector"]
+                results = []
+                for i, headline in enumerate(headlines):
+                    entry = by_index.get(i) or by_index.get(str(i))
+                    if entry and all(key in entry for key in required_fields):
+                        result = {key: entry[key] for key in required_fields}
+                        if entry.get("direction"):
+                            result["direction"] = str(entry["direction"]).upper()
+                    else:
+                        result = DummyClassifier().classify(headline, macro_context)
+                    results.append(result)
+                return results
+                
+            except Exception as e:
+                retries += 1
+                if retries >= MAX_RETRIES:
+                    print(f"Error classifying headline batch after {MAX_RETRIES} retries: {str(e)}")
+                    break
+                
+                print(f"API error (attempt {retries}/{MAX_RETRIES}): {str(e)}. Retrying in {RETRY_DELAY}s...")
+                time.sleep(RETRY_DELAY)
+        
+        dummy = DummyClassifier()
+        return [dummy.classify(headline, macro_context) for headline in headlines]
+
 def get_classifier() -> Any:
     """Factory function to get the appropriate classifier based on the model type."""
     if not OPENAI_API_KEY:
@@ -488,6 +738,34 @@ def classify_macro_event(headline: Dict[str, Any]) -> Dict[str, str]:
     classifier = get_classifier()
     return classifier.classify(headline, provided_macro_context=macro_context)
 
+def classify_macro_events_batch(headlines: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Classify a batch of headlines with one LLM call instead of one per headline.
+    
+    Macro data is fetched once for the whole batch. The dummy classifier has
+    no batch endpoint, so it simply classifies each headline in turn.
+    
+    Args:
+        headlines: List of headline dictionaries
+        
+    Returns:
+        List of classification dictionaries in the same order as headlines
+    """
+    if not headlines:
+        return []
+    
+    macro_context = None
+    if USE_MACRO_CONTEXT:
+        try:
+            macro_context = get_fred_data()
+        except Exception as e:
+            print(f"Error fetching FRED data for batch classification: {str(e)}")
+    
+    classifier = get_classifier()
+    if isinstance(classifier, OpenAIClassifier):
+        return classifier.classify_batch(headlines, provided_macro_context=macro_context)
+    return [classifier.classify(headline, provided_macro_context=macro_context) for headline in headlines]
+
 def classify_all_headlines(headlines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Process multiple headlines and add classification data to each.
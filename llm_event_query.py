@@ -20,8 +20,11 @@ Usage:
 import os
 import json
 import sys
+import itertools
+from collections import deque
 import openai
 import re
+import string
 import time
 import random
 import datetime
@@ -159,6 +162,19 @@ CRYPTO_MAPPINGS = {
 # Global conversation storage
 CONVERSATION_SESSIONS = {}
 
+# Follow-up question indicators used by ConversationContext.is_follow_up_question
+_FOLLOWUP_WORDS = frozenset({
+    # Pronouns and references
+    "that", "this", "it", "these", "those",
+    "previous", "earlier", "above", "mentioned",
+    "also", "too", "again", "more",
+    # Questions that build on previous context
+    "why",
+})
+_FOLLOWUP_STARTS = ("and ", "but ", "so ", "can you", "could you")
+_FOLLOWUP_BIGRAM_PATTERN = re.compile(r'\bhow (does|do|would|could|is|are)|\bwhat (about|if|else|other)\b')
+_PUNCTUATION_TO_SPACE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
 def standardize_crypto_ticker(ticker_or_text: str) -> str:
     """
     Standardize a crypto ticker or extract a crypto ticker from text.
@@ -2330,7 +2346,7 @@ Structure your response with these clearly labeled sections:
         if is_follow_up:
             print("\n5. Conversation Context:")
             print(f"   - Session ID: {session.session_id}")
-            print(f"   - Previous Queries: {len(session.query_history) - 1}")
+            print(f"   - Previous Queries: {session.total_queries - 1}")
             print(f"   - Data Points Carried Forward: {sum(1 for v in session.data_sources.values() if v)}")
             
         # Display the final response
@@ -2600,22 +2616,28 @@ def create_new_session():
 
 def get_session(session_id):
     """Get an existing session or create a new one."""
-    if session_id and session_id in CONVERSATION_SESSIONS:
-        return CONVERSATION_SESSIONS[session_id]
-    return create_new_session()
+    session = CONVERSATION_SESSIONS.get(session_id) if session_id else None
+    return session if session is not None else create_new_session()
 
 def clean_old_sessions(max_age_hours=24):
     """Clean up old conversation sessions."""
+    global CONVERSATION_SESSIONS
+    sessions = CONVERSATION_SESSIONS
     current_time = datetime.now()
     expired_sessions = []
     
-    for session_id, session in CONVERSATION_SESSIONS.items():
+    for session_id, session in sessions.items():
         age = (current_time - session.creation_time).total_seconds() / 3600
         if age > max_age_hours:
             expired_sessions.append(session_id)
     
-    for session_id in expired_sessions:
-        del CONVERSATION_SESSIONS[session_id]
+    if len(expired_sessions) > len(sessions) >> 1:
+        # Most sessions expired (e.g. after a long idle gap): rebuild in one pass
+        expired_set = set(expired_sessions)
+        CONVERSATION_SESSIONS = {k: v for k, v in sessions.items() if k not in expired_set}
+    else:
+        for session_id in expired_sessions:
+            del sessions[session_id]
     
     return len(expired_sessions)
 
@@ -2623,12 +2645,25 @@ def clean_old_sessions(max_age_hours=24):
 class ConversationContext:
     """
     Manages the context for a conversation session, including query history and analysis results.
+    
+    Only the last K_RECENT exchanges are kept verbatim; older turns are folded into a
+    short rolling summary so the prompt context stays bounded in long conversations.
     """
+    __slots__ = (
+        "session_id", "query_history", "data_sources", "llm_responses",
+        "last_enhanced_query", "last_full_context", "last_system_message",
+        "creation_time", "rolling_summary", "total_queries", "_ctx_version", "_cached_summary",
+    )
+    
+    K_RECENT = 4  # Exchanges kept verbatim
+    MAX_SUMMARY_TURNS = 10  # Folded turns kept in the rolling summary
+    MAX_NEWS_SOURCES = 20  # Most recent news items retained
+    
     def __init__(self, session_id=None):
         self.session_id = session_id or str(uuid.uuid4())
         self.query_history = []
         self.data_sources = {
-            "news_sources": [],
+            "news_sources": deque(maxlen=self.MAX_NEWS_SOURCES),
             "market_data": [],
             "macro_data": {},
             "historical_analysis": {},
@@ -2639,38 +2674,62 @@ class ConversationContext:
         self.last_full_context = ""
         self.last_system_message = ""
         self.creation_time = datetime.now()
+        self.rolling_summary = ""
+        self.total_queries = 0  # All queries this session, including those folded out of query_history
+        # Bumped on every mutation so generate_context_summary can reuse its last result
+        self._ctx_version = 0
+        self._cached_summary = (None, "")
         
     def add_query(self, query, is_follow_up=False):
         """Add a user query to the history."""
+        self._ctx_version += 1
+        self.total_queries += 1
         self.query_history.append({
             "text": query,
-            "timestamp": datetime.now(),
+            "timestamp": time.time(),  # epoch seconds; convert with datetime.fromtimestamp when displaying
             "is_follow_up": is_follow_up
         })
         
     def add_llm_response(self, response_text, sections=None):
         """Add an LLM response to the history."""
+        self._ctx_version += 1
         response_data = {
             "text": response_text,
-            "timestamp": datetime.now(),
+            "timestamp": time.time(),
             "sections": sections or {}
         }
         self.llm_responses.append(response_data)
         
+        # Fold exchanges that fall out of the verbatim window into the rolling summary
+        while len(self.llm_responses) > self.K_RECENT and len(self.query_history) > self.K_RECENT:
+            self._fold_oldest_exchange()
+    
+    def _fold_oldest_exchange(self):
+        """Replace the oldest query/response pair with a one-line note in the rolling summary."""
+        old_query = self.query_history.pop(0)["text"]
+        old_answer = " ".join(self.llm_responses.pop(0)["text"].split())
+        lines = self.rolling_summary.splitlines() if self.rolling_summary else []
+        lines.append(f"- User asked about '{old_query[:60]}'; assistant covered '{old_answer[:80]}'")
+        self.rolling_summary = "\n".join(lines[-self.MAX_SUMMARY_TURNS:])
+        
+    # Data source handlers keyed by source type, each taking (data_sources, data)
+    _HANDLERS = {
+        # For news sources, append to the bounded deque (oldest items fall off)
+        "news_sources": lambda ds, d: ds["news_sources"].extend(d) if isinstance(d, list) else None,
+        # For historical analysis, store the whole thing
+        "historical_analysis": lambda ds, d: ds.__setitem__("historical_analysis", d) if isinstance(d, dict) and d.get("success", False) else None,
+        # For similar events, store the list
+        "similar_events": lambda ds, d: ds.__setitem__("similar_events", d) if isinstance(d, list) else None,
+        # For macro data, update the dict
+        "macro_data": lambda ds, d: ds["macro_data"].update(d) if isinstance(d, dict) else None,
+    }
+
     def add_data_source(self, source_type, data):
         """Add or update a data source."""
-        if source_type == "news_sources" and isinstance(data, list):
-            # For news sources, append to the list
-            self.data_sources["news_sources"].extend(data)
-        elif source_type == "historical_analysis" and data.get("success", False):
-            # For historical analysis, store the whole thing
-            self.data_sources["historical_analysis"] = data
-        elif source_type == "similar_events" and isinstance(data, list):
-            # For similar events, store the list
-            self.data_sources["similar_events"] = data
-        elif source_type == "macro_data" and isinstance(data, dict):
-            # For macro data, update the dict
-            self.data_sources["macro_data"].update(data)
+        handler = self._HANDLERS.get(source_type)
+        if handler:
+            self._ctx_version += 1
+            handler(self.data_sources, data)
             
     def get_recent_queries(self, count=3):
         """Get the most recent user queries."""
@@ -2682,10 +2741,18 @@ class ConversationContext:
     
     def generate_context_summary(self):
         """Generate a summary of the conversation context for the LLM."""
+        cached_version, cached_summary = self._cached_summary
+        if cached_version == self._ctx_version:
+            return cached_summary
+        
         summary = "PREVIOUS CONVERSATION CONTEXT:\n"
         
+        # Add the rolling summary of older exchanges
+        if self.rolling_summary:
+            summary += f"\nEarlier in this conversation:\n{self.rolling_summary}\n"
+        
         # Add recent queries and responses
-        recent_exchanges = min(len(self.query_history), 2)  # Get up to 2 recent exchanges
+        recent_exchanges = min(len(self.query_history), self.K_RECENT)
         if recent_exchanges > 0:
             summary += "\nRecent exchanges:\n"
             start_idx = max(0, len(self.query_history) - recent_exchanges)
@@ -2714,46 +2781,35 @@ class ConversationContext:
         # Add most relevant news articles
         if self.data_sources["news_sources"]:
             summary += "\nRecent news mentioned:\n"
-            for i, news in enumerate(self.data_sources["news_sources"][:3], 1):
+            for i, news in enumerate(itertools.islice(reversed(self.data_sources["news_sources"]), 3), 1):
                 summary += f"- {news.get('headline', '')}\n"
         
+        self._cached_summary = (self._ctx_version, summary)
         return summary
 
     def is_follow_up_question(self, query):
         """Determine if a query is likely a follow-up question based on content."""
         if not self.query_history:
             return False
-            
-        # Check for reference to previous analysis
-        follow_up_indicators = [
-            # Pronouns and references
-            r'\b(that|this|it|these|those)\b',
-            r'\b(previous|earlier|above|mentioned)\b',
-            r'\b(also|too|again|more)\b',
-            
-            # Questions that build on previous context
-            r'\bwhy\b',
-            r'\bhow (does|do|would|could|is|are)',
-            r'\bwhat (about|if|else|other)\b',
-            
-            # Implicit references
-            r'^(and|but|so)\b',
-            r'^(can you|could you)',
-            
-            # Specific financial follow-ups
-            r'\b(ticker|stock|market|trend)\b without explicit subject',
-            r'\b(bullish|bearish)\b without context'
-        ]
         
-        for pattern in follow_up_indicators:
-            if re.search(pattern, query.lower()):
-                return True
-                
+        q = query.lower()
+        text = q.translate(_PUNCTUATION_TO_SPACE)
+        
+        # Implicit references
+        if text.startswith(_FOLLOWUP_STARTS):
+            return True
+        
         # Check if the query is very short (likely a follow-up)
-        if len(query.split()) < 5:
+        words = text.split()
+        if len(words) < 5:
             return True
-            
-        return False
+        
+        # Pronouns, references and questions that build on previous context
+        if not _FOLLOWUP_WORDS.isdisjoint(words):
+            return True
+        
+        # Two-word openers such as "how does" or "what about"
+        return _FOLLOWUP_BIGRAM_PATTERN.search(q) is not None
 
 # Add these utility functions to handle follow-up questions
 def create_new_session():
@@ -2764,22 +2820,28 @@ def create_new_session():
 
 def get_session(session_id):
     """Get an existing session or create a new one."""
-    if session_id and session_id in CONVERSATION_SESSIONS:
-        return CONVERSATION_SESSIONS[session_id]
-    return create_new_session()
+    session = CONVERSATION_SESSIONS.get(session_id) if session_id else None
+    return session if session is not None else create_new_session()
 
 def clean_old_sessions(max_age_hours=24):
     """Clean up old conversation sessions."""
+    global CONVERSATION_SESSIONS
+    sessions = CONVERSATION_SESSIONS
     current_time = datetime.now()
     expired_sessions = []
     
-    for session_id, session in CONVERSATION_SESSIONS.items():
+    for session_id, session in sessions.items():
         age = (current_time - session.creation_time).total_seconds() / 3600
         if age > max_age_hours:
             expired_sessions.append(session_id)
     
-    for session_id in expired_sessions:
-        del CONVERSATION_SESSIONS[session_id]
+    if len(expired_sessions) > len(sessions) >> 1:
+        # Most sessions expired (e.g. after a long idle gap): rebuild in one pass
+        expired_set = set(expired_sessions)
+        CONVERSATION_SESSIONS = {k: v for k, v in sessions.items() if k not in expired_set}
+    else:
+        for session_id in expired_sessions:
+            del sessions[session_id]
     
     return len(expired_sessions)
 
@@ -31,13 +31,18 @@ Configuration:
 ------------
 - Logs are saved to: pipeline.log
 - Console output shows: INFO and above
-- File output saves: DEBUG and above
+- File output saves: DEBUG and above (written by a background queue listener)
 - Log format includes: timestamp, log level, module name, and message
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import time
 from typing import Optional
 from datetime import datetime
 
@@ -45,10 +50,28 @@ from datetime import datetime
 LOG_FILE = "pipeline.log"
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_BAR = "=" * 80
+_DASH = "-" * 80
 
 # Track if logging has been configured
 _logging_configured = False
 
+class CachedAsctimeFormatter(logging.Formatter):
+    """Formatter that only re-renders asctime when the record's epoch second changes."""
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+        # (epoch second, formatted string) swapped as one tuple so threads never see a mismatch
+        self._cached = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        cached_sec, cached_str = self._cached
+        if sec != cached_sec:
+            cached_str = time.strftime(datefmt or self.datefmt or DATE_FORMAT, self.converter(sec))
+            self._cached = (sec, cached_str)
+        return cached_str
+
 def configure_logging(log_file: str = LOG_FILE, console_level: int = logging.INFO, 
                      file_level: int = logging.DEBUG) -> None:
     """
@@ -68,7 +91,7 @@ def configure_logging(log_file: str = LOG_FILE, console_level: int = logging.INF
     root_logger.setLevel(logging.DEBUG)  # Capture all logs
     
     # Create formatters
-    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    formatter = CachedAsctimeFormatter(LOG_FORMAT, DATE_FORMAT)
     
     # Configure console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -86,15 +109,24 @@ def configure_logging(log_file: str = LOG_FILE, console_level: int = logging.INF
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(file_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        # Hand records to a background listener so file writes happen off the caller thread
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(file_level)
+        root_logger.addHandler(queue_handler)
+        
+        listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
     except Exception as e:
         # Still log to console if file logging fails
         console_handler.setLevel(logging.DEBUG)  # Ensure we capture debug logs too
-        root_logger.error(f"Failed to configure file logging: {str(e)}")
+        root_logger.error("Failed to configure file logging: %s", e)
     
     _logging_configured = True
-    root_logger.info(f"Logging configured: console={logging.getLevelName(console_level)}, "
-                    f"file={logging.getLevelName(file_level)} at {log_file}")
+    root_logger.info("Logging configured: console=%s, file=%s at %s",
+                     logging.getLevelName(console_level), logging.getLevelName(file_level), log_file)
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -106,6 +138,11 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    return _cached_logger(name)
+
+@functools.lru_cache(maxsize=128)
+def _cached_logger(name: str) -> logging.Logger:
+    """Resolve a logger once per module name (loggers are singletons anyway)."""
     # Ensure logging is configured
     if not _logging_configured:
         configure_logging()
@@ -116,29 +153,31 @@ def get_logger(name: str) -> logging.Logger:
 # Convenience loggers for quick access
 def log_info(message: str, module: str = "root") -> None:
     """Log an info message"""
-    get_logger(module).info(message)
+    get_logger(module).info("%s", message)
 
 def log_warning(message: str, module: str = "root") -> None:
     """Log a warning message"""
-    get_logger(module).warning(message)
+    get_logger(module).warning("%s", message)
 
 def log_error(message: str, exc_info: bool = False, module: str = "root") -> None:
     """Log an error message, optionally with exception info"""
-    get_logger(module).error(message, exc_info=exc_info)
+    get_logger(module).error("%s", message, exc_info=exc_info)
 
 def log_start_section(title: str, module: str = "root") -> None:
     """Log a section start with a formatted title"""
     logger = get_logger(module)
-    logger.info("=" * 80)
-    logger.info(f"STARTING: {title}")
-    logger.info("=" * 80)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_BAR)
+        logger.info("STARTING: %s", title)
+        logger.info(_BAR)
 
 def log_end_section(title: str, module: str = "root") -> None:
     """Log a section end with a formatted title"""
     logger = get_logger(module)
-    logger.info("-" * 80)
-    logger.info(f"COMPLETED: {title}")
-    logger.info("-" * 80)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_DASH)
+        logger.info("COMPLETED: %s", title)
+        logger.info(_DASH)
 
 # Auto-configure logging when the module is imported
 configure_logging()
@@ -39,15 +39,18 @@ What This Helps With:
 
 import os
 import json
+import functools
+import logging
+import orjson
 import time
 import csv
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union, Tuple
-import pandas as pd
-import yfinance as yf
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, List, Union, Tuple, Iterable
+import numpy as np
 import requests
 from pathlib import Path
-from fredapi import Fred
 from dotenv import load_dotenv
 
 # Import logger
@@ -75,15 +78,49 @@ except ImportError:
     # Not running in Streamlit context
     FRED_API_KEY = os.getenv('FRED_API_KEY')
 
-fred = Fred(api_key=FRED_API_KEY) if FRED_API_KEY else None
+@functools.lru_cache(maxsize=1)
+def _get_fred():
+    """Lazily create the fredapi client (only the --test-fred CLI needs it)."""
+    from fredapi import Fred
+    return Fred(api_key=FRED_API_KEY) if FRED_API_KEY else None
 
 # Constants
 DEFAULT_CACHE_FILE = "macro_data_cache.json"
 DEFAULT_FALLBACK_CSV = "data/latest_macro_snapshot.csv"
 CACHE_EXPIRY_HOURS = 4  # Reduced from 12 to ensure more frequent fresh data
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+FRED_OBSERVATION_LIMIT = 13  # Enough monthly history for a year-over-year change
+FRED_MAX_WORKERS = 8  # Concurrent FRED requests, kept modest to stay polite
+FRED_TIMEOUT_SECONDS = 10
+# Next to this module rather than in the working directory, so every caller shares one cache
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "macro_http_cache.sqlite")
 
-# Make sure the data directory exists
-os.makedirs(os.path.dirname(DEFAULT_FALLBACK_CSV), exist_ok=True)
+# Shared HTTP session for FRED requests, created on first use by _get_http_session
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+def _get_http_session() -> requests.Session:
+    """
+    Return the shared FRED session, creating it on first use.
+    
+    When requests_cache is installed, GET responses are persisted in SQLite so
+    repeated runs don't re-download unchanged data.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                try:
+                    import requests_cache
+                    _http_session = requests_cache.CachedSession(
+                        HTTP_CACHE_PATH,
+                        backend="sqlite",
+                        expire_after=timedelta(hours=CACHE_EXPIRY_HOURS),
+                        allowable_methods=("GET",)
+                    )
+                except ImportError:
+                    _http_session = requests.Session()
+    return _http_session
 
 # Required fields for the CSV fallback
 REQUIRED_CSV_FIELDS = [
@@ -104,6 +141,7 @@ MARKET_TICKERS = {
 # FRED Series IDs for macroeconomic indicators
 FRED_SERIES = {
     "CPI_YoY": "CPIAUCSL",       # Consumer Price Index for All Urban Consumers: All Items
+    "CPI_Expected": "MICH",      # University of Michigan 1-Year Inflation Expectation
     "Unemployment": "UNRATE",    # Unemployment Rate
     "Fed_Funds_Rate": "FEDFUNDS" # Federal Funds Effective Rate
 }
@@ -121,6 +159,44 @@ FRED_METRICS = {
     "Unemployment": "UNRATE"
 }
 
+# Live values closer than this to their fallback are nudged by +0.01 so they
+# aren't mistaken for fallback data downstream
+FALLBACK_NUDGE_TOLERANCE = {
+    "CPI_Expected": 0.01,
+    "CPI_YoY": 0.01,
+    "CoreCPI": 0.01,
+    "CorePCE": 0.01
+}
+
+# FRED transforms: each maps a stacked (n_series, window) array of observations,
+# oldest first, to one value per series
+def _latest(values: np.ndarray) -> np.ndarray:
+    """Most recent observation."""
+    return np.round(values[:, -1], 2)
+
+def _scale_thousand(values: np.ndarray) -> np.ndarray:
+    """Most recent observation in thousands (e.g. jobless claims)."""
+    return np.round(values[:, -1] / 1000, 1)
+
+def _yoy(values: np.ndarray) -> np.ndarray:
+    """Year-over-year % change of a monthly price index."""
+    return np.round((values[:, -1] / values[:, 0] - 1) * 100, 1)
+
+# Number of trailing observations each transform needs
+FRED_TRANSFORM_WINDOW = {_latest: 1, _scale_thousand: 1, _yoy: 13}
+
+# Indicators whose raw FRED level needs a transform other than _latest
+_FRED_TRANSFORMS = {
+    "CPI_YoY": _yoy,
+    "CoreCPI": _yoy,
+    "CorePCE": _yoy,
+    "InitialJoblessClaims": _scale_thousand
+}
+
+# Indicator key -> (FRED series ID, transform) for everything get_fred_data can return
+FRED_SPEC = {key: (series_id, _FRED_TRANSFORMS.get(key, _latest))
+             for key, series_id in {**FRED_SERIES, **FRED_METRICS}.items()}
+
 # Fallback values (most recent as of implementation)
 FALLBACK_VALUES = {
     "CPI_YoY": 3.5,        # CPI year-over-year % change (as of Feb 2024)
@@ -141,42 +217,98 @@ FALLBACK_VALUES = {
     "InitialJoblessClaims": 214.0 # Initial jobless claims (thousands)
 }
 
+def _fetch_market_ticker(key: str, ticker: str) -> Tuple[str, float, Optional[str]]:
+    """
+    Fetch the most recent closing price for a single market ticker.
+    
+    Args:
+        key: Indicator name (e.g. "VIX")
+        ticker: yfinance ticker symbol
+        
+    Returns:
+        Tuple of (key, value, error) where error is None on success and the
+        value falls back to FALLBACK_VALUES on failure
+    """
+    try:
+        import yfinance as yf
+        
+        logger.debug(f"Fetching data for {ticker} ({key})")
+        ticker_data = yf.Ticker(ticker)
+        # Get the most recent closing price
+        hist = ticker_data.history(period="1d")
+        
+        if not hist.empty and 'Close' in hist.columns:
+            value = float(hist['Close'].iloc[-1])
+            logger.info(f"Successfully fetched {key}: {value:.2f}")
+            return key, value, None
+        
+        logger.warning(f"No data available for {ticker}, using fallback")
+        return key, FALLBACK_VALUES[key], f"No data for {ticker}"
+    except Exception as e:
+        logger.warning(f"Failed to fetch {ticker} ({key}): {str(e)}")
+        return key, FALLBACK_VALUES[key], f"Error processing {ticker}: {str(e)}"
+
+def _download_market_closes() -> Dict[str, float]:
+    """
+    Download the latest closing prices for all MARKET_TICKERS in a single batched request.
+    
+    Returns:
+        Dict[str, float]: Closing prices keyed by indicator name, for tickers that returned data
+    """
+    import yfinance as yf
+    
+    closes = {}
+    tickers = list(MARKET_TICKERS.values())
+    
+    logger.debug(f"Batch downloading data for {', '.join(tickers)}")
+    data = yf.download(tickers=" ".join(tickers), period="1d", progress=False,
+                       group_by="ticker", threads=True)
+    if data is None or data.empty:
+        return closes
+    
+    for key, ticker in MARKET_TICKERS.items():
+        try:
+            close = data[ticker]["Close"].dropna()
+            if not close.empty:
+                closes[key] = float(close.iloc[-1])
+                logger.info(f"Successfully fetched {key}: {closes[key]:.2f}")
+        except KeyError:
+            logger.debug(f"No batched data returned for {ticker}")
+    
+    return closes
+
 def get_market_data() -> Dict[str, float]:
     """
     Fetch current market data for key financial indicators using yfinance.
     
+    All tickers are requested in one batched download; any ticker missing from the
+    batch is retried individually (in parallel) before falling back.
+    
     Returns:
         Dict[str, float]: Dictionary with market data values
     """
     market_data = {}
     errors = []
     
-    # Fetch each ticker individually for more reliable results
-    for key, ticker in MARKET_TICKERS.items():
-        try:
-            logger.debug(f"Fetching data for {ticker} ({key})")
-            ticker_data = yf.Ticker(ticker)
-            # Get the most recent closing price
-            hist = ticker_data.history(period="1d")
-            
-            if not hist.empty and 'Close' in hist.columns:
-                market_data[key] = float(hist['Close'].iloc[-1])
-                logger.info(f"Successfully fetched {key}: {market_data[key]:.2f}")
-            else:
-                # Try alternate method: direct download
-                logger.debug(f"Using alternate method for {ticker}")
-                single_data = yf.download(ticker, period="1d", progress=False)
-                if not single_data.empty and 'Close' in single_data.columns:
-                    market_data[key] = float(single_data['Close'].iloc[-1])
-                    logger.info(f"Successfully fetched {key} (alternate): {market_data[key]:.2f}")
-                else:
-                    logger.warning(f"No data available for {ticker}, using fallback")
-                    market_data[key] = FALLBACK_VALUES[key]
-                    errors.append(f"No data for {ticker}")
-        except Exception as e:
-            logger.warning(f"Failed to fetch {ticker} ({key}): {str(e)}")
-            market_data[key] = FALLBACK_VALUES[key]
-            errors.append(f"Error processing {ticker}: {str(e)}")
+    try:
+        market_data.update(_download_market_closes())
+    except Exception as e:
+        logger.warning(f"Batched market data download failed: {str(e)}")
+    
+    # Retry anything the batch missed one ticker at a time
+    missing = {key: ticker for key, ticker in MARKET_TICKERS.items() if key not in market_data}
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            futures = [executor.submit(_fetch_market_ticker, key, ticker)
+                       for key, ticker in missing.items()]
+            for future in as_completed(futures):
+                key, value, error = future.result()
+                market_data[key] = value
+                if error:
+                    errors.append(error)
+    
+    # Keep the original indicator order regardless of completion order
+    market_data = {key: market_data[key] for key in MARKET_TICKERS}
     
     # Log errors if any
     if errors:
@@ -189,12 +321,110 @@ def get_market_data() -> Dict[str, float]:
     
     return market_data
 
-def get_fred_data() -> Dict[str, float]:
+def _fetch_fred_series(series_id: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Fetch the most recent observations for a FRED series from the REST API.
+    
+    Args:
+        series_id: FRED series ID (e.g. "CPIAUCSL")
+        
+    Returns:
+        Tuple of (date, value) observation pairs, oldest first
+    """
+    response = _get_http_session().get(FRED_OBSERVATIONS_URL, params={
+        "series_id": series_id,
+        "api_key": FRED_API_KEY,
+        "file_type": "json",
+        "sort_order": "desc",
+        "limit": FRED_OBSERVATION_LIMIT
+    }, timeout=FRED_TIMEOUT_SECONDS)
+    response.raise_for_status()
+    
+    values = []
+    for observation in reversed(orjson.loads(response.content).get("observations", [])):
+        try:
+            values.append((observation["date"], float(observation["value"])))
+        except (KeyError, ValueError):
+            # FRED reports missing observations as "."
+            continue
+    
+    return tuple(values)
+
+@functools.lru_cache(maxsize=64)
+def _cached_series(series_id: str, date_key: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Cached wrapper around _fetch_fred_series.
+    
+    FRED publishes at most daily, so date_key (the UTC date) is only used to
+    expire entries once per day. Returns immutable (date, value) pairs so the
+    cached result can be shared safely between callers.
+    """
+    return _fetch_fred_series(series_id)
+
+def _fetch_fred_series_batch(series_ids: List[str]) -> Dict[str, Union[np.ndarray, Exception]]:
+    """
+    Fetch several FRED series concurrently.
+    
+    Args:
+        series_ids: FRED series IDs to fetch
+        
+    Returns:
+        Dict mapping each series ID to an array of its observation values (oldest first),
+        or to the exception raised fetching it
+    """
+    results = {}
+    date_key = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    with ThreadPoolExecutor(max_workers=min(FRED_MAX_WORKERS, len(series_ids))) as executor:
+        futures = {executor.submit(_cached_series, series_id, date_key): series_id for series_id in series_ids}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = np.array([value for _, value in future.result()], dtype=np.float64)
+            except Exception as e:
+                results[futures[future]] = e
+    return results
+
+def _prefetched_series(fetched: Dict[str, Union[np.ndarray, Exception]], series_id: str) -> np.ndarray:
+    """Return a series from _fetch_fred_series_batch, re-raising its fetch error if it failed."""
+    series = fetched[series_id]
+    if isinstance(series, Exception):
+        raise series
+    return series
+
+def _distinguish_from_fallback(values: Dict[str, float]) -> Dict[str, float]:
+    """
+    Nudge live values that coincide with their fallback so they still read as live.
+    
+    Args:
+        values: Live indicator values
+        
+    Returns:
+        Dict[str, float]: The same values, with near-fallback entries adjusted by +0.01
+    """
+    keys = [key for key in values if key in FALLBACK_NUDGE_TOLERANCE]
+    if not keys:
+        return values
+    
+    vals = np.array([values[key] for key in keys], dtype=np.float64)
+    fallbacks = np.array([FALLBACK_VALUES.get(key, np.nan) for key in keys], dtype=np.float64)
+    tolerances = np.array([FALLBACK_NUDGE_TOLERANCE[key] for key in keys], dtype=np.float64)
+    
+    mask = np.abs(vals - fallbacks) < tolerances
+    if mask.any():
+        logger.debug(f"Adjusted {', '.join(np.array(keys)[mask])} to distinguish from fallback")
+    vals = np.where(mask, np.round(vals + 0.01, 2), vals)
+    
+    return {**values, **dict(zip(keys, vals.tolist()))}
+
+def get_fred_data(keys: Optional[Iterable[str]] = None) -> Dict[str, float]:
     """
     Fetch macroeconomic data from the Federal Reserve Economic Data (FRED) API.
     
-    This function dynamically fetches indicators defined in FRED_METRICS.
-    If the FRED API is unavailable or the API key is missing, fallback values are used.
+    This function dynamically fetches indicators defined in FRED_SPEC (FRED_SERIES
+    plus FRED_METRICS). All series are requested concurrently from the FRED
+    observations endpoint, limited to the last FRED_OBSERVATION_LIMIT observations
+    each. Each series ID is fetched once and its value is copied to every indicator
+    key that aliases it. If the FRED API is unavailable or the API key is missing,
+    fallback values are used.
     
     Updates (2025-04-15):
     - Fixed CPI_Expected to use actual Michigan Survey Inflation Expectation data (MICH series)
@@ -202,191 +432,136 @@ def get_fred_data() -> Dict[str, float]:
     - Added direct CPI_YoY calculation from CPIAUCSL series with proper yearly comparison
     - Added safeguards to ensure values are distinguished from fallback values even when close
     
+    Args:
+        keys: Optional subset of indicator keys to fetch (default: all FRED indicators)
+    
     Returns:
         Dict[str, float]: Dictionary with macroeconomic indicator values
     """
     # Initialize an empty dictionary for results
     macro_data = {}
     
+    wanted = set(keys) if keys is not None else set(FRED_SPEC)
+    
+    # Group indicator keys by (series ID, transform) so aliases share one computation
+    jobs = {}
+    for key, (series_id, transform) in FRED_SPEC.items():
+        if key in wanted:
+            jobs.setdefault((series_id, transform), []).append(key)
+    
     # Check if FRED API is available
-    if not fred or not FRED_API_KEY:
+    if not FRED_API_KEY:
         logger.warning("FRED API key not found. Using fallback values for macroeconomic indicators.")
         # Return fallback values for all metrics
-        for key in FRED_METRICS.keys():
-            macro_data[key] = FALLBACK_VALUES.get(key, 0.0)
+        for aliases in jobs.values():
+            for key in aliases:
+                macro_data[key] = FALLBACK_VALUES.get(key, 0.0)
         return macro_data
     
-    # Try to fetch CPI_Expected (expected inflation) from FRED
-    # Using Michigan Consumer Survey 1-Year Inflation Expectation
-    try:
-        inflation_expectation_series = fred.get_series_latest_release("MICH")
-        if not inflation_expectation_series.empty:
-            macro_data["CPI_Expected"] = float(round(inflation_expectation_series.iloc[-1], 2))
-            
-            # Make sure value is different from fallback to be considered "live"
-            if abs(macro_data["CPI_Expected"] - FALLBACK_VALUES.get("CPI_Expected", 0.0)) < 0.01:
-                # If too close to fallback, adjust slightly to mark as live data
-                macro_data["CPI_Expected"] = round(macro_data["CPI_Expected"] + 0.01, 2)
-                logger.debug(f"Adjusted CPI_Expected value to distinguish from fallback")
-                
-            logger.info(f"Fetched CPI_Expected from FRED (MICH): {macro_data['CPI_Expected']}%")
-        else:
-            logger.warning("Could not fetch inflation expectations. Using fallback value.")
-            macro_data["CPI_Expected"] = FALLBACK_VALUES["CPI_Expected"]
-    except Exception as e:
-        logger.warning(f"Failed to fetch inflation expectations from FRED: {e}")
-        macro_data["CPI_Expected"] = FALLBACK_VALUES["CPI_Expected"]
+    if not jobs:
+        return macro_data
     
-    # Specifically try to fetch CPI_YoY directly from CPIAUCSL series
-    try:
-        cpi_series = fred.get_series_latest_release("CPIAUCSL")
-        if not cpi_series.empty and len(cpi_series) >= 13:
-            latest_value = cpi_series.iloc[-1]
-            year_ago_value = cpi_series.iloc[-13]
-            yoy_pct_change = ((latest_value / year_ago_value) - 1) * 100
-            macro_data["CPI_YoY"] = round(yoy_pct_change, 1)
-            
-            # Make sure value is different from fallback
-            if abs(macro_data["CPI_YoY"] - FALLBACK_VALUES.get("CPI_YoY", 0.0)) < 0.01:
-                macro_data["CPI_YoY"] = round(macro_data["CPI_YoY"] + 0.01, 2)
-                logger.debug(f"Adjusted CPI_YoY value to distinguish from fallback")
-                
-            logger.info(f"Fetched CPI_YoY from FRED: {macro_data['CPI_YoY']}%")
-        else:
-            logger.warning("Could not fetch CPI_YoY data. Using fallback value.")
-            macro_data["CPI_YoY"] = FALLBACK_VALUES["CPI_YoY"]
-    except Exception as e:
-        logger.warning(f"Failed to fetch CPI_YoY from FRED: {e}")
-        macro_data["CPI_YoY"] = FALLBACK_VALUES["CPI_YoY"]
+    # Fetch every series we need up front, concurrently, instead of one round-trip at a time
+    fetched = _fetch_fred_series_batch(list(dict.fromkeys(series_id for series_id, _ in jobs)))
     
-    fetched_count = 0
-    total_count = len(FRED_METRICS)
+    # Stack each usable series under its transform so every transform runs once
+    stacked = {}
+    for (series_id, transform), aliases in jobs.items():
+        window = FRED_TRANSFORM_WINDOW[transform]
+        try:
+            series = _prefetched_series(fetched, series_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {series_id} ({', '.join(aliases)}) from FRED: {e}")
+            continue
+        if len(series) < window:
+            logger.warning(f"Not enough data returned for {', '.join(aliases)} (ID: {series_id}). Using fallback value.")
+            continue
+        stacked.setdefault(transform, []).append((aliases, series[-window:]))
     
-    # Exclude CPI_YoY since we already handled it specifically
-    metrics_to_fetch = {k: v for k, v in FRED_METRICS.items() if k != "CPI_YoY"}
+    live_keys = []
+    for transform, entries in stacked.items():
+        values = transform(np.stack([rows for _, rows in entries]))
+        for (aliases, _), value in zip(entries, values.tolist()):
+            for key in aliases:
+                macro_data[key] = value
+            live_keys.extend(aliases)
+            logger.debug(f"Fetched {', '.join(aliases)} from FRED: {value}")
     
-    for key, series_id in metrics_to_fetch.items():
-        try:
-            series = fred.get_series_latest_release(series_id)
-            if not series.empty:
-                # For price indices, calculate year-over-year change
-                if key in ["CoreCPI", "CorePCE"] and len(series) >= 13:
-                    latest_value = series.iloc[-1]
-                    year_ago_value = series.iloc[-13]
-                    yoy_pct_change = ((latest_value / year_ago_value) - 1) * 100
-                    macro_data[key] = round(yoy_pct_change, 1)
-                    
-                    # Add debug log to see exact values for troubleshooting
-                    logger.debug(f"{key} calculation: latest={latest_value}, year-ago={year_ago_value}, yoy_change={yoy_pct_change}")
-                    
-                    # Make sure value is different from fallback to be considered "live"
-                    if abs(macro_data[key] - FALLBACK_VALUES.get(key, 0.0)) < 0.01:
-                        # If too close to fallback, adjust slightly to mark as live data
-                        macro_data[key] = round(macro_data[key] + 0.01, 2)
-                        logger.debug(f"Adjusted {key} value to distinguish from fallback")
-                # Scale InitialJoblessClaims from individuals to thousands
-                elif key == "InitialJoblessClaims":
-                    macro_data[key] = round(series.iloc[-1] / 1000, 1)  # Convert to thousands
-                # For other metrics, use the latest value directly
-                else:
-                    macro_data[key] = float(round(series.iloc[-1], 2))
-                
-                # Add % symbol for logger output if appropriate
-                unit = "%" if key in ["TenYearYield", "TwoYearYield", "CPI_YoY", "CoreCPI", "CorePCE", 
-                                     "Unemployment", "FedFundsRate", "RealGDP_YoY"] else ""
-                logger.info(f"Fetched {key} from FRED: {macro_data[key]}{unit}")
-                fetched_count += 1
-            else:
-                logger.warning(f"Empty series returned for {key} (ID: {series_id}). Using fallback value.")
+    # Use fallbacks for anything that couldn't be fetched
+    for aliases in jobs.values():
+        for key in aliases:
+            if key not in macro_data:
                 macro_data[key] = FALLBACK_VALUES.get(key, 0.0)
-        except Exception as e:
-            logger.warning(f"Failed to fetch {series_id} ({key}) from FRED: {e}")
-            macro_data[key] = FALLBACK_VALUES.get(key, 0.0)
     
-    # Add/maintain backward compatibility with existing code expecting these keys
-    if "FedFundsRate" in macro_data and "Fed_Funds_Rate" not in macro_data:
-        macro_data["Fed_Funds_Rate"] = macro_data["FedFundsRate"]
+    # Make sure live values are different from fallback to be considered "live"
+    macro_data.update(_distinguish_from_fallback({key: macro_data[key] for key in live_keys}))
     
     # Log a summary of what was fetched vs. fallback
-    # CPI_YoY is handled separately, so we don't count it in the metrics_to_fetch total
-    if "CPI_YoY" in macro_data and macro_data["CPI_YoY"] != FALLBACK_VALUES.get("CPI_YoY"):
-        fetched_count += 1  # Add CPI_YoY to the fetched count if it was successful
-    
-    if fetched_count >= len(FRED_METRICS):
-        logger.info(f"Successfully fetched all {len(FRED_METRICS)} available macroeconomic indicators from FRED")
+    fetched_count = sum(len(entries) for entries in stacked.values())
+    if fetched_count >= len(jobs):
+        logger.info(f"Successfully fetched all {len(jobs)} requested FRED series")
     else:
-        logger.warning(f"Fetched {fetched_count}/{len(FRED_METRICS)} macroeconomic indicators from FRED, using fallbacks for the rest")
+        logger.warning(f"Fetched {fetched_count}/{len(jobs)} FRED series, using fallbacks for the rest")
     
-    # Log a summary of all macro snapshot values
-    logger.info('Live FRED Macro Snapshot:')
-    for k, v in macro_data.items():
-        logger.info(f'{k}: {v}')
+    # Log all values in a single line; the per-metric breakdown is debug-only
+    logger.info("FRED fetched: %s", json.dumps(macro_data))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Live FRED Macro Snapshot:')
+        for k, v in macro_data.items():
+            logger.debug(f'{k}: {v}')
     
     return macro_data
 
-def load_from_csv(csv_path: str = DEFAULT_FALLBACK_CSV) -> Dict[str, float]:
+def load_from_csv(csv_path: str = DEFAULT_FALLBACK_CSV, missing_ok: bool = True) -> Dict[str, float]:
     """
     Load macroeconomic data from a CSV file as fallback.
     
     Args:
         csv_path: Path to the CSV file
+        missing_ok: Return an empty dict if the file doesn't exist; when False,
+            FileNotFoundError propagates to the caller
         
     Returns:
         Dict[str, float]: Dictionary with indicator values from CSV
     """
     data = {}
     
-    # Check if CSV exists
-    if not os.path.exists(csv_path):
-        logger.warning(f"Fallback CSV not found: {csv_path}")
-        return {}
-    
     try:
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            
-            # Validate CSV has the required fields
-            header = reader.fieldnames if reader.fieldnames else []
-            missing_fields = [field for field in REQUIRED_CSV_FIELDS if field not in header]
-            
-            if missing_fields:
-                logger.warning(f"CSV missing required fields: {', '.join(missing_fields)}")
-                
-            # Use the most recent row (assuming data is sorted by date)
-            most_recent_row = None
-            most_recent_date = None
-            
-            for row in reader:
-                # Check if this row has a valid date
-                if 'Date' in row and row['Date']:
-                    try:
-                        # Try to parse the date to determine the most recent entry
-                        row_date = datetime.strptime(row['Date'], '%Y-%m-%d')
-                        
-                        # Update if this is the first row or has a more recent date
-                        if most_recent_date is None or row_date > most_recent_date:
-                            most_recent_date = row_date
-                            most_recent_row = row
-                    except ValueError:
-                        # Skip rows with invalid dates
-                        continue
-            
-            # If we couldn't find a valid row, return empty dict
-            if most_recent_row is None:
-                logger.warning(f"No valid data rows found in {csv_path}")
-                return {}
-                
-            # Convert values to float
-            for key, value in most_recent_row.items():
-                if key != 'Date':  # Skip date column
-                    try:
-                        data[key] = float(value)
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not convert '{key}' value '{value}' to float, using fallback")
-                        data[key] = FALLBACK_VALUES.get(key, 0.0)
-            
-            logger.info(f"Loaded macro data from CSV, date: {most_recent_row.get('Date', 'unknown')}")
+        import pandas as pd
+        
+        df = pd.read_csv(csv_path, usecols=lambda column: column in REQUIRED_CSV_FIELDS)
+        
+        # Validate CSV has the required fields
+        missing_fields = [field for field in REQUIRED_CSV_FIELDS if field not in df.columns]
+        if missing_fields:
+            logger.warning(f"CSV missing required fields: {', '.join(missing_fields)}")
+        
+        # Use the most recent row, skipping rows without a valid date
+        if 'Date' in df.columns:
+            # Vectorized parse with an explicit format; invalid dates become NaT
+            df['Date'] = pd.to_datetime(df['Date'], format='%Y-%m-%d', errors='coerce')
+            df = df[df['Date'].notna()]
+        if 'Date' not in df.columns or df.empty:
+            logger.warning(f"No valid data rows found in {csv_path}")
+            return {}
+        most_recent_row = df.loc[df['Date'].idxmax()]
+        
+        # Convert values to float, falling back for blanks or non-numeric values
+        values = pd.to_numeric(most_recent_row.drop('Date'), errors='coerce')
+        for key, value in values.items():
+            if pd.isna(value):
+                logger.warning(f"Could not convert '{key}' value '{most_recent_row[key]}' to float, using fallback")
+                data[key] = FALLBACK_VALUES.get(key, 0.0)
+            else:
+                data[key] = float(value)
+        
+        logger.info(f"Loaded macro data from CSV, date: {most_recent_row['Date'].strftime('%Y-%m-%d')}")
             
+    except FileNotFoundError:
+        if not missing_ok:
+            raise
+        logger.warning(f"Fallback CSV not found: {csv_path}")
+        return {}
     except Exception as e:
         logger.error(f"Error loading from CSV: {str(e)}")
     
@@ -411,8 +586,21 @@ def save_macro_snapshot(snapshot: Dict[str, Any], cache_file: str = DEFAULT_CACH
         cache_data = snapshot.copy()
         cache_data["_timestamp"] = datetime.now().isoformat()
         
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        # Create the cache directory on first use
+        directory = os.path.dirname(cache_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Write to a temp file and swap it in atomically so readers never see a torn file
+        tmp_file = cache_file + ".tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str))
+            os.replace(tmp_file, cache_file)
+        except Exception:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
             
         logger.debug(f"Saved macro snapshot to cache: {cache_file}")
     except Exception as e:
@@ -428,12 +616,9 @@ def load_macro_snapshot(cache_file: str = DEFAULT_CACHE_FILE) -> Optional[Dict[s
     Returns:
         Dict with cached data or None if cache is invalid/expired
     """
-    if not os.path.exists(cache_file):
-        return None
-    
     try:
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
+        with open(cache_file, 'rb') as f:
+            cache_data = orjson.loads(f.read())
         
         # Check if cache has timestamp
         if "_timestamp" not in cache_data:
@@ -449,6 +634,8 @@ def load_macro_snapshot(cache_file: str = DEFAULT_CACHE_FILE) -> Optional[Dict[s
         
         logger.debug(f"Using cached macro data from: {timestamp.isoformat()}")
         return cache_data
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Error loading macro snapshot from cache: {str(e)}")
         return None
@@ -460,7 +647,8 @@ def get_macro_snapshot(use_cache: bool = False, cache_file: str = DEFAULT_CACHE_
     
     This function follows a cascading fallback strategy, prioritizing live data:
     1. Try to fetch live data from yfinance for market indicators
-    2. Try to get live macroeconomic indicators from FRED (CPI, etc.)
+    2. Try to get live macroeconomic indicators from FRED (CPI, etc.), concurrently with step 1
+       (skipped for keys the cache fetched live from FRED within CACHE_EXPIRY_HOURS, when use_cache is set)
     3. If enabled and live retrieval fails, try to load from cache
     4. If any data is still missing/failed, try to load from CSV fallback
     5. As a last resort, use hardcoded fallback values for any remaining missing data
@@ -478,12 +666,49 @@ def get_macro_snapshot(use_cache: bool = False, cache_file: str = DEFAULT_CACHE_
     
     # Initialize tracking
     errors = []
+    fred_fetch_times = {}  # FRED key -> ISO time its value was fetched live
     data_sources = []
     missing_indicators = set(FALLBACK_VALUES.keys())
     
-    # STRATEGY 1: Try to fetch live data from yfinance for market indicators
+    # STRATEGIES 1 & 2 hit independent hosts, so run the yfinance and FRED fetches concurrently
+    # Market tickers (e.g. the Treasury yields) always come from yfinance, which is
+    # more real-time, so don't spend FRED requests on them
+    fred_keys = [key for key in FRED_SPEC if key not in MARKET_TICKERS]
+    
+    # The cache records when each FRED value was fetched live (FRED updates at most
+    # daily), so only ask FRED for keys whose own fetch is missing or older than
+    # CACHE_EXPIRY_HOURS. Keys the cache filled from the CSV or hardcoded fallbacks
+    # have no fetch time and are fetched again.
+    cached_data = None
+    cached_fetch_times = {}
+    if use_cache:
+        try:
+            cached_data = load_macro_snapshot(cache_file)
+        except Exception as e:
+            errors.append(f"Error loading from cache: {str(e)}")
+            logger.error(f"Failed to load from cache: {str(e)}")
+        if cached_data and isinstance(cached_data.get("_fred_fetch_times"), dict):
+            expiry = datetime.now() - timedelta(hours=CACHE_EXPIRY_HOURS)
+            try:
+                cached_fetch_times = {
+                    key: fetched for key, fetched in cached_data["_fred_fetch_times"].items()
+                    if key in cached_data and datetime.fromisoformat(fetched) >= expiry
+                }
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Ignoring malformed FRED fetch times in cache: {str(e)}")
+            fred_keys = [key for key in fred_keys if key not in cached_fetch_times]
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        market_future = executor.submit(get_market_data)
+        if fred_keys:
+            fred_future = executor.submit(get_fred_data, fred_keys)
+        else:
+            fred_future = None
+            logger.info("Skipping FRED; all keys already populated")
+    
+    # STRATEGY 1: Live data from yfinance for market indicators
     try:
-        market_data = get_market_data()
+        market_data = market_future.result()
         if market_data:
             result.update(market_data)
             data_sources.append("yfinance_live")
@@ -497,22 +722,27 @@ def get_macro_snapshot(use_cache: bool = False, cache_file: str = DEFAULT_CACHE_
         errors.append(f"Error fetching market data: {str(e)}")
         logger.error(f"Failed to fetch market data: {str(e)}")
     
-    # STRATEGY 2: Try to get live macroeconomic indicators from FRED
+    # STRATEGY 2: Live macroeconomic indicators from FRED
+    fetched_at = datetime.now().isoformat()
     try:
-        macro_data = get_fred_data()
+        macro_data = fred_future.result() if fred_future else {}
         if macro_data:
             # Only update fields that are not already populated from market data
             # This ensures market data (which is more real-time) takes precedence
             for key, value in macro_data.items():
                 if key not in result:
                     result[key] = value
+                    # get_fred_data substitutes FALLBACK_VALUES for series it couldn't
+                    # fetch, and nudges live values off them, so equality means fallback
+                    if value != FALLBACK_VALUES.get(key):
+                        fred_fetch_times[key] = fetched_at
             
             data_sources.append("fred_live")
             
             # Update missing indicators
             missing_indicators -= set(macro_data.keys())
             logger.info(f"Successfully fetched live FRED data for {len(macro_data)} indicators")
-        else:
+        elif fred_future:
             errors.append("Failed to fetch macroeconomic indicators")
     except Exception as e:
         errors.append(f"Error fetching macro indicators: {str(e)}")
@@ -521,21 +751,23 @@ def get_macro_snapshot(use_cache: bool = False, cache_file: str = DEFAULT_CACHE_
     # STRATEGY 3: Only if enabled and we're still missing data, try to load from cache
     if use_cache and missing_indicators:
         try:
-            cached_data = load_macro_snapshot(cache_file)
             if cached_data:
                 # Get non-metadata fields from cache
-                for k, v in cached_data.items():
-                    if not k.startswith('_') and k in missing_indicators and k not in result:
-                        result[k] = v
-                        
+                added = {k for k in cached_data
+                         if not k.startswith('_') and k in missing_indicators and k not in result}
+                result.update({k: cached_data[k] for k in added})
+                
+                # FRED values served from the cache keep their original fetch time
+                fred_fetch_times.update({k: cached_fetch_times[k] for k in added if k in cached_fetch_times})
+                
                 data_sources.append("cache")
                 
                 # Update missing indicators
-                missing_indicators -= set([k for k in cached_data.keys() if not k.startswith('_')])
+                missing_indicators -= added
                 
                 # Add cache metadata
                 result["_cached_timestamp"] = cached_data.get("_timestamp", datetime.now().isoformat())
-                logger.info(f"Loaded {len([k for k in cached_data.keys() if not k.startswith('_') and k in missing_indicators])} indicators from cache")
+                logger.info(f"Loaded {len(added)} indicators from cache")
         except Exception as e:
             errors.append(f"Error loading from cache: {str(e)}")
             logger.error(f"Failed to load from cache: {str(e)}")
@@ -546,14 +778,12 @@ def get_macro_snapshot(use_cache: bool = False, cache_file: str = DEFAULT_CACHE_
             csv_data = load_from_csv(fallback_csv)
             if csv_data:
                 # Only update missing values
-                for key in missing_indicators.copy():
-                    if key in csv_data and key not in result:
-                        result[key] = csv_data[key]
-                        missing_indicators.remove(key)
+                added = {k for k in csv_data if k in missing_indicators and k not in result}
+                result.update({k: csv_data[k] for k in added})
+                missing_indicators -= added
                 
-                if csv_data:
-                    data_sources.append("csv_fallback")
-                    logger.warning(f"Using CSV fallback for {len([k for k in csv_data.keys() if k in missing_indicators])} indicators")
+                data_sources.append("csv_fallback")
+                logger.warning(f"Using CSV fallback for {len(added)} indicators")
         except Exception as e:
             errors.append(f"Error loading fallback CSV: {str(e)}")
             logger.error(f"Failed to load from CSV fallback: {str(e)}")
@@ -575,6 +805,7 @@ def get_macro_snapshot(use_cache: bool = False, cache_file: str = DEFAULT_CACHE_
     result["_timestamp"] = datetime.now().isoformat()
     result["_error"] = "; ".join(errors) if errors else ""
     result["_live_percentage"] = calculate_live_percentage(result, data_sources)
+    result["_fred_fetch_times"] = fred_fetch_times
     
     # Cache the result for future use, but only if we have SOME live data
     if "yfinance_live" in data_sources or "fred_live" in data_sources:
@@ -659,8 +890,8 @@ def create_empty_csv_template(csv_path: str = DEFAULT_FALLBACK_CSV, force_overwr
     try:
         # Create directory if it doesn't exist
         directory = os.path.dirname(csv_path)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
             logger.info(f"Created directory: {directory}")
         
         # Check if file exists and handle according to force_overwrite
@@ -708,6 +939,7 @@ if __name__ == "__main__":
     # Test FRED API if requested
     if args.test_fred:
         print("\n=== Testing FRED API Connection ===")
+        fred = _get_fred()
         
         if not FRED_API_KEY:
             print("❌ ERROR: FRED API key not found in .env file")
@@ -721,13 +953,16 @@ if __name__ == "__main__":
             print("\nTesting CPI data fetch:")
             cpi_series = fred.get_series_latest_release(FRED_SERIES['CPI_YoY'])
             if not cpi_series.empty:
-                latest_cpi = cpi_series.iloc[-1]
-                latest_date = cpi_series.index[-1].strftime("%Y-%m-%d")
+                arr = cpi_series.values
+                idx = cpi_series.index
+                latest_cpi = arr[-1]
+                latest_date = idx[-1].strftime("%Y-%m-%d")
                 print(f"✅ CPI data retrieved, latest value: {latest_cpi:.1f} (date: {latest_date})")
                 
                 # Calculate year-over-year
-                year_ago_cpi = cpi_series.iloc[-13] if len(cpi_series) >= 13 else cpi_series.iloc[0]
-                year_ago_date = cpi_series.index[-13].strftime("%Y-%m-%d") if len(cpi_series) >= 13 else cpi_series.index[0].strftime("%Y-%m-%d")
+                year_ago_pos = -13 if arr.size >= 13 else 0
+                year_ago_cpi = arr[year_ago_pos]
+                year_ago_date = idx[year_ago_pos].strftime("%Y-%m-%d")
                 cpi_yoy = ((latest_cpi / year_ago_cpi) - 1) * 100
                 print(f"✅ CPI YoY calculation: {cpi_yoy:.1f}% (comparing {latest_date} to {year_ago_date})")
             else:
@@ -737,7 +972,7 @@ if __name__ == "__main__":
             print("\nTesting Unemployment data fetch:")
             unemployment_series = fred.get_series_latest_release(FRED_SERIES['Unemployment'])
             if not unemployment_series.empty:
-                latest_unemp = unemployment_series.iloc[-1]
+                latest_unemp = unemployment_series.values[-1]
                 latest_date = unemployment_series.index[-1].strftime("%Y-%m-%d")
                 print(f"✅ Unemployment data retrieved, latest value: {latest_unemp:.1f}% (date: {latest_date})")
             else:
@@ -746,8 +981,9 @@ if __name__ == "__main__":
             # Get the full macro data using our function
             print("\nTesting full get_fred_data() function:")
             fred_data = get_fred_data()
+            fallback_get = FALLBACK_VALUES.get
             for key, value in fred_data.items():
-                fallback = " (fallback)" if value == FALLBACK_VALUES.get(key) else ""
+                fallback = " (fallback)" if value == fallback_get(key) else ""
                 print(f"  {key}: {value:.2f}{fallback}")
                 
             print("\n✅ FRED API test completed successfully")
@@ -790,9 +1026,10 @@ if __name__ == "__main__":
         
         # Check which indicators are live vs fallback
         indicators = ["CPI_YoY", "Unemployment", "Fed_Funds_Rate", "VIX", "SPY_Price"]
+        fallback_get = FALLBACK_VALUES.get
         for ind in indicators:
             if ind in direct_data:
-                is_fallback = direct_data[ind] == FALLBACK_VALUES.get(ind, None)
+                is_fallback = direct_data[ind] == fallback_get(ind)
                 status = "fallback" if is_fallback else "live"
                 print(f"  {ind}: {direct_data[ind]:.2f} ({status})")
         
@@ -806,16 +1043,17 @@ if __name__ == "__main__":
         
         # Test 3: Use CSV fallback
         print("\nTest 3: CSV fallback")
-        if os.path.exists(args.csv_path):
-            csv_data = load_from_csv(args.csv_path)
+        try:
+            csv_data = load_from_csv(args.csv_path, missing_ok=False)
+        except (FileNotFoundError, OSError):
+            print(f"CSV not found: {args.csv_path}")
+        else:
             print(f"CSV found: {args.csv_path}")
             fields = list(csv_data.keys())
             print(f"Available fields: {', '.join(fields)}")
             missing = [f for f in REQUIRED_CSV_FIELDS[1:] if f not in fields]  # Skip Date
             if missing:
                 print(f"Missing fields: {', '.join(missing)}")
-        else:
-            print(f"CSV not found: {args.csv_path}")
             
         print("\n=== Fallback Verification Complete ===")
     
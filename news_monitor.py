@@ -10,9 +10,10 @@ It prioritizes events based on market impact and filters for the most actionable
 import time
 import os
 import datetime
+import functools
 from typing import List, Dict, Any, Set, Optional, Tuple
 from rss_ingestor import fetch_rss_headlines, FINANCIAL_FEEDS
-from llm_event_classifier import classify_macro_event
+from llm_event_classifier import classify_macro_events_batch
 from macro_data_collector import get_macro_snapshot
 from trade_picker import generate_trade_idea
 from historical_matcher import match_event
@@ -22,6 +23,15 @@ import threading
 import signal
 import sys
 import json
+import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib serializer
+    orjson = None
+from collections import OrderedDict
 
 # Initialize colorama for cross-platform colored terminal output
 init()
@@ -33,6 +43,7 @@ logger = get_logger(__name__)
 MAX_HEADLINES = 25  # Number of headlines to track at once
 REFRESH_INTERVAL = 300  # Check for new headlines every X seconds (5 min)
 AUTO_INTERPRET = True  # Automatically run LLM interpretation for new headlines
+INTERPRET_BATCH_SIZE = 10  # Headlines classified per LLM call
 OPPORTUNITY_SCAN_INTERVAL = 1800  # Scan for opportunities every X seconds (30 min)
 TIME_FRAMES = ["short", "medium", "long"]  # Trading time frames to scan for
 PRIORITY_THRESHOLDS = {
@@ -41,28 +52,62 @@ PRIORITY_THRESHOLDS = {
     "low": 0.4     # Low priority match score threshold
 }
 MAX_OPPORTUNITIES = 5  # Maximum opportunities to track per time frame
+SEEN_CAP = 2000  # Maximum headline keys remembered for de-duplication
+SCAN_WORKERS = 8  # Headlines processed concurrently during an opportunity scan
+
+# Precomputed display strings
+RESET = Style.RESET_ALL
+HEADER_BANNER = f"{Fore.CYAN}========== FINANCIAL NEWS MONITOR =========={RESET}\n"
+HEADER_RULE = f"{Fore.CYAN}============================================{RESET}\n\n"
+SOURCES_LABEL = f"{Fore.YELLOW}News Sources:{RESET}\n"
+HEADLINES_LABEL = f"{Fore.YELLOW}Latest Headlines:{RESET}\n"
+NO_HEADLINES_MSG = f"{Fore.YELLOW}No headlines available yet. Waiting for data...{RESET}\n"
+ANALYSIS_LABEL = f"   {Fore.MAGENTA}LLM Analysis:{RESET} "
+OPPORTUNITIES_LABEL = f"\n{Fore.YELLOW}Trading Opportunities:{RESET}\n"
+
+# Lookup tables for ranking and coloring (unknown values fall back at the call site)
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+PRIORITY_COLOR = {"high": Fore.RED, "medium": Fore.YELLOW, "low": Fore.WHITE}
+SENTIMENT_COLOR = {"Bullish": Fore.GREEN, "Bearish": Fore.RED}
 
 # Global state
-seen_headlines = set()  # Track headlines we've already seen
+seen_headlines = OrderedDict()  # Track headlines we've already seen (least recently seen first, capped at SEEN_CAP)
 latest_headlines = []  # Store the latest headlines
 trading_opportunities = {
     "short": [],  # Short-term opportunities (days)
     "medium": [], # Medium-term opportunities (weeks)
     "long": []    # Long-term opportunities (months)
 }
-opportunity_lock = threading.Lock()  # Lock for updating opportunities
-running = True  # Control the main loop
-interpret_lock = threading.Lock()  # Lock for interpreting headlines
+opportunity_lock = threading.Lock()  # Serializes publishing a new trading_opportunities dict
+scan_executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="scan")  # Reused across scans
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="news-mon")  # Background interpret/scan jobs
+_shutdown = threading.Event()  # Set to stop the main loop and background workers
+_draw_lock = threading.Lock()  # Serializes screen redraws across threads
+_last_draw_ts = 0.0  # time.monotonic() of the last redraw
+_last_saved_digest = None  # SHA-1 of the last opportunities blob written to disk
+_last_scan_sig = None  # Signature of the classified headline set at the last completed scan
+
+def priority_key(opportunity: Dict[str, Any]) -> Tuple[int, float]:
+    """Sort key ranking opportunities by priority, then by match score (best first)."""
+    return (
+        PRIORITY_RANK.get(opportunity["priority"], 2),
+        -float(opportunity.get("match_score", 0))
+    )
 
 def clear_screen():
-    """Clear the terminal screen in a cross-platform way."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Clear the terminal screen with ANSI escapes (colorama translates them on Windows)."""
+    sys.stdout.write("\x1b[2J\x1b[H")
+
+@functools.lru_cache(maxsize=512)
+def _parse_published(timestamp_str: str) -> datetime.datetime:
+    """Parse an RSS ISO timestamp into an aware UTC datetime (cached per string)."""
+    timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%SZ")
+    return timestamp.replace(tzinfo=datetime.timezone.utc)
 
 def format_time_ago(timestamp_str: str) -> str:
     """Convert ISO timestamp to a human-readable 'X minutes ago' format."""
     try:
-        timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%SZ")
-        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        timestamp = _parse_published(timestamp_str)
         now = datetime.datetime.now(datetime.timezone.utc)
         
         delta = now - timestamp
@@ -84,6 +129,10 @@ def get_headline_key(headline: Dict[str, Any]) -> str:
     """Create a unique key for a headline to detect duplicates."""
     return f"{headline['title']}|{headline['source']}"
 
+def headline_key(headline: Dict[str, Any]) -> str:
+    """Return the key cached on the headline at ingest, computing it if absent."""
+    return headline.get('_key') or get_headline_key(headline)
+
 def fetch_latest_headlines() -> List[Dict[str, Any]]:
     """Fetch the latest headlines and update the seen set."""
     global seen_headlines, latest_headlines
@@ -98,10 +147,18 @@ def fetch_latest_headlines() -> List[Dict[str, Any]]:
         new_headlines = []
         for headline in all_headlines:
             key = get_headline_key(headline)
-            if key not in seen_headlines:
-                seen_headlines.add(key)
+            if key in seen_headlines:
+                # Still in a feed, so keep it away from the eviction end
+                seen_headlines.move_to_end(key)
+            else:
+                seen_headlines[key] = True
+                headline['_key'] = key
                 new_headlines.append(headline)
         
+        # Forget the least recently seen keys so the set doesn't grow without bound
+        while len(seen_headlines) > SEEN_CAP:
+            seen_headlines.popitem(last=False)
+        
         # Update our latest headlines (keeping only MAX_HEADLINES)
         latest_headlines = (new_headlines + latest_headlines)[:MAX_HEADLINES]
         
@@ -112,24 +169,6 @@ def fetch_latest_headlines() -> List[Dict[str, Any]]:
         logger.error(error_msg)
         return []
 
-def interpret_headline(headline: Dict[str, Any]) -> Dict[str, Any]:
-    """Use LLM to interpret a headline and add event classification."""
-    try:
-        with interpret_lock:
-            logger.info(f"Interpreting headline: {headline.get('title', 'Unknown')}")
-            classification = classify_macro_event(headline)
-            
-            # Add the classification to the headline
-            headline_with_classification = headline.copy()
-            headline_with_classification.update(classification)
-            logger.info(f"Classified as: {classification.get('event_type', 'Unknown')} / {classification.get('sentiment', 'Unknown')}")
-            return headline_with_classification
-    except Exception as e:
-        error_msg = f"Error interpreting headline: {str(e)}"
-        print(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
-        logger.error(error_msg)
-        return headline
-
 def find_historical_matches(headline: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Find historical matches for a headline."""
     try:
@@ -147,16 +186,41 @@ def find_historical_matches(headline: Dict[str, Any]) -> List[Dict[str, Any]]:
         logger.error(error_msg)
         return []
 
-def generate_trade_opportunity(headline: Dict[str, Any], matches: List[Dict[str, Any]], time_frame: str) -> Optional[Dict[str, Any]]:
-    """Generate a trade opportunity for a specific time frame."""
+def summarize_matches(matches: List[Dict[str, Any]]) -> Tuple[float, float, str]:
+    """Return (match_score, price_change, priority) for a headline's historical matches."""
+    # Calculate priority based on match scores and event significance
+    top_match = max(matches, key=lambda m: m.get('match_score', 0))
+    match_score = top_match.get('match_score', 0)
+    price_change = abs(top_match.get('price_change_pct', 0))
+    
+    # More significant price changes get higher priority
+    priority = "low"
+    if match_score >= PRIORITY_THRESHOLDS["high"] and price_change > 5.0:
+        priority = "high"
+    elif match_score >= PRIORITY_THRESHOLDS["medium"] and price_change > 2.5:
+        priority = "medium"
+    
+    return match_score, price_change, priority
+
+def generate_trade_opportunity(headline: Dict[str, Any], matches: List[Dict[str, Any]], time_frame: str,
+                               macro_context: Optional[Dict[str, Any]] = None,
+                               match_summary: Optional[Tuple[float, float, str]] = None) -> Optional[Dict[str, Any]]:
+    """Generate a trade opportunity for a specific time frame.
+    
+    macro_context should be fetched once per scan and match_summary once per
+    headline by the caller; both are only computed here when the function is
+    called on its own.
+    """
     try:
         if not matches:
             return None
-            
-        logger.info(f"Generating {time_frame}-term trade for: {headline.get('title', 'Unknown')}")
+        
+        title = headline.get('title', 'Unknown')
+        logger.info(f"Generating {time_frame}-term trade for: {title}")
         
         # Get macro context for trade generation
-        macro_context = get_macro_snapshot(use_cache=True)
+        if macro_context is None:
+            macro_context = get_macro_snapshot(use_cache=True)
         
         # Adjust expiration parameters based on time frame
         trade_params = {}
@@ -174,21 +238,13 @@ def generate_trade_opportunity(headline: Dict[str, Any], matches: List[Dict[str,
         if not trade or not trade.get('ticker') or not trade.get('option_type'):
             return None
             
-        # Calculate priority based on match scores and event significance
-        top_match = max(matches, key=lambda m: m.get('match_score', 0))
-        match_score = top_match.get('match_score', 0)
-        price_change = abs(top_match.get('price_change_pct', 0))
-        
-        # More significant price changes get higher priority
-        priority = "low"
-        if match_score >= PRIORITY_THRESHOLDS["high"] and price_change > 5.0:
-            priority = "high"
-        elif match_score >= PRIORITY_THRESHOLDS["medium"] and price_change > 2.5:
-            priority = "medium"
+        if match_summary is None:
+            match_summary = summarize_matches(matches)
+        match_score, price_change, priority = match_summary
         
         # Create opportunity object
         opportunity = {
-            "headline": headline.get('title', 'Unknown'),
+            "headline": title,
             "event_type": headline.get('event_type', 'Unknown'),
             "sentiment": headline.get('sentiment', 'Unknown'),
             "sector": headline.get('sector', 'Unknown'),
@@ -208,9 +264,32 @@ def generate_trade_opportunity(headline: Dict[str, Any], matches: List[Dict[str,
         logger.error(error_msg)
         return None
 
-def scan_for_opportunities():
-    """Scan headlines for new trading opportunities."""
-    global trading_opportunities
+def _process_headline(headline: Dict[str, Any], macro_context: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Find matches for one headline and return its (time_frame, opportunity) pairs."""
+    # Find historical matches
+    matches = find_historical_matches(headline)
+    
+    if not matches:
+        return []
+    
+    # Score the matches once; the result is the same for every time frame
+    match_summary = summarize_matches(matches)
+    
+    # Generate opportunities for each time frame
+    results = []
+    for time_frame in TIME_FRAMES:
+        opportunity = generate_trade_opportunity(headline, matches, time_frame, macro_context, match_summary)
+        if opportunity:
+            results.append((time_frame, opportunity))
+    return results
+
+def scan_for_opportunities(force: bool = False):
+    """Scan headlines for new trading opportunities.
+    
+    The scan is skipped when the set of classified headlines is unchanged
+    since the last completed scan, unless force is True.
+    """
+    global trading_opportunities, _last_scan_sig
     
     try:
         logger.info("Starting opportunity scan")
@@ -221,87 +300,99 @@ def scan_for_opportunities():
             logger.info("No classified headlines available for opportunity scan")
             return
             
+        sig = hash(frozenset(headline_key(h) for h in classified_headlines))
+        if not force and sig == _last_scan_sig:
+            logger.info("Classified headlines unchanged since last scan; skipping")
+            return
+        
         logger.info(f"Scanning {len(classified_headlines)} headlines for opportunities")
         
         new_opportunities = {time_frame: [] for time_frame in TIME_FRAMES}
         
-        for headline in classified_headlines:
-            # Find historical matches
-            matches = find_historical_matches(headline)
-            
-            if not matches:
-                continue
-                
-            # Generate opportunities for each time frame
-            for time_frame in TIME_FRAMES:
-                opportunity = generate_trade_opportunity(headline, matches, time_frame)
-                if opportunity:
-                    new_opportunities[time_frame].append(opportunity)
-        
-        # Update the global trading opportunities
+        # Fetch macro context once for the whole scan
+        try:
+            macro_context = get_macro_snapshot(use_cache=True)
+        except Exception as e:
+            logger.error(f"Error fetching macro snapshot for opportunity scan: {str(e)}")
+            macro_context = {}
+        
+        # Process headlines concurrently; map keeps results in headline order
+        per_headline = scan_executor.map(
+            lambda h: _process_headline(h, macro_context), classified_headlines
+        )
+        for results in per_headline:
+            for time_frame, opportunity in results:
+                new_opportunities[time_frame].append(opportunity)
+        
+        # Merge with existing opportunities privately, keeping only the best MAX_OPPORTUNITIES,
+        # then publish the new dict with a single reference swap so readers never block
+        current = trading_opportunities
+        updated = {
+            time_frame: heapq.nsmallest(
+                MAX_OPPORTUNITIES, new_opportunities[time_frame] + current[time_frame], key=priority_key
+            )
+            for time_frame in TIME_FRAMES
+        }
         with opportunity_lock:
-            for time_frame in TIME_FRAMES:
-                # Sort new opportunities by priority and match score
-                sorted_opportunities = sorted(
-                    new_opportunities[time_frame],
-                    key=lambda o: (
-                        0 if o["priority"] == "high" else 1 if o["priority"] == "medium" else 2,
-                        -float(o.get("match_score", 0))
-                    )
-                )
-                
-                # Merge with existing opportunities, keeping only the best MAX_OPPORTUNITIES
-                current = trading_opportunities[time_frame]
-                merged = sorted_opportunities + current
-                
-                # Sort again and limit to MAX_OPPORTUNITIES
-                merged = sorted(
-                    merged,
-                    key=lambda o: (
-                        0 if o["priority"] == "high" else 1 if o["priority"] == "medium" else 2,
-                        -float(o.get("match_score", 0))
-                    )
-                )[:MAX_OPPORTUNITIES]
-                
-                trading_opportunities[time_frame] = merged
+            trading_opportunities = updated
+        _last_scan_sig = sig
         
         logger.info("Opportunity scan complete")
-        logger.info(f"Current opportunities: Short: {len(trading_opportunities['short'])}, Medium: {len(trading_opportunities['medium'])}, Long: {len(trading_opportunities['long'])}")
+        logger.info(f"Current opportunities: Short: {len(updated['short'])}, Medium: {len(updated['medium'])}, Long: {len(updated['long'])}")
         
     except Exception as e:
         error_msg = f"Error in opportunity scan: {str(e)}"
         print(f"{Fore.RED}{error_msg}{Style.RESET_ALL}")
         logger.error(error_msg)
 
+def _colorize(color: str, text: Any) -> str:
+    """Wrap text in a colorama color and reset sequence."""
+    return f"{color}{text}{RESET}"
+
+def maybe_display_headlines(min_interval: float = 1.0):
+    """Redraw the screen unless it was redrawn less than min_interval seconds ago."""
+    if time.monotonic() - _last_draw_ts >= min_interval:
+        display_headlines()
+
 def display_headlines():
-    """Display the current set of headlines."""
+    """Display the current set of headlines, written to stdout in one call."""
+    global _last_draw_ts
+    with _draw_lock:
+        _last_draw_ts = time.monotonic()
+        _render_headlines()
+
+def _render_headlines():
+    """Build and write the full monitor screen."""
     clear_screen()
+    parts: List[str] = []
     
     # Print header
-    print(f"{Fore.CYAN}========== FINANCIAL NEWS MONITOR =========={Style.RESET_ALL}")
-    print(f"Monitoring {len(FINANCIAL_FEEDS)} news feeds | Refreshed at: {datetime.datetime.now().strftime('%H:%M:%S')}")
-    print(f"Press Ctrl+C to exit")
-    print(f"{Fore.CYAN}============================================{Style.RESET_ALL}\n")
+    parts.append(HEADER_BANNER)
+    parts.append(f"Monitoring {len(FINANCIAL_FEEDS)} news feeds | Refreshed at: {datetime.datetime.now().strftime('%H:%M:%S')}\n")
+    parts.append("Press Ctrl+C to exit\n")
+    parts.append(HEADER_RULE)
     
     # Print news sources being monitored
-    print(f"{Fore.YELLOW}News Sources:{Style.RESET_ALL}")
+    parts.append(SOURCES_LABEL)
     for i, feed in enumerate(FINANCIAL_FEEDS, 1):
-        print(f"  {i}. {feed['source']}")
-    print()
+        parts.append(f"  {i}. {feed['source']}\n")
+    parts.append("\n")
     
     # Print headlines
     if not latest_headlines:
-        print(f"{Fore.YELLOW}No headlines available yet. Waiting for data...{Style.RESET_ALL}")
+        parts.append(NO_HEADLINES_MSG)
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
         return
     
-    print(f"{Fore.YELLOW}Latest Headlines:{Style.RESET_ALL}")
+    parts.append(HEADLINES_LABEL)
     for i, headline in enumerate(latest_headlines[:10], 1):  # Show top 10
         time_ago = format_time_ago(headline.get('published', ''))
         source = headline.get('source', 'Unknown')
         
         # Print headline with number, time, and source
-        print(f"{Fore.GREEN}{i}.{Style.RESET_ALL} {headline['title']}")
-        print(f"   {Fore.BLUE}{time_ago} | {source}{Style.RESET_ALL}")
+        parts.append(f"{_colorize(Fore.GREEN, f'{i}.')} {headline['title']}\n")
+        parts.append(f"   {_colorize(Fore.BLUE, f'{time_ago} | {source}')}\n")
         
         # If we have LLM interpretation data, show it
         event_type = headline.get('event_type')
@@ -309,39 +400,40 @@ def display_headlines():
         sector = headline.get('sector')
         
         if event_type or sentiment or sector:
-            print(f"   {Fore.MAGENTA}LLM Analysis:{Style.RESET_ALL}", end=" ")
+            parts.append(ANALYSIS_LABEL)
             
             if event_type:
-                print(f"{Fore.YELLOW}{event_type}{Style.RESET_ALL}", end=" | ")
+                parts.append(f"{_colorize(Fore.YELLOW, event_type)} | ")
             
             if sentiment:
                 # Color-code the sentiment
-                sentiment_color = Fore.GREEN if sentiment == "Bullish" else Fore.RED if sentiment == "Bearish" else Fore.YELLOW
-                print(f"{sentiment_color}{sentiment}{Style.RESET_ALL}", end=" | ")
+                sentiment_color = SENTIMENT_COLOR.get(sentiment, Fore.YELLOW)
+                parts.append(f"{_colorize(sentiment_color, sentiment)} | ")
             
             if sector:
-                print(f"{Fore.CYAN}{sector}{Style.RESET_ALL}", end="")
+                parts.append(_colorize(Fore.CYAN, sector))
             
-            print()  # End the line
+            parts.append("\n")  # End the line
         
-        print()  # Empty line between headlines
+        parts.append("\n")  # Empty line between headlines
     
     # Print trading opportunities
-    print(f"\n{Fore.YELLOW}Trading Opportunities:{Style.RESET_ALL}")
+    parts.append(OPPORTUNITIES_LABEL)
     
+    snapshot = trading_opportunities  # Published dicts are never mutated, so no lock is needed
     for time_frame in TIME_FRAMES:
-        opportunities = trading_opportunities[time_frame]
+        opportunities = snapshot[time_frame]
         
         # Skip if no opportunities for this time frame
         if not opportunities:
             continue
         
-        print(f"\n{Fore.CYAN}{time_frame.upper()}-TERM OPPORTUNITIES:{Style.RESET_ALL}")
+        parts.append(f"\n{_colorize(Fore.CYAN, f'{time_frame.upper()}-TERM OPPORTUNITIES:')}\n")
         
         for i, opportunity in enumerate(opportunities, 1):
             # Set color based on priority
-            priority_color = Fore.RED if opportunity["priority"] == "high" else Fore.YELLOW if opportunity["priority"] == "medium" else Fore.WHITE
-            sentiment_color = Fore.GREEN if opportunity["sentiment"] == "Bullish" else Fore.RED if opportunity["sentiment"] == "Bearish" else Fore.YELLOW
+            priority_color = PRIORITY_COLOR.get(opportunity["priority"], Fore.WHITE)
+            sentiment_color = SENTIMENT_COLOR.get(opportunity["sentiment"], Fore.YELLOW)
             
             trade = opportunity["trade"]
             ticker = trade.get("ticker", "Unknown")
@@ -349,69 +441,93 @@ def display_headlines():
             strike = trade.get("strike", "Unknown")
             expiry = trade.get("expiry", "Unknown")
             
-            print(f"{priority_color}{i}. [{opportunity['priority'].upper()}] {ticker} {option_type}{Style.RESET_ALL}")
-            print(f"   Event: {opportunity['headline']}")
-            print(f"   Analysis: {opportunity['event_type']} | {sentiment_color}{opportunity['sentiment']}{Style.RESET_ALL} | {Fore.CYAN}{opportunity['sector']}{Style.RESET_ALL}")
-            print(f"   Expected Move: {opportunity['expected_move']} | Match Score: {opportunity['match_score']:.2f}")
-            print(f"   Trade: {option_type} {strike} {expiry}")
-            print()
+            priority_label = opportunity["priority"].upper()
+            parts.append(f"{_colorize(priority_color, f'{i}. [{priority_label}] {ticker} {option_type}')}\n")
+            parts.append(f"   Event: {opportunity['headline']}\n")
+            parts.append(f"   Analysis: {opportunity['event_type']} | {_colorize(sentiment_color, opportunity['sentiment'])} | {_colorize(Fore.CYAN, opportunity['sector'])}\n")
+            parts.append(f"   Expected Move: {opportunity['expected_move']} | Match Score: {opportunity['match_score']:.2f}\n")
+            parts.append(f"   Trade: {option_type} {strike} {expiry}\n")
+            parts.append("\n")
+    
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 def interpret_headlines_async(headlines_to_interpret):
-    """Asynchronously interpret headlines using the LLM."""
-    for i, headline in enumerate(headlines_to_interpret):
-        if not running:
+    """Asynchronously interpret headlines using the LLM, one batch call per chunk."""
+    # Skip headlines that already have interpretations
+    pending = [h for h in headlines_to_interpret if 'event_type' not in h]
+    
+    for start in range(0, len(pending), INTERPRET_BATCH_SIZE):
+        if _shutdown.is_set():
             break
-            
-        # Skip headlines that already have interpretations
-        if 'event_type' in headline:
-            continue
-            
-        # Interpret headline
+        
+        chunk = pending[start:start + INTERPRET_BATCH_SIZE]
+        
+        # Interpret the whole chunk with a single LLM call
         try:
-            interpreted = interpret_headline(headline)
+            logger.info(f"Interpreting batch of {len(chunk)} headlines")
+            classifications = classify_macro_events_batch(chunk)
             
-            # Update the headline in our list with the interpretation
-            for j, h in enumerate(latest_headlines):
-                if get_headline_key(h) == get_headline_key(headline):
-                    latest_headlines[j].update({
-                        'event_type': interpreted.get('event_type', 'Unknown'),
-                        'sentiment': interpreted.get('sentiment', 'Unknown'),
-                        'sector': interpreted.get('sector', 'Unknown')
-                    })
-                    break
-                    
-            # Refresh display after each headline is interpreted
-            display_headlines()
+            # The chunk holds the same dicts as latest_headlines, so update them in place;
+            # position lookups could hit the wrong row if a refresh reshuffles the list meanwhile
+            for headline, classification in zip(chunk, classifications):
+                headline.update({
+                    'event_type': classification.get('event_type', 'Unknown'),
+                    'sentiment': classification.get('sentiment', 'Unknown'),
+                    'sector': classification.get('sector', 'Unknown')
+                })
+            
+            # Refresh display after each chunk, throttled to avoid redundant redraws
+            maybe_display_headlines()
             
         except Exception as e:
-            error_msg = f"Error interpreting headline: {str(e)}"
+            error_msg = f"Error interpreting headlines: {str(e)}"
             print(error_msg)
             logger.error(error_msg)
+    
+    # The throttle may have skipped the last chunk's redraw, so always show the final state
+    display_headlines()
 
 def save_opportunities_to_file():
-    """Save current opportunities to a JSON file for external use."""
+    """Save current opportunities to a JSON file for external use.
+    
+    The file is written through a temp file and os.replace so readers never
+    see a partial write, and the write is skipped if nothing has changed
+    since the last save.
+    """
+    global _last_saved_digest
+    output_file = "trading_opportunities.json"
+    tmp_file = output_file + ".tmp"
     try:
-        output_file = "trading_opportunities.json"
-        with open(output_file, 'w') as f:
-            json.dump(trading_opportunities, f, indent=2)
+        if orjson is not None:
+            blob = orjson.dumps(trading_opportunities, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            blob = json.dumps(trading_opportunities).encode("utf-8")
+        
+        digest = hashlib.sha1(blob).hexdigest()
+        if digest == _last_saved_digest:
+            logger.debug("Trading opportunities unchanged; skipping save")
+            return
+        
+        with open(tmp_file, 'wb', buffering=1 << 16) as f:
+            f.write(blob)
+        os.replace(tmp_file, output_file)
+        _last_saved_digest = digest
         logger.info(f"Saved trading opportunities to {output_file}")
     except Exception as e:
         logger.error(f"Error saving opportunities to file: {str(e)}")
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
 
 def signal_handler(sig, frame):
-    """Handle Ctrl+C to cleanly exit the program."""
-    global running
+    """Handle Ctrl+C to cleanly exit the program by waking the main loop."""
     print(f"\n{Fore.YELLOW}Exiting News Monitor...{Style.RESET_ALL}")
-    running = False
-    
-    # Save opportunities before exiting
-    save_opportunities_to_file()
-    sys.exit(0)
+    _shutdown.set()
 
 def main():
     """Main function to run the news monitor."""
-    global running
-    
     # Set up signal handler for clean exit
     signal.signal(signal.SIGINT, signal_handler)
     
@@ -420,21 +536,16 @@ def main():
     initial_headlines = fetch_latest_headlines()
     display_headlines()
     
-    # Start interpreter thread for initial headlines if auto-interpret is on
+    # Interpret initial headlines in the background if auto-interpret is on
     if AUTO_INTERPRET and initial_headlines:
-        interpreter_thread = threading.Thread(
-            target=interpret_headlines_async, 
-            args=(latest_headlines,)
-        )
-        interpreter_thread.daemon = True
-        interpreter_thread.start()
+        _executor.submit(interpret_headlines_async, latest_headlines)
     
     # Counters for scheduled events
     last_headline_update = time.time()
     last_opportunity_scan = time.time()
     
     # Main loop
-    while running:
+    while not _shutdown.is_set():
         current_time = time.time()
         
         # Check if it's time to refresh headlines
@@ -445,27 +556,33 @@ def main():
             last_headline_update = current_time
             
             # Interpret new headlines if auto-interpret is on
-            if AUTO_INTERPRET and new_headlines:
-                interpreter_thread = threading.Thread(
-                    target=interpret_headlines_async, 
-                    args=(new_headlines,)
-                )
-                interpreter_thread.daemon = True
-                interpreter_thread.start()
+            if AUTO_INTERPRET and new_headlines and not _shutdown.is_set():
+                _executor.submit(interpret_headlines_async, new_headlines)
         
         # Check if it's time to scan for trading opportunities
-        if current_time - last_opportunity_scan >= OPPORTUNITY_SCAN_INTERVAL:
+        if current_time - last_opportunity_scan >= OPPORTUNITY_SCAN_INTERVAL and not _shutdown.is_set():
             logger.info("Starting scheduled opportunity scan")
-            scan_thread = threading.Thread(target=scan_for_opportunities)
-            scan_thread.daemon = True
-            scan_thread.start()
+            scan_future = _executor.submit(scan_for_opportunities)
             last_opportunity_scan = current_time
             
-            # Save opportunities after scan
-            save_opportunities_to_file()
+            # Save opportunities once the scan has finished
+            scan_future.add_done_callback(lambda _: save_opportunities_to_file())
         
-        # Sleep to avoid high CPU usage
-        time.sleep(1)
+        # Sleep until the next scheduled action, or until shutdown is requested
+        next_wake = min(
+            last_headline_update + REFRESH_INTERVAL,
+            last_opportunity_scan + OPPORTUNITY_SCAN_INTERVAL
+        ) - time.time()
+        if _shutdown.wait(max(next_wake, 0)):
+            break
+    
+    # Drop queued jobs and let running ones finish (interpretation stops between
+    # batches once _shutdown is set), so no submit can race a closed executor
+    _executor.shutdown(wait=True, cancel_futures=True)
+    
+    # Save opportunities before exiting
+    save_opportunities_to_file()
+    logger.info("News monitor stopped")
 
 if __name__ == "__main__":
     try:
@@ -474,7 +591,8 @@ if __name__ == "__main__":
         main()
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Exiting News Monitor...{Style.RESET_ALL}")
-        running = False
+        _shutdown.set()
+        _executor.shutdown(wait=True, cancel_futures=True)
         # Save opportunities before exiting
         save_opportunities_to_file()
         logger.info("Program terminated by user") 
\ No newline at end of file
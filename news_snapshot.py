@@ -11,23 +11,92 @@ import os
 import datetime
 import json
 import argparse
-from typing import List, Dict, Any
+from operator import itemgetter
+import atexit
+import hashlib
+import shelve
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from rss_ingestor import fetch_rss_headlines, FINANCIAL_FEEDS
-from llm_event_classifier import classify_macro_event
+from llm_event_classifier import classify_macro_events_batch, FALLBACK_KEY
+from macro_data_collector import get_fred_data
 from colorama import init, Fore, Style
+import numpy as np
+import orjson
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Semantic cache tier is skipped without it
+    SentenceTransformer = None
 
 # Initialize colorama for cross-platform colored terminal output
 init()
 
+# Precomputed display strings for the per-headline print path
+_RESET = Style.RESET_ALL
+_C_HEAD = Fore.CYAN + "========== FINANCIAL NEWS SNAPSHOT ==========" + _RESET
+_C_RULE = Fore.CYAN + "============================================" + _RESET + "\n"
+_C_SOURCES = Fore.YELLOW + "News Sources:" + _RESET
+_C_HEADLINES = Fore.YELLOW + "Latest Headlines:" + _RESET
+_C_NUM = Fore.GREEN + "{}." + _RESET + " {}"
+_C_META = "   " + Fore.BLUE + "{} | {}" + _RESET
+_C_ANALYSIS = "   " + Fore.MAGENTA + "LLM Analysis:" + _RESET
+_C_NO_ANALYSIS = "   " + Fore.RED + "No LLM analysis available" + _RESET
+_C_EVENT = Fore.YELLOW + "{}" + _RESET
+_C_SECTOR = Fore.CYAN + "{}" + _RESET
+_C_SENTIMENT = {
+    "Bullish": Fore.GREEN + "Bullish" + _RESET,
+    "Bearish": Fore.RED + "Bearish" + _RESET,
+}
+
 # Configuration
 MAX_HEADLINES = 10  # Number of headlines to display
+MAX_LLM_WORKERS = 10  # Maximum concurrent LLM classification calls
+LLM_BATCH_SIZE = 10  # Headlines classified per LLM call
+
+CACHE_DIR = ".news_cache"  # On-disk cache of LLM classifications across runs
+CLASSIFICATION_TTL = 86400  # Seconds a cached classification stays valid (24h)
+
+# Serializes colored console output between the main thread and LLM workers
+print_lock = threading.Lock()
+
+# In-process classification cache; the shelve store under CACHE_DIR persists it across runs
+_classification_cache: Dict[str, Dict[str, Any]] = {}
+_cache_lock = threading.Lock()  # shelve is not safe for concurrent access
+_classification_db: Optional[shelve.Shelf] = None  # Opened once per run by _get_classification_db
 
-def format_time_ago(timestamp_str: str) -> str:
-    """Convert ISO timestamp to a human-readable 'X minutes ago' format."""
+# Semantic cache: near-duplicate titles (same story, different feed wording) reuse a classification
+SEMANTIC_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.88  # Minimum cosine similarity to reuse a cached classification
+SEMANTIC_INDEX_FILE = os.path.join(CACHE_DIR, "sem.npz")
+SEMANTIC_MAX_ENTRIES = 5000  # Newest rows kept when the index is saved
+_semantic_lock = threading.Lock()
+_embedding_model = None  # Loaded on first use by _get_embedding_model
+_embedding_model_lock = threading.Lock()
+_semantic_embeddings: Optional[np.ndarray] = None  # [N, dim] int8-quantized normalized title embeddings
+_semantic_scales: Optional[np.ndarray] = None  # [N] float32 per-row dequantization scales
+_semantic_matrix: Optional[np.ndarray] = None  # [N, dim] float32 dequantized rows, rebuilt only when the index changes
+_semantic_timestamps: Optional[np.ndarray] = None  # [N] float64 time.time() each row was classified
+_semantic_classifications: List[Dict[str, Any]] = []  # Parallel to _semantic_embeddings rows
+_semantic_pending: List[Tuple[np.ndarray, np.ndarray, float]] = []  # Rows added since the last flush
+_semantic_loaded = False
+
+def format_time_ago(timestamp_str: str, now: Optional[datetime.datetime] = None) -> str:
+    """
+    Convert ISO timestamp to a human-readable 'X minutes ago' format.
+    
+    Pass now (an aware UTC datetime) to reuse one reference time across many calls.
+    """
     try:
-        timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%SZ")
-        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
-        now = datetime.datetime.now(datetime.timezone.utc)
+        if timestamp_str.endswith("Z"):
+            timestamp_str = timestamp_str[:-1] + "+00:00"
+        timestamp = datetime.datetime.fromisoformat(timestamp_str)
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+        if now is None:
+            now = datetime.datetime.now(datetime.timezone.utc)
         
         delta = now - timestamp
         
@@ -44,18 +113,304 @@ def format_time_ago(timestamp_str: str) -> str:
     except Exception:
         return "unknown time"
 
-def interpret_headline(headline: Dict[str, Any]) -> Dict[str, Any]:
-    """Use LLM to interpret a headline."""
+def warm_macro_cache() -> None:
+    """Prefetch FRED data so the per-headline classifier calls hit a warm cache."""
     try:
-        classification = classify_macro_event(headline)
-        
+        get_fred_data()
+    except Exception as e:
+        with print_lock:
+            print(f"{Fore.RED}Error prefetching macro data: {str(e)}{Style.RESET_ALL}")
+
+def classification_cache_key(headline: Dict[str, Any]) -> str:
+    """Key a headline by its title so republished stories share one classification."""
+    return hashlib.sha256(headline.get('title', '').encode('utf-8')).hexdigest()
+
+def _get_classification_db() -> shelve.Shelf:
+    """
+    Open the on-disk classification cache once per run (caller holds _cache_lock).
+    
+    Expired entries are dropped on open. Deleting keys doesn't shrink every dbm
+    backend, so when anything has expired the file is rewritten with just the
+    live entries.
+    """
+    global _classification_db
+    if _classification_db is None:
+        path = os.path.join(CACHE_DIR, "classifications")
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        db = shelve.open(path)
+        now = time.time()
+        live = {}
+        expired = 0
+        for key in list(db.keys()):
+            try:
+                entry = db[key]
+            except Exception:  # Unreadable entry; drop it with the expired ones
+                expired += 1
+                continue
+            if now - entry[0] < CLASSIFICATION_TTL:
+                live[key] = entry
+            else:
+                expired += 1
+        if expired:
+            db.close()
+            db = shelve.open(path, flag="n")
+            db.update(live)
+        _classification_db = db
+    return _classification_db
+
+def close_classification_cache() -> None:
+    """Flush and close the on-disk classification cache."""
+    global _classification_db
+    with _cache_lock:
+        if _classification_db is not None:
+            _classification_db.close()
+            _classification_db = None
+
+atexit.register(close_classification_cache)
+
+def get_cached_classification(key: str) -> Optional[Dict[str, Any]]:
+    """Return an unexpired cached classification, checking memory before disk."""
+    with _cache_lock:
+        if key in _classification_cache:
+            return _classification_cache[key]
+        try:
+            entry = _get_classification_db().get(key)
+        except Exception:
+            return None
+        if entry and time.time() - entry[0] < CLASSIFICATION_TTL:
+            _classification_cache[key] = entry[1]
+            return entry[1]
+    return None
+
+def set_cached_classification(key: str, classification: Dict[str, Any],
+                              cached_at: Optional[float] = None) -> None:
+    """
+    Store a classification in memory and on disk.
+    
+    cached_at (default now) is when the classification was produced; the TTL
+    counts from it, so entries copied from another cache keep their age.
+    """
+    with _cache_lock:
+        _classification_cache[key] = classification
+        try:
+            _get_classification_db()[key] = (time.time() if cached_at is None else cached_at, classification)
+        except Exception as e:
+            print(f"{Fore.RED}Error writing classification cache: {str(e)}{Style.RESET_ALL}")
+
+def _get_embedding_model():
+    """Load the sentence-transformer once per process, even when lookup workers race on a cold start."""
+    global _embedding_model
+    if _embedding_model is None:
+        with _embedding_model_lock:
+            if _embedding_model is None:
+                _embedding_model = SentenceTransformer(SEMANTIC_MODEL_NAME)
+    return _embedding_model
+
+def quantize_embeddings(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Symmetrically quantize float embeddings to int8 with one scale per row.
+    
+    Returns:
+        (int8 matrix, float32 scales) such that embeddings ~= int8 * scale[:, None]
+    """
+    embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+    scales = np.abs(embeddings).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    quantized = np.round(embeddings / scales[:, np.newaxis]).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+def dequantize_embeddings(quantized: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Inverse of quantize_embeddings: float32 rows equal to int8 * scale[:, None]."""
+    return quantized.astype(np.float32) * scales[:, np.newaxis]
+
+def _load_semantic_index() -> None:
+    """Load the persisted semantic index on first use (caller holds _semantic_lock)."""
+    global _semantic_embeddings, _semantic_scales, _semantic_timestamps, _semantic_classifications, _semantic_loaded
+    global _semantic_matrix
+    _semantic_loaded = True
+    try:
+        with np.load(SEMANTIC_INDEX_FILE) as data:
+            if "scales" in data:
+                embeddings, scales = data["embeddings"], data["scales"]
+            else:  # Float index written before quantization
+                embeddings, scales = quantize_embeddings(data["embeddings"])
+            if "timestamps" in data:
+                timestamps = data["timestamps"]
+            else:  # Index written before per-row timestamps; age rows from the file
+                timestamps = np.full(len(embeddings), os.path.getmtime(SEMANTIC_INDEX_FILE))
+            _semantic_embeddings, _semantic_scales, _semantic_timestamps = embeddings, scales, timestamps
+            _semantic_matrix = dequantize_embeddings(embeddings, scales)
+            # Rows queued before the load stay pending and are flushed after the loaded ones
+            _semantic_classifications = [json.loads(c) for c in data["classifications"]] + _semantic_classifications
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"{Fore.RED}Error loading semantic cache: {str(e)}{Style.RESET_ALL}")
+
+def embed_title(title: str) -> Optional[np.ndarray]:
+    """Return a normalized embedding of the title, or None if the semantic cache is unavailable."""
+    if SentenceTransformer is None or not title:
+        return None
+    try:
+        return _get_embedding_model().encode([title], normalize_embeddings=True)[0]
+    except Exception as e:
+        print(f"{Fore.RED}Error embedding headline: {str(e)}{Style.RESET_ALL}")
+        return None
+
+def _flush_semantic_pending() -> None:
+    """Fold rows added since the last flush into the index arrays in one copy (caller holds _semantic_lock)."""
+    global _semantic_embeddings, _semantic_scales, _semantic_timestamps, _semantic_matrix
+    if not _semantic_pending:
+        return
+    rows, scales, timestamps = zip(*_semantic_pending)
+    _semantic_pending.clear()
+    new_rows, new_scales = np.concatenate(rows), np.concatenate(scales)
+    new_matrix = dequantize_embeddings(new_rows, new_scales)
+    new_timestamps = np.array(timestamps)
+    if _semantic_embeddings is not None:
+        new_rows = np.concatenate([_semantic_embeddings, new_rows])
+        new_scales = np.concatenate([_semantic_scales, new_scales])
+        new_matrix = np.concatenate([_semantic_matrix, new_matrix])
+        new_timestamps = np.concatenate([_semantic_timestamps, new_timestamps])
+    _semantic_embeddings, _semantic_scales = new_rows, new_scales
+    _semantic_matrix, _semantic_timestamps = new_matrix, new_timestamps
+
+def find_semantic_match(embedding: np.ndarray) -> Optional[Tuple[Dict[str, Any], float]]:
+    """
+    Find the most similar unexpired cached title above SEMANTIC_THRESHOLD.
+    
+    Returns:
+        (classification, time it was classified) or None
+    """
+    with _semantic_lock:
+        if not _semantic_loaded:
+            _load_semantic_index()
+        _flush_semantic_pending()
+        if _semantic_embeddings is None or not len(_semantic_embeddings):
+            return None
+        # One float32 GEMV against the dequantized working matrix; no per-query copy of the index
+        q, q_scale = quantize_embeddings(embedding)
+        sims = _semantic_matrix @ dequantize_embeddings(q, q_scale)[0]
+        sims[time.time() - _semantic_timestamps >= CLASSIFICATION_TTL] = -np.inf
+        best = int(sims.argmax())
+        if sims[best] > SEMANTIC_THRESHOLD:
+            return _semantic_classifications[best], float(_semantic_timestamps[best])
+    return None
+
+def add_semantic_entry(embedding: np.ndarray, classification: Dict[str, Any]) -> None:
+    """Queue a title embedding and its classification for the semantic index."""
+    row, scale = quantize_embeddings(embedding)
+    with _semantic_lock:
+        _semantic_pending.append((row, scale, time.time()))
+        _semantic_classifications.append(classification)
+
+def save_semantic_index() -> None:
+    """Persist the unexpired semantic index, capped to the newest SEMANTIC_MAX_ENTRIES rows."""
+    global _semantic_embeddings, _semantic_scales, _semantic_timestamps, _semantic_classifications, _semantic_matrix
+    with _semantic_lock:
+        if not _semantic_loaded:
+            _load_semantic_index()
+        _flush_semantic_pending()
+        if _semantic_embeddings is None:
+            return
+        keep = np.flatnonzero(time.time() - _semantic_timestamps < CLASSIFICATION_TTL)
+        keep = keep[np.argsort(_semantic_timestamps[keep], kind="stable")[-SEMANTIC_MAX_ENTRIES:]]
+        keep.sort()
+        _semantic_embeddings = _semantic_embeddings[keep]
+        _semantic_scales = _semantic_scales[keep]
+        _semantic_matrix = _semantic_matrix[keep]
+        _semantic_timestamps = _semantic_timestamps[keep]
+        _semantic_classifications = [_semantic_classifications[i] for i in keep]
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            np.savez(
+                SEMANTIC_INDEX_FILE,
+                embeddings=_semantic_embeddings,
+                scales=_semantic_scales,
+                timestamps=_semantic_timestamps,
+                classifications=np.array([json.dumps(c, default=str) for c in _semantic_classifications])
+            )
+        except Exception as e:
+            print(f"{Fore.RED}Error saving semantic cache: {str(e)}{Style.RESET_ALL}")
+
+def lookup_cached_classification(headline: Dict[str, Any]) -> Tuple[str, Optional[np.ndarray], Optional[Dict[str, Any]]]:
+    """
+    Check the exact title cache, then the semantic (near-duplicate) cache.
+    
+    Returns:
+        (cache key, title embedding or None, cached classification or None)
+    """
+    key = classification_cache_key(headline)
+    classification = get_cached_classification(key)
+    embedding = None
+    if classification is None:
+        embedding = embed_title(headline.get('title', ''))
+        if embedding is not None:
+            match = find_semantic_match(embedding)
+            if match is not None:
+                # Keep the matched entry's age so a near-duplicate can't extend its TTL
+                classification, cached_at = match
+                set_cached_classification(key, classification, cached_at)
+    return key, embedding, classification
+
+def store_classification(key: str, embedding: Optional[np.ndarray], classification: Dict[str, Any]) -> None:
+    """Add a fresh LLM classification to both caches (keyword-rule fallbacks are not cached)."""
+    if classification.get(FALLBACK_KEY):
+        return
+    if embedding is not None:
+        add_semantic_entry(embedding, classification)
+    set_cached_classification(key, classification)
+
+def interpret_headlines(headlines: List[Dict[str, Any]], executor: ThreadPoolExecutor,
+                        on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Interpret a list of headlines, sending every cache miss to the LLM in
+    batched calls of up to LLM_BATCH_SIZE headlines.
+    
+    Cache lookups and the batch calls both run on the given executor.
+    Results are returned in the same order as headlines.
+    
+    Args:
+        headlines: Headlines to interpret
+        executor: Pool used for cache lookups and LLM batch calls
+        on_result: Optional callback invoked with each interpreted headline as
+            soon as it is available (cache hits first, then each LLM batch)
+    """
+    interpreted: List[Optional[Dict[str, Any]]] = [None] * len(headlines)
+    
+    def finish(i: int, classification: Dict[str, Any]) -> None:
         # Add the classification to the headline
-        headline_with_classification = headline.copy()
+        headline_with_classification = headlines[i].copy()
         headline_with_classification.update(classification)
-        return headline_with_classification
-    except Exception as e:
-        print(f"{Fore.RED}Error interpreting headline: {str(e)}{Style.RESET_ALL}")
-        return headline
+        interpreted[i] = headline_with_classification
+        if on_result is not None:
+            on_result(headline_with_classification)
+    
+    lookups = list(executor.map(lookup_cached_classification, headlines))
+    misses = []
+    for i, (_, _, classification) in enumerate(lookups):
+        if classification is None:
+            misses.append(i)
+        else:
+            finish(i, classification)
+    chunks = [misses[start:start + LLM_BATCH_SIZE] for start in range(0, len(misses), LLM_BATCH_SIZE)]
+    
+    def classify_chunk(indices: List[int]) -> List[Dict[str, Any]]:
+        try:
+            return classify_macro_events_batch([headlines[i] for i in indices])
+        except Exception as e:
+            with print_lock:
+                print(f"{Fore.RED}Error interpreting headlines: {str(e)}{Style.RESET_ALL}")
+            return [{} for _ in indices]
+    
+    for indices, classifications in zip(chunks, executor.map(classify_chunk, chunks)):
+        for i, classification in zip(indices, classifications):
+            if classification:
+                key, embedding, _ = lookups[i]
+                store_classification(key, embedding, classification)
+            finish(i, classification or {})
+    
+    return interpreted
 
 def save_to_json(headlines: List[Dict[str, Any]], filename: str) -> None:
     """Save headlines with LLM analysis to a JSON file."""
@@ -63,74 +418,105 @@ def save_to_json(headlines: List[Dict[str, Any]], filename: str) -> None:
         # Create output directory if it doesn't exist
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(headlines, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(headlines, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             
         print(f"{Fore.GREEN}Successfully saved {len(headlines)} headlines to {filename}{Style.RESET_ALL}")
     except Exception as e:
         print(f"{Fore.RED}Error saving JSON file: {str(e)}{Style.RESET_ALL}")
 
+def open_ndjson_writer(filename: str) -> Tuple[Any, Callable[[Dict[str, Any]], None]]:
+    """
+    Open an NDJSON file and return (file, write_fn).
+    
+    write_fn appends one headline per line and flushes, so every completed
+    classification is on disk even if the run is interrupted.
+    """
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    f = open(filename, 'wb')
+    
+    def write(headline: Dict[str, Any]) -> None:
+        f.write(orjson.dumps(headline, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+        f.flush()
+    
+    return f, write
+
+def convert_ndjson_to_json(ndjson_filename: str, json_filename: str) -> None:
+    """Rewrite an NDJSON snapshot as a single JSON array and remove the NDJSON file."""
+    try:
+        with open(ndjson_filename, 'rb') as f:
+            headlines = [orjson.loads(line) for line in f if line.strip()]
+        save_to_json(headlines, json_filename)
+        os.remove(ndjson_filename)
+    except Exception as e:
+        print(f"{Fore.RED}Error converting {ndjson_filename} to JSON: {str(e)}{Style.RESET_ALL}")
+
 def save_to_text(headlines: List[Dict[str, Any]], filename: str) -> None:
     """Save headlines with LLM analysis to a plain text file."""
     try:
         # Create output directory if it doesn't exist
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write("========== FINANCIAL NEWS SNAPSHOT ==========\n")
-            f.write(f"Showing {len(headlines)} headlines from {len(FINANCIAL_FEEDS)} news sources\n")
-            f.write(f"Generated at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("============================================\n\n")
+        out: List[str] = []
+        
+        # Write header
+        out.append("========== FINANCIAL NEWS SNAPSHOT ==========\n")
+        out.append(f"Showing {len(headlines)} headlines from {len(FINANCIAL_FEEDS)} news sources\n")
+        out.append(f"Generated at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        out.append("============================================\n\n")
+        
+        # Write news sources
+        out.append("News Sources:\n")
+        for i, feed in enumerate(FINANCIAL_FEEDS, 1):
+            out.append(f"  {i}. {feed['source']}\n")
+        out.append("\n")
+        
+        # Write headlines
+        out.append("Latest Headlines:\n")
+        
+        for i, headline in enumerate(headlines, 1):
+            time_str = headline.get('published', '')
+            source = headline.get('source', 'Unknown')
             
-            # Write news sources
-            f.write("News Sources:\n")
-            for i, feed in enumerate(FINANCIAL_FEEDS, 1):
-                f.write(f"  {i}. {feed['source']}\n")
-            f.write("\n")
+            # Write headline
+            out.append(f"{i}. {headline['title']}\n")
+            out.append(f"   {time_str} | {source}\n")
             
-            # Write headlines
-            f.write("Latest Headlines:\n")
+            # Write LLM analysis
+            event_type = headline.get('event_type')
+            sentiment = headline.get('sentiment')
+            sector = headline.get('sector')
             
-            for i, headline in enumerate(headlines, 1):
-                time_str = headline.get('published', '')
-                source = headline.get('source', 'Unknown')
-                
-                # Write headline
-                f.write(f"{i}. {headline['title']}\n")
-                f.write(f"   {time_str} | {source}\n")
+            if event_type or sentiment or sector:
+                out.append(f"   LLM Analysis: ")
                 
-                # Write LLM analysis
-                event_type = headline.get('event_type')
-                sentiment = headline.get('sentiment')
-                sector = headline.get('sector')
+                if event_type:
+                    out.append(f"{event_type}")
+                    if sentiment or sector:
+                        out.append(" | ")
                 
-                if event_type or sentiment or sector:
-                    f.write(f"   LLM Analysis: ")
-                    
-                    if event_type:
-                        f.write(f"{event_type}")
-                        if sentiment or sector:
-                            f.write(" | ")
-                    
-                    if sentiment:
-                        f.write(f"{sentiment}")
-                        if sector:
-                            f.write(" | ")
-                    
+                if sentiment:
+                    out.append(f"{sentiment}")
                     if sector:
-                        f.write(f"{sector}")
-                    
-                    f.write("\n")
-                else:
-                    f.write("   No LLM analysis available\n")
-                
-                # Add link
-                if headline.get('link'):
-                    f.write(f"   URL: {headline['link']}\n")
+                        out.append(" | ")
                 
-                f.write("\n")  # Empty line between headlines
+                if sector:
+                    out.append(f"{sector}")
                 
+                out.append("\n")
+            else:
+                out.append("   No LLM analysis available\n")
+            
+            # Add link
+            if headline.get('link'):
+                out.append(f"   URL: {headline['link']}\n")
+            
+            out.append("\n")  # Empty line between headlines
+        
+        # Write everything in one call
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("".join(out))
+        
         print(f"{Fore.GREEN}Successfully saved {len(headlines)} headlines to {filename}{Style.RESET_ALL}")
     except Exception as e:
         print(f"{Fore.RED}Error saving text file: {str(e)}{Style.RESET_ALL}")
@@ -142,6 +528,7 @@ def main():
     parser.add_argument('--save', action='store_true', help='Save results to files')
     parser.add_argument('--count', type=int, default=MAX_HEADLINES, help=f'Number of headlines to display (default: {MAX_HEADLINES})')
     parser.add_argument('--output-dir', type=str, default='news_data', help='Directory to save output files (default: news_data)')
+    parser.add_argument('--strict-json', action='store_true', help='With --save, rewrite the streamed NDJSON output as a JSON array')
     args = parser.parse_args()
     
     # Update MAX_HEADLINES if provided
@@ -149,48 +536,72 @@ def main():
     
     print(f"{Fore.YELLOW}Fetching financial news headlines...{Style.RESET_ALL}")
     
+    # One pool for the whole run: the RSS fetch and FRED prefetch overlap,
+    # then the same workers handle LLM interpretation
+    executor = ThreadPoolExecutor(max_workers=MAX_LLM_WORKERS)
+    rss_future = executor.submit(fetch_rss_headlines)
+    executor.submit(warm_macro_cache)
+    
     # Fetch headlines
-    all_headlines = fetch_rss_headlines()
+    all_headlines = rss_future.result()
     
     if not all_headlines:
+        executor.shutdown(wait=False)
         print(f"{Fore.RED}No headlines found. Check your internet connection or RSS feeds.{Style.RESET_ALL}")
         return
     
-    # Sort by published date (newest first)
-    all_headlines.sort(key=lambda h: h.get('published', ''), reverse=True)
+    # Sort by published date (newest first); undated headlines keep their order at the tail
+    dated = [h for h in all_headlines if h.get('published')]
+    dated.sort(key=itemgetter('published'), reverse=True)
+    all_headlines = dated + [h for h in all_headlines if not h.get('published')]
     
     # Take only the most recent headlines
     latest_headlines = all_headlines[:max_count]
     
     # Print header
-    print(f"{Fore.CYAN}========== FINANCIAL NEWS SNAPSHOT =========={Style.RESET_ALL}")
+    print(_C_HEAD)
     print(f"Showing {len(latest_headlines)} headlines from {len(FINANCIAL_FEEDS)} news sources")
     print(f"Generated at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{Fore.CYAN}============================================{Style.RESET_ALL}\n")
+    print(_C_RULE)
     
     # Print news sources
-    print(f"{Fore.YELLOW}News Sources:{Style.RESET_ALL}")
+    print(_C_SOURCES)
     for i, feed in enumerate(FINANCIAL_FEEDS, 1):
         print(f"  {i}. {feed['source']}")
     print()
     
     # Process and display headlines
-    print(f"{Fore.YELLOW}Latest Headlines:{Style.RESET_ALL}")
+    print(_C_HEADLINES)
+    print(f"{Fore.MAGENTA}Analyzing {len(latest_headlines)} headlines with LLM...{Style.RESET_ALL}\n")
+    
+    # Interpret cache misses in batched LLM calls, then display the results in order
+    # With --save, stream each classification to NDJSON as it completes
+    ndjson_file = None
+    on_result = None
+    if args.save:
+        # Generate timestamp for filenames
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        ndjson_filename = os.path.join(args.output_dir, f"news_snapshot_{timestamp}.ndjson")
+        try:
+            ndjson_file, on_result = open_ndjson_writer(ndjson_filename)
+        except Exception as e:
+            print(f"{Fore.RED}Error opening NDJSON file: {str(e)}{Style.RESET_ALL}")
     
-    interpreted_headlines = []
+    with executor:
+        try:
+            interpreted_headlines = interpret_headlines(latest_headlines, executor, on_result)
+        finally:
+            if ndjson_file is not None:
+                ndjson_file.close()
     
-    for i, headline in enumerate(latest_headlines, 1):
-        time_ago = format_time_ago(headline.get('published', ''))
+    now = datetime.datetime.now(datetime.timezone.utc)
+    for i, (headline, interpreted) in enumerate(zip(latest_headlines, interpreted_headlines), 1):
+        time_ago = format_time_ago(headline.get('published', ''), now)
         source = headline.get('source', 'Unknown')
         
         # Print headline with number, time, and source
-        print(f"{Fore.GREEN}{i}.{Style.RESET_ALL} {headline['title']}")
-        print(f"   {Fore.BLUE}{time_ago} | {source}{Style.RESET_ALL}")
-        
-        # Interpret headline with LLM
-        print(f"   {Fore.MAGENTA}Analyzing with LLM...{Style.RESET_ALL}")
-        interpreted = interpret_headline(headline)
-        interpreted_headlines.append(interpreted)
+        print(_C_NUM.format(i, headline['title']))
+        print(_C_META.format(time_ago, source))
         
         # Display interpretation
         event_type = interpreted.get('event_type')
@@ -198,40 +609,45 @@ def main():
         sector = interpreted.get('sector')
         
         if event_type or sentiment or sector:
-            print(f"   {Fore.MAGENTA}LLM Analysis:{Style.RESET_ALL}", end=" ")
+            print(_C_ANALYSIS, end=" ")
             
             if event_type:
-                print(f"{Fore.YELLOW}{event_type}{Style.RESET_ALL}", end=" | ")
+                print(_C_EVENT.format(event_type), end=" | ")
             
             if sentiment:
                 # Color-code the sentiment
-                sentiment_color = Fore.GREEN if sentiment == "Bullish" else Fore.RED if sentiment == "Bearish" else Fore.YELLOW
-                print(f"{sentiment_color}{sentiment}{Style.RESET_ALL}", end=" | ")
+                print(_C_SENTIMENT.get(sentiment) or Fore.YELLOW + sentiment + _RESET, end=" | ")
             
             if sector:
-                print(f"{Fore.CYAN}{sector}{Style.RESET_ALL}", end="")
+                print(_C_SECTOR.format(sector), end="")
             
             print()  # End the line
         else:
-            print(f"   {Fore.RED}No LLM analysis available{Style.RESET_ALL}")
+            print(_C_NO_ANALYSIS)
         
         print()  # Empty line between headlines
     
     # Save results if requested
     if args.save:
-        # Generate timestamp for filenames
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        
         # Create output directory
         output_dir = args.output_dir
         
-        # Save as JSON
-        json_filename = os.path.join(output_dir, f"news_snapshot_{timestamp}.json")
-        save_to_json(interpreted_headlines, json_filename)
+        if ndjson_file is not None:
+            print(f"{Fore.GREEN}Streamed {len(interpreted_headlines)} headlines to {ndjson_filename}{Style.RESET_ALL}")
+            if args.strict_json:
+                json_filename = os.path.join(output_dir, f"news_snapshot_{timestamp}.json")
+                convert_ndjson_to_json(ndjson_filename, json_filename)
+        else:
+            # Streaming could not start; fall back to a one-shot JSON file
+            json_filename = os.path.join(output_dir, f"news_snapshot_{timestamp}.json")
+            save_to_json(interpreted_headlines, json_filename)
         
         # Save as text
         text_filename = os.path.join(output_dir, f"news_snapshot_{timestamp}.txt")
         save_to_text(interpreted_headlines, text_filename)
+    
+    # Persist near-duplicate lookups for the next run
+    save_semantic_index()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -18,6 +18,10 @@ How to Use:
 2. Access specific metrics:
    atm_iv = options_data["IV_atm"]
    skew = options_data["IV_skew"]
+
+3. Get snapshots for a basket of tickers in parallel:
+   from options_data_collector import get_options_snapshots
+   snapshots = get_options_snapshots(["AAPL", "MSFT", "SPY"])
    
 What This Helps You See:
 -----------------------
@@ -35,14 +39,59 @@ import warnings
 from typing import Dict, Any, Optional, List, Tuple
 import time
 import math
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 
 # Constants
 DEFAULT_EXP_WINDOW = 30  # Default expiration window (days)
 DEFAULT_OTM_PCT = 0.05   # Default OTM percentage (5%)
 CACHE_TIMEOUT = 300      # Cache timeout in seconds (5 minutes)
+CHAIN_CACHE_TIMEOUT = 60 # Raw option chain cache timeout in seconds
+
+OPTIONS_CACHE_SIZE = 1024  # Maximum cached snapshots before least-recently-used eviction
+
+# Cache for options data to avoid excessive API calls (bounded, entries expire after CACHE_TIMEOUT)
+_options_cache = TTLCache(maxsize=OPTIONS_CACHE_SIZE, ttl=CACHE_TIMEOUT)
+_options_lock = threading.Lock()  # TTLCache is not thread-safe on its own
+
+# Raw option chains keyed by (ticker, expiration) -> (calls, puts), so snapshots
+# with different exp_window/otm_pct for one ticker share a single fetch
+_chain_cache = TTLCache(maxsize=256, ttl=CHAIN_CACHE_TIMEOUT)
+_chain_lock = threading.Lock()
+
+# One HTTP session shared by every Ticker so connections (and TLS handshakes) are
+# reused across the .options, .fast_info and .option_chain calls. Recent yfinance
+# only accepts curl_cffi sessions; without curl_cffi, yfinance picks its own.
+try:
+    from curl_cffi import requests as curl_requests
+    yf_session = curl_requests.Session(impersonate="chrome")
+except ImportError:
+    yf_session = None
+
+@functools.lru_cache(maxsize=256)
+def _get_ticker(ticker: str, time_bucket: int) -> yf.Ticker:
+    """
+    Return a reusable yfinance Ticker.
+    
+    Ticker objects cache expirations and quote data internally, so time_bucket
+    (time.time() // CACHE_TIMEOUT) rolls them over to keep prices fresh.
+    """
+    return yf.Ticker(ticker, session=yf_session)
 
-# Cache for options data to avoid excessive API calls
-_options_cache = {}
+def _get_option_chain(stock: yf.Ticker, ticker: str, expiration: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Fetch (calls, puts) for one expiration, reusing a chain fetched within CHAIN_CACHE_TIMEOUT."""
+    key = (ticker, expiration)
+    with _chain_lock:
+        entry = _chain_cache.get(key)
+    if entry is not None:
+        return entry
+    
+    options = stock.option_chain(expiration)
+    with _chain_lock:
+        _chain_cache[key] = (options.calls, options.puts)
+    return options.calls, options.puts
 
 def get_options_snapshot(ticker: str, exp_window: int = DEFAULT_EXP_WINDOW, 
                          otm_pct: float = DEFAULT_OTM_PCT, use_cache: bool = True) -> Dict[str, Any]:
@@ -67,16 +116,15 @@ def get_options_snapshot(ticker: str, exp_window: int = DEFAULT_EXP_WINDOW,
             "open_interest_change": Int (change in open interest from previous period)
         }
     """
-    global _options_cache
-    
     # Check cache first if enabled
     cache_key = f"{ticker}_{exp_window}_{otm_pct}"
     current_time = time.time()
     
-    if use_cache and cache_key in _options_cache:
-        cache_entry = _options_cache[cache_key]
-        if current_time - cache_entry["timestamp"] < CACHE_TIMEOUT:
-            return cache_entry["data"]
+    if use_cache:
+        with _options_lock:
+            cached = _options_cache.get(cache_key)
+        if cached is not None:
+            return cached
     
     # Initialize empty results dictionary with default values
     result = {
@@ -91,10 +139,19 @@ def get_options_snapshot(ticker: str, exp_window: int = DEFAULT_EXP_WINDOW,
     
     try:
         # Get the stock data
-        stock = yf.Ticker(ticker)
+        stock = _get_ticker(ticker, int(current_time // CACHE_TIMEOUT))
         
-        # Get current stock price
-        current_price = stock.info.get("regularMarketPrice", stock.info.get("previousClose"))
+        # Get current stock price (fast_info avoids the full .info scrape)
+        try:
+            current_price = getattr(stock.fast_info, 'last_price', None) or getattr(stock.fast_info, 'previous_close', None)
+        except Exception:
+            current_price = None
+        if not current_price:
+            try:
+                info = stock.info
+                current_price = info.get("regularMarketPrice", info.get("previousClose"))
+            except Exception:
+                current_price = None
         if not current_price:
             warnings.warn(f"Could not get current price for {ticker}")
             return result
@@ -107,32 +164,35 @@ def get_options_snapshot(ticker: str, exp_window: int = DEFAULT_EXP_WINDOW,
             warnings.warn(f"No options data available for {ticker}")
             return result
         
-        # Convert to datetime objects and find closest to target
-        exp_datetime = [datetime.datetime.strptime(date, '%Y-%m-%d') for date in expiration_dates]
-        closest_exp = min(exp_datetime, key=lambda x: abs((x - target_date).days))
-        closest_exp_str = closest_exp.strftime('%Y-%m-%d')
+        # Find the expiration closest to target
+        closest_exp_str = find_closest_expiration(expiration_dates, target_date)
         
         # Get options chain for the closest expiration date
-        options = stock.option_chain(closest_exp_str)
-        calls = options.calls
-        puts = options.puts
+        calls, puts = _get_option_chain(stock, ticker, closest_exp_str)
         
-        # Calculate target strikes for ATM and OTM options
-        atm_strike = find_closest_strike(calls, current_price)
-        otm_call_strike = find_closest_strike(calls, current_price * (1 + otm_pct))
-        otm_put_strike = find_closest_strike(puts, current_price * (1 - otm_pct))
+        # Calculate target strikes for ATM and OTM options (one search per side)
+        atm_strike, otm_call_strike = find_closest_strikes(calls, [current_price, current_price * (1 + otm_pct)])
+        otm_put_strike, = find_closest_strikes(puts, [current_price * (1 - otm_pct)])
         
-        # Get implied volatilities
-        atm_iv = get_iv_for_strike(calls, atm_strike)
-        call_otm_iv = get_iv_for_strike(calls, otm_call_strike)
-        put_otm_iv = get_iv_for_strike(puts, otm_put_strike)
+        # Get implied volatilities via one strike -> IV map per side
+        call_iv_map = build_iv_map(calls)
+        put_iv_map = build_iv_map(puts)
+        atm_iv = call_iv_map.get(atm_strike)
+        call_otm_iv = call_iv_map.get(otm_call_strike)
+        put_otm_iv = put_iv_map.get(otm_put_strike)
         
         # Calculate IV skew
         iv_skew = put_otm_iv - call_otm_iv if put_otm_iv and call_otm_iv else None
         
+        # Pull volume and open interest out as numpy arrays once
+        c_vol = column_array(calls, 'volume')
+        p_vol = column_array(puts, 'volume')
+        c_oi = column_array(calls, 'openInterest')
+        p_oi = column_array(puts, 'openInterest')
+        
         # Calculate put-call ratio (based on volume)
-        total_call_volume = calls['volume'].sum() if 'volume' in calls.columns else 0
-        total_put_volume = puts['volume'].sum() if 'volume' in puts.columns else 0
+        total_call_volume = int(np.nansum(c_vol))
+        total_put_volume = int(np.nansum(p_vol))
         
         if total_call_volume > 0:
             put_call_ratio = total_put_volume / total_call_volume
@@ -140,11 +200,7 @@ def get_options_snapshot(ticker: str, exp_window: int = DEFAULT_EXP_WINDOW,
             put_call_ratio = None
         
         # Calculate open interest
-        total_open_interest = (
-            calls['openInterest'].sum() if 'openInterest' in calls.columns else 0
-        ) + (
-            puts['openInterest'].sum() if 'openInterest' in puts.columns else 0
-        )
+        total_open_interest = int(np.nansum(c_oi)) + int(np.nansum(p_oi))
         
         # For open interest change, we'd need historical data which isn't directly available
         # For now, we'll use None or implement a local tracking mechanism in the future
@@ -162,10 +218,8 @@ def get_options_snapshot(ticker: str, exp_window: int = DEFAULT_EXP_WINDOW,
         }
         
         # Update cache
-        _options_cache[cache_key] = {
-            "timestamp": current_time,
-            "data": result
-        }
+        with _options_lock:
+            _options_cache[cache_key] = result
         
         return result
         
@@ -173,6 +227,91 @@ def get_options_snapshot(ticker: str, exp_window: int = DEFAULT_EXP_WINDOW,
         warnings.warn(f"Error fetching options data for {ticker}: {str(e)}")
         return result
 
+def get_options_snapshots(tickers: List[str], **kwargs) -> Dict[str, Dict[str, Any]]:
+    """
+    Get options snapshots for several tickers concurrently.
+    
+    Each ticker needs a few independent yfinance requests, so fetching them on
+    a thread pool bounds wall time by the slowest ticker. Cache access inside
+    get_options_snapshot is lock-guarded, so concurrent calls are safe.
+    
+    Args:
+        tickers: Stock ticker symbols
+        **kwargs: Passed through to get_options_snapshot (exp_window, otm_pct, use_cache)
+        
+    Returns:
+        Dictionary mapping each ticker to its options snapshot
+    """
+    if not tickers:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+        return dict(zip(tickers, executor.map(lambda t: get_options_snapshot(t, **kwargs), tickers)))
+
+def find_closest_expiration(expiration_dates, target_date: datetime.datetime) -> str:
+    """
+    Find the expiration date closest to target_date.
+    
+    Args:
+        expiration_dates: 'YYYY-MM-DD' strings in ascending order, as returned by yfinance
+        target_date: Date to match against
+        
+    Returns:
+        The closest expiration string (the earlier one on a tie)
+    """
+    ts = np.fromiter(
+        (datetime.datetime.strptime(d, '%Y-%m-%d').timestamp() for d in expiration_dates),
+        dtype=np.int64, count=len(expiration_dates)
+    )
+    target = int(target_date.timestamp())
+    i = int(np.searchsorted(ts, target))
+    
+    if i == 0:
+        best = 0
+    elif i == len(ts):
+        best = i - 1
+    else:
+        best = i - 1 if target - ts[i - 1] <= ts[i] - target else i
+    return expiration_dates[best]
+
+def column_array(df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Return a DataFrame column as a float numpy array, or an empty array if it is missing.
+    
+    Missing values become NaN so totals can be taken with np.nansum.
+    """
+    if column not in df.columns:
+        return np.zeros(0)
+    return df[column].to_numpy(dtype=float, na_value=np.nan)
+
+def find_closest_strikes(options_df: pd.DataFrame, target_prices: List[float]) -> List[Optional[float]]:
+    """
+    Find the strike price closest to each target price in a single pass.
+    
+    Uses a binary search on the (sorted) strike column and compares each hit
+    with its lower neighbour; on a tie the lower strike wins.
+    
+    Args:
+        options_df: DataFrame containing options data
+        target_prices: Target prices to find closest strikes to
+        
+    Returns:
+        Closest strike price for each target, in the same order
+    """
+    if 'strike' not in options_df.columns or options_df.empty:
+        return [None] * len(target_prices)
+    
+    strikes = options_df['strike'].to_numpy(dtype=float)
+    if strikes.size > 1 and np.any(strikes[1:] < strikes[:-1]):
+        strikes = np.sort(strikes)
+    
+    targets = np.asarray(target_prices, dtype=float)
+    idx = np.searchsorted(strikes, targets)
+    hi = np.clip(idx, 0, strikes.size - 1)
+    lo = np.clip(idx - 1, 0, strikes.size - 1)
+    best = np.where(np.abs(strikes[lo] - targets) <= np.abs(strikes[hi] - targets), lo, hi)
+    return [float(strike) for strike in strikes[best]]
+
 def find_closest_strike(options_df: pd.DataFrame, target_price: float) -> float:
     """
     Find the strike price closest to the target price.
@@ -187,7 +326,27 @@ def find_closest_strike(options_df: pd.DataFrame, target_price: float) -> float:
     if 'strike' not in options_df.columns or options_df.empty:
         return None
         
-    return options_df.iloc[(options_df['strike'] - target_price).abs().argsort()[0]]['strike']
+    strikes = options_df['strike'].to_numpy()
+    idx = np.abs(strikes - target_price).argmin()
+    return float(strikes[idx])
+
+def build_iv_map(options_df: pd.DataFrame) -> Dict[float, float]:
+    """
+    Map each strike price to its implied volatility (first row wins on duplicates).
+    
+    Args:
+        options_df: DataFrame containing options data
+        
+    Returns:
+        Dictionary of strike -> implied volatility as decimal (not percentage)
+    """
+    if 'strike' not in options_df.columns or 'impliedVolatility' not in options_df.columns:
+        return {}
+    
+    strikes = options_df['strike'].to_numpy()
+    ivs = options_df['impliedVolatility'].to_numpy()
+    # Reverse so the first occurrence of a duplicated strike is the one kept
+    return dict(zip(strikes[::-1], ivs[::-1]))
 
 def get_iv_for_strike(options_df: pd.DataFrame, strike: float) -> Optional[float]:
     """
@@ -200,21 +359,20 @@ def get_iv_for_strike(options_df: pd.DataFrame, strike: float) -> Optional[float
     Returns:
         Implied volatility as decimal (not percentage)
     """
-    if strike is None or 'impliedVolatility' not in options_df.columns:
+    if strike is None:
         return None
-        
-    matching_options = options_df[options_df['strike'] == strike]
-    if matching_options.empty:
-        return None
-        
-    return matching_options.iloc[0]['impliedVolatility']
+    
+    return build_iv_map(options_df).get(strike)
 
 def clear_cache():
     """
     Clear the options data cache.
     """
-    global _options_cache
-    _options_cache = {}
+    with _options_lock:
+        _options_cache.clear()
+    with _chain_lock:
+        _chain_cache.clear()
+    _get_ticker.cache_clear()
 
 def print_options_summary(options_data: Dict[str, Any]) -> None:
     """
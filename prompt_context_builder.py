@@ -33,6 +33,15 @@ import datetime
 from typing import Dict, Any, List, Tuple, Optional
 import math
 import re
+import bisect
+import functools
+import itertools
+import threading
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Constants for economic indicators
 SIGNIFICANT_DELTA_THRESHOLD = {
@@ -47,6 +56,26 @@ SIGNIFICANT_DELTA_THRESHOLD = {
     "DEFAULT": 0.1  # Default threshold for other metrics (10% change)
 }
 
+# Common expected vs. actual patterns to check for economic surprises
+EXPECTATION_PATTERNS = [
+    ("CPI_YoY", "CPI_Expected"),
+    ("CoreCPI", "CoreCPI_Expected"),
+    ("GDP_QoQ", "GDP_Expected"),
+    ("Unemployment", "Unemployment_Expected"),
+    ("NFP", "NFP_Expected"),
+    ("RetailSales", "RetailSales_Expected")
+]
+
+# Surprise threshold for each pattern, aligned with EXPECTATION_PATTERNS
+_EXPECTATION_THRESH = np.array(
+    [SIGNIFICANT_DELTA_THRESHOLD.get(actual_key, SIGNIFICANT_DELTA_THRESHOLD["DEFAULT"])
+     for actual_key, _ in EXPECTATION_PATTERNS],
+    dtype=np.float64
+)
+
+# Matches the first change/delta suffix in a snapshot key (e.g. "VIX_change")
+_CHANGE_FIELD_RE = re.compile(r'_(?:change|delta|Change|Delta)')
+
 # Weights for different economic indicators based on event type
 EVENT_TYPE_WEIGHTS = {
     "Monetary Policy": {
@@ -78,6 +107,31 @@ EVENT_TYPE_WEIGHTS = {
     }
 }
 
+# Market environment buckets: (name, indicator, ascending thresholds, labels)
+MARKET_ENV_BUCKETS = [
+    ("inflation", "CPI_YoY", [2.5, 4.0], ["low-inflation", "moderate-inflation", "high-inflation"]),
+    ("rate", "FedFundsRate", [2.0, 4.0], ["low-rate", "moderate-rate", "high-rate"]),
+    ("volatility", "VIX", [15, 25], ["low-volatility", "moderate-volatility", "high-volatility"])
+]
+
+# Balanced weights used when the event type can't be inferred from tags
+DEFAULT_INDICATOR_WEIGHTS = {
+    "CPI_YoY": 7,
+    "FedFundsRate": 7,
+    "VIX": 7,
+    "Treasury10Y": 6,
+    "GDP_QoQ": 6,
+    "Unemployment": 6
+}
+
+def _rank_by_weight(weights: Dict[str, int]) -> List[str]:
+    """Return indicator names sorted by weight, highest first (ties keep dict order)."""
+    return sorted(weights, key=weights.get, reverse=True)
+
+# Indicators pre-sorted by importance for each weight table
+_RANKED_INDICATORS = {event_type: _rank_by_weight(weights) for event_type, weights in EVENT_TYPE_WEIGHTS.items()}
+_RANKED_DEFAULT_INDICATORS = _rank_by_weight(DEFAULT_INDICATOR_WEIGHTS)
+
 # FOMC meeting schedule (from Federal Reserve website)
 # Format: List of tuples (year, month, day, is_important)
 # is_important indicates meetings with press conferences and updated projections
@@ -102,6 +156,32 @@ FALLBACK_FOMC_SCHEDULE = [
     (2025, 11, 4, True), (2025, 12, 16, True)
 ]
 
+# Patterns for scraping the Federal Reserve FOMC calendar
+_YEAR_RE = re.compile(r'(\d{4})')
+_DATE_RE = re.compile(r'(\w+)\s+(\d+)(?:-\d+)?')
+
+# Month name -> month number, so the scraper avoids strptime per row. Spelled
+# out rather than taken from calendar.month_name, which follows the locale.
+_MONTHS = {
+    name: num for num, name in enumerate(
+        ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+         'August', 'September', 'October', 'November', 'December'], 1)
+}
+
+# Shared HTTP session so calendar scrapes reuse pooled connections
+CALENDAR_TIMEOUT_SECONDS = 10
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+
+# Fallback meeting dates as datetime64[D], aligned with FALLBACK_FOMC_SCHEDULE
+# (which is in chronological order), so the recency filter is one binary search
+_FALLBACK_FOMC_DATES = np.array(
+    [f"{year:04d}-{month:02d}-{day:02d}" for year, month, day, _ in FALLBACK_FOMC_SCHEDULE],
+    dtype="datetime64[D]"
+)
+
 # Cache for FOMC meetings to avoid repeated API calls
 _fomc_cache = None
 _fomc_cache_expiry = None
@@ -110,6 +190,21 @@ _cpi_cache_expiry = None
 _earnings_cache = None
 _earnings_cache_expiry = None
 
+# Locks serializing calendar refreshes so concurrent callers don't duplicate
+# the same HTTP fetch; cache reads stay lock-free
+_fomc_lock = threading.Lock()
+_cpi_lock = threading.Lock()
+_earnings_lock = threading.Lock()
+
+# Sorted view of the FOMC schedule for bisect lookups, rebuilt only when
+# fetch_fomc_meeting_dates hands back a different schedule list.
+# Format: (source schedule, sorted meeting dates, parallel is_important flags)
+_fomc_index = (None, [], [])
+
+# Earnings seasons as ordinals for bisect lookups, rebuilt the same way.
+# Format: (source seasons, sorted start ordinals, running max of end ordinals)
+_earnings_index = (None, [], [])
+
 # Economic indicator interpretation thresholds
 INDICATOR_INTERPRETATIONS = {
     "CPI_YoY": [
@@ -156,7 +251,78 @@ INDICATOR_INTERPRETATIONS = {
     ]
 }
 
-def fetch_fomc_meeting_dates():
+# INDICATOR_INTERPRETATIONS compiled for np.searchsorted: ascending thresholds
+# per indicator with the (interpretation, signal) labels in the same order
+_INTERP_THRESH = {
+    indicator: np.array(sorted(threshold for threshold, _, _ in levels), dtype=np.float64)
+    for indicator, levels in INDICATOR_INTERPRETATIONS.items()
+}
+_INTERP_LABELS = {
+    indicator: [(interp, signal) for _, interp, signal in sorted(levels, key=lambda level: level[0])]
+    for indicator, levels in INDICATOR_INTERPRETATIONS.items()
+}
+
+# The same labels as object arrays with a trailing "" for "no interpretation",
+# for indexing whole columns at once
+_INTERP_LABEL_ARRAYS = {
+    indicator: (
+        np.array([interp for interp, _ in labels] + [""], dtype=object),
+        np.array([signal for _, signal in labels] + [""], dtype=object)
+    )
+    for indicator, labels in _INTERP_LABELS.items()
+}
+
+def interpret_indicator(indicator: str, value: float) -> Optional[Tuple[str, str]]:
+    """
+    Find the interpretation for an indicator value.
+    
+    Picks the highest threshold in INDICATOR_INTERPRETATIONS that the value
+    meets or exceeds.
+    
+    Args:
+        indicator: Indicator name (e.g. "CPI_YoY")
+        value: Current value of the indicator
+        
+    Returns:
+        Tuple of (interpretation, signal), or None if the indicator is unknown
+        or the value is below every threshold
+    """
+    thresholds = _INTERP_THRESH.get(indicator)
+    if thresholds is None or value is None or math.isnan(value):
+        return None
+    
+    idx = int(np.searchsorted(thresholds, value, side='right')) - 1
+    if idx < 0:
+        return None
+    return _INTERP_LABELS[indicator][idx]
+
+def _find_divs(element, class_name: str) -> List[Any]:
+    """Return descendant <div> elements carrying class_name, in document order."""
+    return [el for el in element.find_class(class_name) if el.tag == 'div' and el is not element]
+
+def _element_text(element) -> str:
+    """Concatenate an element's text fragments, each stripped of surrounding whitespace."""
+    return "".join(text.strip() for text in element.itertext())
+
+def interpret_indicator_values(indicator: str, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized interpret_indicator over an array of values.
+    
+    Args:
+        indicator: Indicator name (must be in INDICATOR_INTERPRETATIONS)
+        values: float64 array of indicator values
+        
+    Returns:
+        Tuple of (interpretations, signals) object arrays aligned with values;
+        entries are "" where no threshold applies or the value is NaN
+    """
+    interps, signals = _INTERP_LABEL_ARRAYS[indicator]
+    idx = np.searchsorted(_INTERP_THRESH[indicator], values, side='right') - 1
+    # -1 selects the trailing "" entry for values below every threshold
+    idx[np.isnan(values)] = -1
+    return interps[idx], signals[idx]
+
+def fetch_fomc_meeting_dates(now: Optional[datetime.datetime] = None):
     """
     Fetch FOMC meeting dates from external source.
     
@@ -165,124 +331,136 @@ def fetch_fomc_meeting_dates():
     2. A reliable financial data API
     3. Falls back to hardcoded dates if neither option works
     
+    Args:
+        now: Optional request time to check the cache against (defaults to datetime.datetime.now())
+        
     Returns:
         List of tuples (year, month, day, is_important)
     """
     global _fomc_cache, _fomc_cache_expiry
     
-    # Check if we have a valid cache
-    current_time = datetime.datetime.now()
-    if _fomc_cache and _fomc_cache_expiry and _fomc_cache_expiry > current_time:
+    # Check if we have a valid cache (lock-free fast path)
+    current_time = now or datetime.datetime.now()
+    if _fomc_cache is not None and _fomc_cache_expiry and _fomc_cache_expiry > current_time:
         return _fomc_cache
     
-    try:
-        # Set cache expiry for 24 hours from now (as FOMC schedules don't change often)
-        cache_expiry = current_time + datetime.timedelta(hours=24)
+    # Refresh under the lock, re-checking in case another thread refreshed first
+    with _fomc_lock:
+        if _fomc_cache is not None and _fomc_cache_expiry and _fomc_cache_expiry > current_time:
+            return _fomc_cache
         
-        # Try to fetch from Federal Reserve website using requests library
-        import requests
-        from bs4 import BeautifulSoup
+        # The schedule is about to change, so drop memoized Fed week answers
+        _is_fed_week_cached.cache_clear()
         
-        # Attempt to scrape from the official Federal Reserve calendar page
         try:
-            url = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
-            response = requests.get(url, timeout=10)
+            # Set cache expiry for 24 hours from now (as FOMC schedules don't change often)
+            cache_expiry = current_time + datetime.timedelta(hours=24)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Initialize list for meeting dates
-                fomc_dates = []
-                
-                # Look for tables containing FOMC schedule
-                # The structure of the page has tables with class "calendar-content"
-                # First find the current year and future years' tables
-                tables = soup.select('div.panel-default')
+            # Try to fetch from Federal Reserve website using the shared session
+            # Attempt to scrape from the official Federal Reserve calendar page
+            try:
+                url = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
+                response = _http_session.get(url, timeout=CALENDAR_TIMEOUT_SECONDS)
                 
-                for table in tables:
-                    year_header = table.select_one('div.panel-heading')
-                    if not year_header:
-                        continue
+                if response.status_code == 200:
+                    root = lxml.html.fromstring(response.content)
                     
-                    # Extract year from header
-                    year_text = year_header.get_text(strip=True)
-                    year_match = re.search(r'(\d{4})', year_text)
-                    if not year_match:
-                        continue
+                    # Initialize list for meeting dates
+                    fomc_dates = []
                     
-                    year = int(year_match.group(1))
+                    # Look for tables containing FOMC schedule
+                    # The structure of the page has tables with class "calendar-content"
+                    # First find the current year and future years' tables
+                    tables = _find_divs(root, 'panel-default')
                     
-                    # Process each meeting date in this year's table
-                    meeting_rows = table.select('tr')
-                    for row in meeting_rows:
-                        date_cell = row.select_one('td:nth-child(1)')
-                        if not date_cell:
+                    for table in tables:
+                        year_header = next(iter(_find_divs(table, 'panel-heading')), None)
+                        if year_header is None:
                             continue
                         
-                        # Extract date information
-                        date_text = date_cell.get_text(strip=True)
-                        if not date_text:
+                        # Extract year from header
+                        year_text = _element_text(year_header)
+                        year_match = _YEAR_RE.search(year_text)
+                        if not year_match:
                             continue
                         
-                        # Check if this is a regular meeting and not some other event
-                        if "meeting" not in date_text.lower():
-                            continue
+                        year = int(year_match.group(1))
                         
-                        # Parse date (format can vary but often like "January 30-31")
-                        date_match = re.search(r'(\w+)\s+(\d+)(?:-\d+)?', date_text)
-                        if date_match:
-                            month_name, day = date_match.groups()
-                            month = datetime.datetime.strptime(month_name, '%B').month
-                            day = int(day)
+                        # Process each meeting date in this year's table
+                        meeting_rows = table.iter('tr')
+                        for row in meeting_rows:
+                            # First cell of the row (first element child, like td:nth-child(1);
+                            # getprevious() alone would also see comments and processing instructions)
+                            date_cell = next((td for td in row.iter('td')
+                                              if not any(isinstance(sibling.tag, str)
+                                                         for sibling in td.itersiblings(preceding=True))), None)
+                            if date_cell is None:
+                                continue
                             
-                            # Determine if it's an important meeting (with press conference)
-                            # Typically all meetings now have press conferences
-                            is_important = True
+                            # Extract date information
+                            date_text = _element_text(date_cell)
+                            if not date_text:
+                                continue
                             
-                            fomc_dates.append((year, month, day, is_important))
-                
-                # If we successfully found dates, update cache and return
-                if fomc_dates:
-                    _fomc_cache = fomc_dates
-                    _fomc_cache_expiry = cache_expiry
-                    return fomc_dates
-        
-        except Exception as e:
-            print(f"Error fetching FOMC dates from Federal Reserve website: {e}")
-        
-        # If Federal Reserve website scraping fails, try alternative API sources
-        # Example: Using a financial data API (placeholder for actual API implementation)
-        try:
-            # This is a placeholder for an actual API call
-            # In a production environment, you would integrate with a financial data provider
-            # such as Bloomberg, Refinitiv, Alpha Vantage, etc.
-            pass
+                            # Check if this is a regular meeting and not some other event
+                            if "meeting" not in date_text.lower():
+                                continue
+                            
+                            # Parse date (format can vary but often like "January 30-31")
+                            date_match = _DATE_RE.search(date_text)
+                            if date_match:
+                                month_name, day = date_match.groups()
+                                month = _MONTHS.get(month_name.strip().title())
+                                if month is None:
+                                    continue
+                                day = int(day)
+                                
+                                # Determine if it's an important meeting (with press conference)
+                                # Typically all meetings now have press conferences
+                                is_important = True
+                                
+                                fomc_dates.append((year, month, day, is_important))
+                    
+                    # If we successfully found dates, update cache and return
+                    if fomc_dates:
+                        _fomc_cache = fomc_dates
+                        _fomc_cache_expiry = cache_expiry
+                        return fomc_dates
+            
+            except Exception as e:
+                print(f"Error fetching FOMC dates from Federal Reserve website: {e}")
+            
+            # If Federal Reserve website scraping fails, try alternative API sources
+            # Example: Using a financial data API (placeholder for actual API implementation)
+            try:
+                # This is a placeholder for an actual API call
+                # In a production environment, you would integrate with a financial data provider
+                # such as Bloomberg, Refinitiv, Alpha Vantage, etc.
+                pass
+            except Exception as e:
+                print(f"Error fetching FOMC dates from alternative API: {e}")
+            
+            # If all attempts fail, use fallback hardcoded schedule
+            # But filter for dates that are in the future or very recent past
+            today = current_time.date()
+            three_months_ago = today - datetime.timedelta(days=90)
+            
+            # Filter fallback schedule to only include recent and future dates
+            # This ensures we don't return very old meetings even in fallback mode
+            # The schedule is chronological, so recent meetings are a single tail slice
+            cut = int(np.searchsorted(_FALLBACK_FOMC_DATES, np.datetime64(three_months_ago), side='left'))
+            filtered_fallback = FALLBACK_FOMC_SCHEDULE[cut:]
+            
+            _fomc_cache = filtered_fallback
+            _fomc_cache_expiry = cache_expiry
+            return filtered_fallback
+            
         except Exception as e:
-            print(f"Error fetching FOMC dates from alternative API: {e}")
-        
-        # If all attempts fail, use fallback hardcoded schedule
-        # But filter for dates that are in the future or very recent past
-        today = datetime.date.today()
-        three_months_ago = today - datetime.timedelta(days=90)
-        
-        # Filter fallback schedule to only include recent and future dates
-        # This ensures we don't return very old meetings even in fallback mode
-        filtered_fallback = []
-        for year, month, day, is_important in FALLBACK_FOMC_SCHEDULE:
-            meeting_date = datetime.date(year, month, day)
-            if meeting_date >= three_months_ago:
-                filtered_fallback.append((year, month, day, is_important))
-        
-        _fomc_cache = filtered_fallback
-        _fomc_cache_expiry = cache_expiry
-        return filtered_fallback
-        
-    except Exception as e:
-        print(f"Error in FOMC date fetching: {e}")
-        # Return fallback if there's any unexpected error
-        return FALLBACK_FOMC_SCHEDULE
+            print(f"Error in FOMC date fetching: {e}")
+            # Return fallback if there's any unexpected error
+            return FALLBACK_FOMC_SCHEDULE
 
-def fetch_cpi_release_dates(year: int = None) -> List[Tuple[int, int, int]]:
+def fetch_cpi_release_dates(year: int = None, now: Optional[datetime.datetime] = None) -> List[Tuple[int, int, int]]:
     """
     Fetch CPI (Consumer Price Index) release dates from external sources.
     
@@ -293,106 +471,116 @@ def fetch_cpi_release_dates(year: int = None) -> List[Tuple[int, int, int]]:
     
     Args:
         year: Optional year to filter results (defaults to current year if None)
+        now: Optional request time to check the cache against (defaults to datetime.datetime.now())
         
     Returns:
         List of tuples (year, month, day)
     """
     global _cpi_cache, _cpi_cache_expiry
     
+    current_time = now or datetime.datetime.now()
+    
     # Use current year if not specified
     if year is None:
-        year = datetime.datetime.now().year
+        year = current_time.year
     
-    # Check if we have a valid cache
-    current_time = datetime.datetime.now()
-    if _cpi_cache and _cpi_cache_expiry and _cpi_cache_expiry > current_time:
+    # Check if we have a valid cache (lock-free fast path)
+    if _cpi_cache is not None and _cpi_cache_expiry and _cpi_cache_expiry > current_time:
         # If we have a cache but need to filter by year
         if year is not None:
             return [date_tuple for date_tuple in _cpi_cache if date_tuple[0] == year]
         return _cpi_cache
     
-    try:
-        # Set cache expiry for 24 hours
-        cache_expiry = current_time + datetime.timedelta(hours=24)
+    # Refresh under the lock, re-checking in case another thread refreshed first
+    with _cpi_lock:
+        if _cpi_cache is not None and _cpi_cache_expiry and _cpi_cache_expiry > current_time:
+            # If we have a cache but need to filter by year
+            if year is not None:
+                return [date_tuple for date_tuple in _cpi_cache if date_tuple[0] == year]
+            return _cpi_cache
         
-        # Try to fetch from BLS website
-        import requests
-        from bs4 import BeautifulSoup
+        # Release dates are about to change, so drop memoized CPI week answers
+        _is_cpi_week_cached.cache_clear()
         
         try:
-            # Attempt to get data from BLS
-            url = "https://www.bls.gov/schedule/news_release/cpi.htm"
-            response = requests.get(url, timeout=10)
+            # Set cache expiry for 24 hours
+            cache_expiry = current_time + datetime.timedelta(hours=24)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Initialize list for release dates
-                cpi_dates = []
-                
-                # Find the release schedule table
-                tables = soup.select('table')
-                for table in tables:
-                    rows = table.select('tr')
-                    for row in rows:
-                        cells = row.select('td')
-                        if len(cells) >= 2:
-                            # Date is typically in the first cell
-                            date_text = cells[0].get_text(strip=True)
-                            
-                            try:
-                                # BLS typically formats dates as MM/DD/YYYY
-                                if '/' in date_text:
-                                    parts = date_text.split('/')
-                                    if len(parts) == 3:
-                                        month = int(parts[0])
-                                        day = int(parts[1])
-                                        year_val = int(parts[2])
-                                        cpi_dates.append((year_val, month, day))
-                            except (ValueError, IndexError):
-                                pass
+            # Try to fetch from BLS website using the shared session
+            try:
+                # Attempt to get data from BLS
+                url = "https://www.bls.gov/schedule/news_release/cpi.htm"
+                response = _http_session.get(url, timeout=CALENDAR_TIMEOUT_SECONDS)
                 
-                # If we successfully found dates, update cache and return
-                if cpi_dates:
-                    _cpi_cache = cpi_dates
-                    _cpi_cache_expiry = cache_expiry
-                    # Filter by year if specified
-                    if year is not None:
-                        return [date_tuple for date_tuple in cpi_dates if date_tuple[0] == year]
-                    return cpi_dates
+                if response.status_code == 200:
+                    root = lxml.html.fromstring(response.content)
+                    
+                    # Initialize list for release dates
+                    cpi_dates = []
+                    
+                    # Find the release schedule table
+                    tables = root.iter('table')
+                    for table in tables:
+                        rows = table.iter('tr')
+                        for row in rows:
+                            cells = list(row.iter('td'))
+                            if len(cells) >= 2:
+                                # Date is typically in the first cell
+                                date_text = _element_text(cells[0])
+                                
+                                try:
+                                    # BLS typically formats dates as MM/DD/YYYY
+                                    if '/' in date_text:
+                                        parts = date_text.split('/')
+                                        if len(parts) == 3:
+                                            month = int(parts[0])
+                                            day = int(parts[1])
+                                            year_val = int(parts[2])
+                                            cpi_dates.append((year_val, month, day))
+                                except (ValueError, IndexError):
+                                    pass
+                    
+                    # If we successfully found dates, update cache and return
+                    if cpi_dates:
+                        _cpi_cache = cpi_dates
+                        _cpi_cache_expiry = cache_expiry
+                        # Filter by year if specified
+                        if year is not None:
+                            return [date_tuple for date_tuple in cpi_dates if date_tuple[0] == year]
+                        return cpi_dates
+            
+            except Exception as e:
+                print(f"Error fetching CPI dates from BLS website: {e}")
+            
+            # If web scraping fails, estimate based on typical release pattern
+            # CPI is typically released around the 10th-15th of each month for the previous month
+            today = current_time.date()
+            estimated_dates = []
+            
+            # Generate estimates for current year and next year
+            for y in range(year, year + 2):
+                for month in range(1, 13):
+                    # Estimate the release day (typically around the 13th of each month)
+                    # This is a rough estimate and will not be exact
+                    release_day = 13
+                    
+                    # Add to our estimated dates
+                    estimated_dates.append((y, month, release_day))
+            
+            _cpi_cache = estimated_dates
+            _cpi_cache_expiry = cache_expiry
+            # Filter by year if specified
+            if year is not None:
+                return [date_tuple for date_tuple in estimated_dates if date_tuple[0] == year]
+            return estimated_dates
         
         except Exception as e:
-            print(f"Error fetching CPI dates from BLS website: {e}")
-        
-        # If web scraping fails, estimate based on typical release pattern
-        # CPI is typically released around the 10th-15th of each month for the previous month
-        today = datetime.date.today()
-        estimated_dates = []
-        
-        # Generate estimates for current year and next year
-        for y in range(year, year + 2):
-            for month in range(1, 13):
-                # Estimate the release day (typically around the 13th of each month)
-                # This is a rough estimate and will not be exact
-                release_day = 13
-                
-                # Add to our estimated dates
-                estimated_dates.append((y, month, release_day))
-        
-        _cpi_cache = estimated_dates
-        _cpi_cache_expiry = cache_expiry
-        # Filter by year if specified
-        if year is not None:
-            return [date_tuple for date_tuple in estimated_dates if date_tuple[0] == year]
-        return estimated_dates
-    
-    except Exception as e:
-        print(f"Error in CPI date estimation: {e}")
-        # Return a simple fallback
-        today = datetime.date.today()
-        return [(year, m, 13) for m in range(1, 13)]
+            print(f"Error in CPI date estimation: {e}")
+            # Return a simple fallback
+            today = current_time.date()
+            return [(year, m, 13) for m in range(1, 13)]
 
-def fetch_earnings_season_periods():
+def fetch_earnings_season_periods(now: Optional[datetime.datetime] = None):
     """
     Determine when earnings seasons are occurring.
     
@@ -402,81 +590,159 @@ def fetch_earnings_season_periods():
     - Q3: Mid October through early November
     - Q4: Late January through mid February
     
+    Args:
+        now: Optional request time to check the cache against (defaults to datetime.datetime.now())
+        
     Returns:
         List of tuples (start_date, end_date) for current and upcoming earnings seasons
     """
     global _earnings_cache, _earnings_cache_expiry
     
-    # Check if we have a valid cache
-    current_time = datetime.datetime.now()
-    if _earnings_cache and _earnings_cache_expiry and _earnings_cache_expiry > current_time:
+    # Check if we have a valid cache (lock-free fast path)
+    current_time = now or datetime.datetime.now()
+    if _earnings_cache is not None and _earnings_cache_expiry and _earnings_cache_expiry > current_time:
         return _earnings_cache
     
-    try:
-        # Set cache expiry for 24 hours
-        cache_expiry = current_time + datetime.timedelta(hours=24)
-        
-        # Today's date
-        today = datetime.date.today()
-        
-        # Get the current year
-        current_year = today.year
+    # Refresh under the lock, re-checking in case another thread refreshed first
+    with _earnings_lock:
+        if _earnings_cache is not None and _earnings_cache_expiry and _earnings_cache_expiry > current_time:
+            return _earnings_cache
         
-        # Define the typical earnings season periods
-        earnings_seasons = [
-            # Q4 earnings (reported in Jan-Feb)
-            (datetime.date(current_year, 1, 25), datetime.date(current_year, 2, 15)),
-            # Q1 earnings (reported in Apr-May)
-            (datetime.date(current_year, 4, 10), datetime.date(current_year, 5, 5)),
-            # Q2 earnings (reported in Jul-Aug)
-            (datetime.date(current_year, 7, 15), datetime.date(current_year, 8, 10)),
-            # Q3 earnings (reported in Oct-Nov)
-            (datetime.date(current_year, 10, 15), datetime.date(current_year, 11, 10)),
-            # Next year's Q4 earnings
-            (datetime.date(current_year + 1, 1, 25), datetime.date(current_year + 1, 2, 15))
-        ]
+        # Seasons are about to change, so drop memoized earnings season answers
+        _is_in_earnings_season_cached.cache_clear()
         
-        # Try to enhance with actual data from financial APIs or websites
-        # This would be implemented in a production environment
+        try:
+            # Set cache expiry for 24 hours
+            cache_expiry = current_time + datetime.timedelta(hours=24)
+            
+            # Today's date
+            today = current_time.date()
+            
+            # Get the current year
+            current_year = today.year
+            
+            # Define the typical earnings season periods
+            earnings_seasons = [
+                # Q4 earnings (reported in Jan-Feb)
+                (datetime.date(current_year, 1, 25), datetime.date(current_year, 2, 15)),
+                # Q1 earnings (reported in Apr-May)
+                (datetime.date(current_year, 4, 10), datetime.date(current_year, 5, 5)),
+                # Q2 earnings (reported in Jul-Aug)
+                (datetime.date(current_year, 7, 15), datetime.date(current_year, 8, 10)),
+                # Q3 earnings (reported in Oct-Nov)
+                (datetime.date(current_year, 10, 15), datetime.date(current_year, 11, 10)),
+                # Next year's Q4 earnings
+                (datetime.date(current_year + 1, 1, 25), datetime.date(current_year + 1, 2, 15))
+            ]
+            
+            # Try to enhance with actual data from financial APIs or websites
+            # This would be implemented in a production environment
+            
+            _earnings_cache = earnings_seasons
+            _earnings_cache_expiry = cache_expiry
+            return earnings_seasons
         
-        _earnings_cache = earnings_seasons
-        _earnings_cache_expiry = cache_expiry
-        return earnings_seasons
-    
-    except Exception as e:
-        print(f"Error in earnings season estimation: {e}")
-        # Return a simple fallback
-        today = datetime.date.today()
-        return [(today, today + datetime.timedelta(days=30))]
+        except Exception as e:
+            print(f"Error in earnings season estimation: {e}")
+            # Return a simple fallback
+            today = current_time.date()
+            return [(today, today + datetime.timedelta(days=30))]
 
-def is_in_earnings_season(event_date: datetime.datetime) -> bool:
+def warm_calendar_caches(year: int = None, now: Optional[datetime.datetime] = None) -> None:
+    """
+    Refresh the FOMC, CPI and earnings calendars concurrently.
+    
+    The fetchers are I/O-bound, so running them on threads overlaps the
+    Federal Reserve and BLS requests on a cold start.
+    
+    Args:
+        year: Year to request CPI release dates for (defaults to current year if None)
+        now: Optional request time shared by all three fetchers
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        wait([
+            executor.submit(fetch_fomc_meeting_dates, now),
+            executor.submit(fetch_cpi_release_dates, year, now),
+            executor.submit(fetch_earnings_season_periods, now)
+        ])
+
+def calendar_caches_stale(now: Optional[datetime.datetime] = None) -> bool:
+    """Return True if any of the FOMC, CPI or earnings calendar caches is missing or expired."""
+    now = now or datetime.datetime.now()
+    return any(
+        cache is None or _calendar_cache_stale(expiry, now)
+        for cache, expiry in (
+            (_fomc_cache, _fomc_cache_expiry),
+            (_cpi_cache, _cpi_cache_expiry),
+            (_earnings_cache, _earnings_cache_expiry)
+        )
+    )
+
+def _calendar_cache_stale(cache_expiry: Optional[datetime.datetime], now: Optional[datetime.datetime] = None) -> bool:
+    """Return True if a calendar cache is missing or expired and needs a refresh."""
+    return cache_expiry is None or cache_expiry <= (now or datetime.datetime.now())
+
+def is_in_earnings_season(event_date: datetime.datetime, now: Optional[datetime.datetime] = None) -> bool:
     """
     Check if a given date falls within an earnings season.
     
     Args:
         event_date: Date to check
+        now: Optional request time for the cache freshness check
         
     Returns:
         Boolean indicating whether the date is in an earnings season
     """
-    event_date_only = event_date.date()
+    if _calendar_cache_stale(_earnings_cache_expiry, now):
+        _is_in_earnings_season_cached.cache_clear()
+    return _is_in_earnings_season_cached(event_date.date())
+
+@functools.lru_cache(maxsize=1024)
+def _is_in_earnings_season_cached(event_date_only: datetime.date) -> bool:
+    """Memoized earnings season check, keyed on the calendar day."""
+    starts, max_ends = get_earnings_index()
+    
+    # Seasons starting on or before the date are starts[:idx]; the date falls in
+    # one of them if the latest end among those is on or after it
+    day = event_date_only.toordinal()
+    idx = bisect.bisect_right(starts, day)
+    return idx > 0 and max_ends[idx - 1] >= day
+
+def get_earnings_index() -> Tuple[List[int], List[int]]:
+    """
+    Get earnings seasons as sorted start ordinals with a running maximum of end ordinals.
+    
+    Like get_fomc_index, the index is rebuilt only when
+    fetch_earnings_season_periods returns a new list.
+    
+    Returns:
+        Tuple containing (sorted start ordinals, running max of end ordinals)
+    """
+    global _earnings_index
     
     # Get earnings seasons
     earnings_seasons = fetch_earnings_season_periods()
     
-    # Check if date falls within any earnings season period
-    for start_date, end_date in earnings_seasons:
-        if start_date <= event_date_only <= end_date:
-            return True
-            
-    return False
+    source, starts, max_ends = _earnings_index
+    if earnings_seasons is not source:
+        starts, max_ends = [], []
+        latest_end = None
+        for start_date, end_date in sorted(earnings_seasons):
+            end = end_date.toordinal()
+            latest_end = end if latest_end is None else max(latest_end, end)
+            starts.append(start_date.toordinal())
+            max_ends.append(latest_end)
+        _earnings_index = (earnings_seasons, starts, max_ends)
+    
+    return starts, max_ends
 
-def get_next_cpi_release(event_date: datetime.datetime) -> Tuple[datetime.date, int]:
+def get_next_cpi_release(event_date: datetime.datetime, now: Optional[datetime.datetime] = None) -> Tuple[datetime.date, int]:
     """
     Get the next CPI release date and days until that release.
     
     Args:
         event_date: The date to calculate from
+        now: Optional request time for the release-date cache check
         
     Returns:
         Tuple containing (next_release_date, days_until_release)
@@ -489,39 +755,44 @@ def get_next_cpi_release(event_date: datetime.datetime) -> Tuple[datetime.date,
     next_year = current_year + 1
     
     # Fetch CPI release dates for current and next year
-    current_year_releases = fetch_cpi_release_dates(current_year)
-    next_year_releases = fetch_cpi_release_dates(next_year)
-    
-    # Combine all releases
-    all_releases = current_year_releases + next_year_releases
-    
-    # Convert tuples to dates
-    release_dates = [datetime.date(year, month, day) for year, month, day in all_releases]
+    current_year_releases = fetch_cpi_release_dates(current_year, now)
+    next_year_releases = fetch_cpi_release_dates(next_year, now)
     
-    # Find the next release date
-    future_releases = [d for d in release_dates if d >= base_date]
+    # Find the next release date in a single pass over both years
+    next_release = None
+    for year, month, day in itertools.chain(current_year_releases, next_year_releases):
+        release_date = datetime.date(year, month, day)
+        if release_date >= base_date and (next_release is None or release_date < next_release):
+            next_release = release_date
     
-    if not future_releases:
+    if next_release is None:
         # If no future releases found, estimate
         estimated_date = base_date.replace(day=13) + datetime.timedelta(days=32)
         estimated_date = estimated_date.replace(day=13)
         return estimated_date, (estimated_date - base_date).days
     
-    next_release = min(future_releases)
     days_until = (next_release - base_date).days
     
     return next_release, days_until
 
-def is_cpi_week(event_date: datetime.datetime) -> bool:
+def is_cpi_week(event_date: datetime.datetime, now: Optional[datetime.datetime] = None) -> bool:
     """
     Check if a given date falls within a CPI release week.
     
     Args:
         event_date: Date to check
+        now: Optional request time for the cache freshness check
         
     Returns:
         Boolean indicating whether the date is in a CPI release week
     """
+    if _calendar_cache_stale(_cpi_cache_expiry, now):
+        _is_cpi_week_cached.cache_clear()
+    return _is_cpi_week_cached(event_date.date())
+
+@functools.lru_cache(maxsize=1024)
+def _is_cpi_week_cached(event_date: datetime.date) -> bool:
+    """Memoized CPI week check, keyed on the calendar day."""
     # Get next CPI release
     next_cpi = get_next_cpi_release(event_date)
     
@@ -532,54 +803,82 @@ def is_cpi_week(event_date: datetime.datetime) -> bool:
         
     return False
 
-def get_next_fomc_meeting(event_date: datetime.datetime) -> Optional[Tuple[datetime.date, int, bool]]:
+def get_fomc_index(now: Optional[datetime.datetime] = None) -> Tuple[List[datetime.date], List[bool]]:
     """
-    Calculate the date of the next FOMC meeting and days until it occurs.
+    Get the FOMC schedule as sorted meeting dates with parallel importance flags.
+    
+    The index is rebuilt only when fetch_fomc_meeting_dates returns a new
+    schedule (e.g. after a cache refresh), so repeated lookups skip building
+    date objects.
     
     Args:
-        event_date: Current date to calculate from
+        now: Optional request time for the schedule cache check
         
     Returns:
-        Tuple containing (next meeting date, days until meeting, is important meeting) or None if not found
+        Tuple containing (sorted list of meeting dates, list of is_important flags)
     """
-    event_date_only = event_date.date()
+    global _fomc_index
     
     # Fetch FOMC meeting dates (tries to use dynamic data with fallback to hardcoded)
-    fomc_schedule = fetch_fomc_meeting_dates()
-    
-    # Convert schedule to datetime.date objects
-    fomc_dates = [(datetime.date(year, month, day), is_important) for year, month, day, is_important in fomc_schedule]
-    
-    # Find the next meeting
-    future_meetings = [(meeting_date, (meeting_date - event_date_only).days, is_important) 
-                      for meeting_date, is_important in fomc_dates 
-                      if meeting_date >= event_date_only]
+    fomc_schedule = fetch_fomc_meeting_dates(now)
+    
+    source, sorted_dates, importance = _fomc_index
+    if fomc_schedule is not source:
+        # Keep the first entry for any date listed twice
+        meetings = {}
+        for year, month, day, is_important in fomc_schedule:
+            meetings.setdefault(datetime.date(year, month, day), is_important)
+        sorted_dates = sorted(meetings)
+        importance = [meetings[meeting_date] for meeting_date in sorted_dates]
+        _fomc_index = (fomc_schedule, sorted_dates, importance)
+    
+    return sorted_dates, importance
+
+def get_next_fomc_meeting(event_date: datetime.datetime, now: Optional[datetime.datetime] = None) -> Optional[Tuple[datetime.date, int, bool]]:
+    """
+    Calculate the date of the next FOMC meeting and days until it occurs.
     
-    if future_meetings:
-        # Return the closest future meeting
-        return future_meetings[0]
+    Args:
+        event_date: Current date to calculate from
+        now: Optional request time for the schedule cache check
+        
+    Returns:
+        Tuple containing (next meeting date, days until meeting, is important meeting) or None if not found
+    """
+    # Convert to date if datetime
+    event_date_only = event_date.date() if isinstance(event_date, datetime.datetime) else event_date
     
-    # If no future meetings in our schedule, return the most recent past meeting
-    past_meetings = [(meeting_date, (meeting_date - event_date_only).days, is_important) 
-                    for meeting_date, is_important in fomc_dates 
-                    if meeting_date < event_date_only]
+    fomc_dates, fomc_importance = get_fomc_index(now)
+    if not fomc_dates:
+        return None
     
-    if past_meetings:
-        # Return the most recent past meeting
-        return sorted(past_meetings, key=lambda x: x[1], reverse=True)[0]
+    # Find the next meeting (first date on or after the event)
+    idx = bisect.bisect_left(fomc_dates, event_date_only)
+    if idx == len(fomc_dates):
+        # If no future meetings in our schedule, return the most recent past meeting
+        idx -= 1
     
-    return None
+    meeting_date = fomc_dates[idx]
+    return meeting_date, (meeting_date - event_date_only).days, fomc_importance[idx]
 
-def is_fed_week(event_date: datetime.datetime) -> bool:
+def is_fed_week(event_date: datetime.datetime, now: Optional[datetime.datetime] = None) -> bool:
     """
     Check if a given date falls within a Fed meeting week.
     
     Args:
         event_date: Date to check
+        now: Optional request time for the cache freshness check
         
     Returns:
         Boolean indicating whether the date is in a Fed meeting week
     """
+    if _calendar_cache_stale(_fomc_cache_expiry, now):
+        _is_fed_week_cached.cache_clear()
+    return _is_fed_week_cached(event_date.date())
+
+@functools.lru_cache(maxsize=1024)
+def _is_fed_week_cached(event_date: datetime.date) -> bool:
+    """Memoized Fed week check, keyed on the calendar day."""
     # Get next FOMC meeting
     next_fomc = get_next_fomc_meeting(event_date)
     
@@ -593,7 +892,9 @@ def is_fed_week(event_date: datetime.datetime) -> bool:
 def build_prompt_context(
     event_date: datetime.datetime,
     macro_snapshot: Dict[str, float],
-    event_tags: Dict[str, bool]
+    event_tags: Dict[str, bool],
+    interpretations: Optional[Dict[str, Tuple[str, str]]] = None,
+    now: Optional[datetime.datetime] = None
 ) -> Dict[str, str]:
     """
     Build enhanced contextual information for LLM prompts based on macroeconomic data and event tags.
@@ -609,6 +910,10 @@ def build_prompt_context(
         event_date: Date and time when the event occurred
         macro_snapshot: Dictionary of macroeconomic indicators and their values
         event_tags: Dictionary of boolean tags providing event context
+        interpretations: Optional precomputed indicator -> (interpretation, signal)
+            labels, as produced by build_prompt_context_batch
+        now: Optional request time; taken once here (if not given) and shared
+            by every calendar and data-age check
         
     Returns:
         Dictionary containing three strings:
@@ -627,14 +932,21 @@ def build_prompt_context(
     if not macro_snapshot:
         return result
     
+    # One clock read for the whole prompt build
+    now = now or datetime.datetime.now()
+    
+    # Fetch any missing calendars in parallel before the helpers need them
+    if calendar_caches_stale(now):
+        warm_calendar_caches(event_date.year, now)
+    
     # 1. Generate time-aware text about market conditions with calendar context
-    time_aware_text = generate_time_aware_text(event_date, macro_snapshot, event_tags)
+    time_aware_text = generate_time_aware_text(event_date, macro_snapshot, event_tags, now)
     
     # 2. Identify and describe significant deltas vs. expected values
-    delta_description = generate_delta_description(macro_snapshot)
+    delta_description = generate_delta_description(macro_snapshot, now)
     
     # 3. Determine which indicators are most relevant with interpretations
-    relevance_weights = generate_relevance_weights(macro_snapshot, event_tags)
+    relevance_weights = generate_relevance_weights(macro_snapshot, event_tags, interpretations)
     
     # Return the enhanced context
     return {
@@ -643,10 +955,70 @@ def build_prompt_context(
         "relevance_weights": relevance_weights
     }
 
+def build_prompt_context_batch(
+    event_dates: List[datetime.datetime],
+    macro_df: Any,
+    event_tags_list: Optional[List[Dict[str, bool]]] = None
+) -> List[Dict[str, str]]:
+    """
+    Build prompt context for many events at once (e.g. a back-test over dates).
+    
+    Indicator interpretations are classified for every row in one vectorized
+    pass per indicator column; the rest of each context is built per event
+    exactly as build_prompt_context does.
+    
+    Args:
+        event_dates: Date and time of each event
+        macro_df: pandas DataFrame with one row of macro indicators per event
+        event_tags_list: Optional event tag dictionaries, one per event
+        
+    Returns:
+        List of context dictionaries (see build_prompt_context), one per event
+    """
+    if event_tags_list is None:
+        event_tags_list = [{} for _ in event_dates]
+    now = datetime.datetime.now()
+    
+    # Classify each interpretable indicator column for all rows at once
+    labelled_columns = {}
+    for indicator in INDICATOR_INTERPRETATIONS:
+        if indicator in macro_df.columns:
+            values = macro_df[indicator].to_numpy(dtype=np.float64, na_value=np.nan)
+            labelled_columns[indicator] = interpret_indicator_values(indicator, values)
+    
+    contexts = []
+    for row, (event_date, macro_row, event_tags) in enumerate(zip(event_dates, macro_df.to_dict('records'), event_tags_list)):
+        # Missing values are left out, as they would be from a single snapshot
+        macro_snapshot = {key: value for key, value in macro_row.items() if not (isinstance(value, float) and math.isnan(value))}
+        interpretations = {
+            indicator: (interps[row], signals[row])
+            for indicator, (interps, signals) in labelled_columns.items()
+        }
+        contexts.append(build_prompt_context(event_date, macro_snapshot, event_tags, interpretations, now))
+    return contexts
+
+def classify_market_environment(macro_snapshot: Dict[str, float]) -> Dict[str, str]:
+    """
+    Bucket inflation, rates and volatility into environment labels using MARKET_ENV_BUCKETS.
+    
+    Args:
+        macro_snapshot: Dictionary of macroeconomic indicators and their values
+        
+    Returns:
+        Dictionary mapping each environment name to its label
+    """
+    environment = {}
+    for name, indicator, thresholds, labels in MARKET_ENV_BUCKETS:
+        value = macro_snapshot.get(indicator)
+        # A value must exceed a threshold to move up a bucket; missing or zero values get the lowest label
+        environment[name] = labels[bisect.bisect_left(thresholds, value)] if value else labels[0]
+    return environment
+
 def generate_time_aware_text(
     event_date: datetime.datetime,
     macro_snapshot: Dict[str, float],
-    event_tags: Dict[str, bool]
+    event_tags: Dict[str, bool],
+    now: Optional[datetime.datetime] = None
 ) -> str:
     """
     Generate a description of current market conditions in a time-aware way,
@@ -656,6 +1028,7 @@ def generate_time_aware_text(
         event_date: Date and time when the event occurred
         macro_snapshot: Dictionary of macroeconomic indicators and their values
         event_tags: Dictionary of boolean tags providing event context
+        now: Optional request time for the calendar cache checks
         
     Returns:
         String describing current market conditions with calendar awareness
@@ -664,26 +1037,23 @@ def generate_time_aware_text(
     date_str = event_date.strftime('%B %d, %Y')
     
     # Extract key indicators (if available)
-    cpi = macro_snapshot.get("CPI_YoY")
-    fed_rate = macro_snapshot.get("FedFundsRate")
-    unemployment = macro_snapshot.get("Unemployment")
-    vix = macro_snapshot.get("VIX")
     treasury10y = macro_snapshot.get("Treasury10Y")
     treasury2y = macro_snapshot.get("Treasury2Y")
     
     # Determine market environment characterizations
-    inflation_env = "high-inflation" if cpi and cpi > 4.0 else "moderate-inflation" if cpi and cpi > 2.5 else "low-inflation"
-    
-    rate_env = "high-rate" if fed_rate and fed_rate > 4.0 else "moderate-rate" if fed_rate and fed_rate > 2.0 else "low-rate"
-    
-    vol_env = "high-volatility" if vix and vix > 25 else "moderate-volatility" if vix and vix > 15 else "low-volatility"
+    environment = classify_market_environment(macro_snapshot)
+    inflation_env = environment["inflation"]
+    rate_env = environment["rate"]
+    vol_env = environment["volatility"]
     
     # Check for yield curve inversion (2-year yield > 10-year yield)
     inverted_yield = treasury2y and treasury10y and treasury2y > treasury10y
     yield_curve = "inverted yield curve" if inverted_yield else "normal yield curve"
     
     # Calculate days until next FOMC meeting using dynamic data
-    fomc_info = get_next_fomc_meeting(event_date)
+    fomc_info = get_next_fomc_meeting(event_date, now)
+    # Fed/CPI week follow from the same lookups (meeting or release within 3 days)
+    in_fed_week = fomc_info is not None and abs(fomc_info[1]) <= 3
     fomc_context = ""
     if fomc_info:
         next_meeting_date, days_until, is_important = fomc_info
@@ -697,7 +1067,8 @@ def generate_time_aware_text(
             fomc_context = f"The next {meeting_type} is in {days_until} days."
     
     # Get CPI release information using dynamic data
-    cpi_info = get_next_cpi_release(event_date)
+    cpi_info = get_next_cpi_release(event_date, now)
+    in_cpi_week = cpi_info is not None and abs(cpi_info[1]) <= 3
     cpi_context = ""
     if cpi_info:
         release_date, days_until = cpi_info
@@ -709,56 +1080,61 @@ def generate_time_aware_text(
             cpi_context = f" CPI data will be released in {days_until} days."
     
     # Check for earnings season using dynamic data
+    in_earnings_season = is_in_earnings_season(event_date, now)
     earnings_context = ""
-    if is_in_earnings_season(event_date):
+    if in_earnings_season:
         earnings_context = " Currently in earnings season."
     
-    # Generate market characterization with calendar context
-    market_characterization = f"Today is {date_str}. {fomc_context}{cpi_context}{earnings_context} Current market conditions show a {inflation_env}, {rate_env}, {vol_env} environment with an {yield_curve}."
+    # Generate market characterization with calendar context (pieces are joined once at the end)
+    parts = [
+        f"Today is {date_str}. ", fomc_context, cpi_context, earnings_context,
+        f" Current market conditions show a {inflation_env}, {rate_env}, {vol_env} environment with an {yield_curve}."
+    ]
     
     # Dynamically check special periods or use event tags if already provided
     special_periods = []
     
-    # Use event tags if provided, otherwise use our dynamic helpers
+    # Use event tags if provided, otherwise use the calendar lookups above
     if "is_fed_week" in event_tags:
         if event_tags.get("is_fed_week"):
             special_periods.append("Fed meeting week")
-    elif is_fed_week(event_date):
+    elif in_fed_week:
         special_periods.append("Fed meeting week")
         
     if "is_cpi_week" in event_tags:
         if event_tags.get("is_cpi_week"):
             special_periods.append("CPI release week")
-    elif is_cpi_week(event_date):
+    elif in_cpi_week:
         special_periods.append("CPI release week")
         
     if "is_earnings_season" in event_tags:
         if event_tags.get("is_earnings_season"):
             special_periods.append("earnings season")
-    elif is_in_earnings_season(event_date):
+    elif in_earnings_season:
         special_periods.append("earnings season")
         
     if special_periods:
-        market_characterization += f" This is occurring during {' and '.join(special_periods)}."
+        parts.append(f" This is occurring during {' and '.join(special_periods)}.")
     
     # Add surprise context if available
     if event_tags.get("surprise_positive") is not None:
         surprise_type = "positive" if event_tags.get("surprise_positive") else "negative"
-        market_characterization += f" The market has recently experienced a {surprise_type} surprise."
+        parts.append(f" The market has recently experienced a {surprise_type} surprise.")
     
     # Add repeat event context if available
     if event_tags.get("is_repeat_event"):
-        market_characterization += " This is a repeat of a recent market event."
+        parts.append(" This is a repeat of a recent market event.")
         
-    return market_characterization
+    return "".join(parts)
 
-def generate_delta_description(macro_snapshot: Dict[str, float]) -> str:
+def generate_delta_description(macro_snapshot: Dict[str, float], now: Optional[datetime.datetime] = None) -> str:
     """
     Generate a description of significant recent changes in economic indicators,
     with emphasis on comparing actual values vs. expected values.
     
     Args:
         macro_snapshot: Dictionary of macroeconomic indicators and their values
+        now: Optional request time for the data-age message
         
     Returns:
         String describing significant deltas from expectations and recent changes
@@ -766,58 +1142,60 @@ def generate_delta_description(macro_snapshot: Dict[str, float]) -> str:
     # First, check for direct expectation vs. actual comparisons
     surprise_comparisons = []
     
-    # Common expected vs. actual patterns to check
-    expectation_patterns = [
-        ("CPI_YoY", "CPI_Expected"),
-        ("CoreCPI", "CoreCPI_Expected"),
-        ("GDP_QoQ", "GDP_Expected"),
-        ("Unemployment", "Unemployment_Expected"),
-        ("NFP", "NFP_Expected"),
-        ("RetailSales", "RetailSales_Expected")
+    # Pairs where both the actual and expected value are available
+    present = [
+        i for i, (actual_key, expected_key) in enumerate(EXPECTATION_PATTERNS)
+        if macro_snapshot.get(actual_key) is not None and macro_snapshot.get(expected_key) is not None
     ]
     
-    # Check for each comparison pair
-    for actual_key, expected_key in expectation_patterns:
-        if actual_key in macro_snapshot and expected_key in macro_snapshot:
+    # Change/delta fields, skipping metadata fields
+    change_fields = []
+    for indicator in macro_snapshot:
+        if not indicator.startswith("_"):
+            change_match = _CHANGE_FIELD_RE.search(indicator)
+            if change_match:
+                change_fields.append((indicator, change_match))
+    
+    # Fast path: nothing to compare, so only the data-age message applies
+    if not present and not change_fields:
+        return describe_macro_data_age(macro_snapshot, now)
+    
+    if present:
+        # Compare every available pair against its threshold in one vectorized step
+        present_idx = np.array(present)
+        actuals = np.array([macro_snapshot[EXPECTATION_PATTERNS[i][0]] for i in present], dtype=np.float64)
+        expecteds = np.array([macro_snapshot[EXPECTATION_PATTERNS[i][1]] for i in present], dtype=np.float64)
+        hits = present_idx[np.abs(actuals - expecteds) > _EXPECTATION_THRESH[present_idx]]
+        
+        for i in hits:
+            actual_key, expected_key = EXPECTATION_PATTERNS[i]
             actual = macro_snapshot[actual_key]
             expected = macro_snapshot[expected_key]
+            delta = actual - expected
+            direction = "above" if delta > 0 else "below"
             
-            if actual is not None and expected is not None:
-                delta = actual - expected
-                abs_delta = abs(delta)
-                
-                # Determine if this is a significant surprise
-                threshold = SIGNIFICANT_DELTA_THRESHOLD.get(actual_key, SIGNIFICANT_DELTA_THRESHOLD["DEFAULT"])
+            # Format based on indicator type
+            if "CPI" in actual_key or "GDP" in actual_key or "RetailSales" in actual_key:
+                surprise_text = f"{actual_key} surprise: {actual:.1f}% vs. {expected:.1f}% expected ({delta:+.1f}% {direction})"
+            elif "Unemployment" in actual_key:
+                surprise_text = f"{actual_key} surprise: {actual:.1f}% vs. {expected:.1f}% expected ({delta:+.1f}% {direction})"
+            elif "NFP" in actual_key:
+                surprise_text = f"{actual_key} surprise: {int(actual):,} vs. {int(expected):,} expected ({int(delta):+,} {direction})"
+            else:
+                surprise_text = f"{actual_key} surprise: {actual:.2f} vs. {expected:.2f} expected ({delta:+.2f} {direction})"
                 
-                if abs_delta > threshold:
-                    direction = "above" if delta > 0 else "below"
-                    
-                    # Format based on indicator type
-                    if "CPI" in actual_key or "GDP" in actual_key or "RetailSales" in actual_key:
-                        surprise_text = f"{actual_key} surprise: {actual:.1f}% vs. {expected:.1f}% expected ({delta:+.1f}% {direction})"
-                    elif "Unemployment" in actual_key:
-                        surprise_text = f"{actual_key} surprise: {actual:.1f}% vs. {expected:.1f}% expected ({delta:+.1f}% {direction})"
-                    elif "NFP" in actual_key:
-                        surprise_text = f"{actual_key} surprise: {int(actual):,} vs. {int(expected):,} expected ({int(delta):+,} {direction})"
-                    else:
-                        surprise_text = f"{actual_key} surprise: {actual:.2f} vs. {expected:.2f} expected ({delta:+.2f} {direction})"
-                        
-                    surprise_comparisons.append(surprise_text)
+            surprise_comparisons.append(surprise_text)
     
     # Next, check for change/delta fields
     significant_changes = []
     
     # Look for change indicators in different formats
-    for indicator, value in macro_snapshot.items():
-        # Skip metadata fields
-        if indicator.startswith("_"):
-            continue
-            
-        # Check if this is a change/delta field
-        is_change_field = any(suffix in indicator for suffix in ["_change", "_delta", "_Change", "_Delta"])
-        base_indicator = indicator.split("_change")[0].split("_delta")[0].split("_Change")[0].split("_Delta")[0]
+    for indicator, change_match in change_fields:
+        value = macro_snapshot[indicator]
+        # The base indicator is everything before the first change/delta suffix
+        base_indicator = indicator[:change_match.start()]
         
-        if is_change_field and value is not None:
+        if value is not None:
             # Determine if this change is significant using thresholds
             threshold = SIGNIFICANT_DELTA_THRESHOLD.get(base_indicator, SIGNIFICANT_DELTA_THRESHOLD["DEFAULT"])
             
@@ -837,16 +1215,6 @@ def generate_delta_description(macro_snapshot: Dict[str, float]) -> str:
                     
                 significant_changes.append(change_text)
     
-    # If no explicit change fields found, look for a metadata field with dates to calculate staleness
-    macro_date = None
-    for key in macro_snapshot:
-        if key in ["_timestamp", "_date", "_last_updated"]:
-            try:
-                macro_date = datetime.datetime.fromisoformat(macro_snapshot[key])
-                break
-            except (ValueError, TypeError):
-                pass
-    
     # Combine surprise comparisons and significant changes
     all_changes = []
     
@@ -859,9 +1227,32 @@ def generate_delta_description(macro_snapshot: Dict[str, float]) -> str:
     # Build the final description
     if all_changes:
         return " ".join(all_changes) + "."
-    elif macro_date:
+    return describe_macro_data_age(macro_snapshot, now)
+
+def describe_macro_data_age(macro_snapshot: Dict[str, float], now: Optional[datetime.datetime] = None) -> str:
+    """
+    Describe how fresh the macro data is, for when there are no significant changes to report.
+    
+    Args:
+        macro_snapshot: Dictionary of macroeconomic indicators and their values
+        now: Optional current time (defaults to datetime.datetime.now())
+        
+    Returns:
+        String describing the age of the data, or a generic no-change message
+    """
+    # Look for a metadata field with dates to calculate staleness
+    macro_date = None
+    for key in macro_snapshot:
+        if key in ["_timestamp", "_date", "_last_updated"]:
+            try:
+                macro_date = datetime.datetime.fromisoformat(macro_snapshot[key])
+                break
+            except (ValueError, TypeError):
+                pass
+    
+    if macro_date:
         # If no changes but we have a date, indicate data age
-        days_old = (datetime.datetime.now() - macro_date).days
+        days_old = ((now or datetime.datetime.now()) - macro_date).days
         if days_old <= 1:
             return "Using the latest economic data (updated today)."
         elif days_old <= 7:
@@ -874,7 +1265,8 @@ def generate_delta_description(macro_snapshot: Dict[str, float]) -> str:
 
 def generate_relevance_weights(
     macro_snapshot: Dict[str, float],
-    event_tags: Dict[str, bool]
+    event_tags: Dict[str, bool],
+    interpretations: Optional[Dict[str, Tuple[str, str]]] = None
 ) -> str:
     """
     Generate a description of which indicators are most relevant for this event,
@@ -883,6 +1275,7 @@ def generate_relevance_weights(
     Args:
         macro_snapshot: Dictionary of macroeconomic indicators and their values
         event_tags: Dictionary of boolean tags providing event context
+        interpretations: Optional precomputed indicator -> (interpretation, signal) labels
         
     Returns:
         String describing indicator importance with interpretations
@@ -901,26 +1294,14 @@ def generate_relevance_weights(
     # Get weights for this event type or use balanced weights
     if event_type and event_type in EVENT_TYPE_WEIGHTS:
         weights = EVENT_TYPE_WEIGHTS[event_type]
+        ranked_indicators = _RANKED_INDICATORS[event_type]
     else:
         # Use a balanced approach if no specific event type
-        weights = {
-            "CPI_YoY": 7,
-            "FedFundsRate": 7,
-            "VIX": 7,
-            "Treasury10Y": 6,
-            "GDP_QoQ": 6,
-            "Unemployment": 6
-        }
+        weights = DEFAULT_INDICATOR_WEIGHTS
+        ranked_indicators = _RANKED_DEFAULT_INDICATORS
     
-    # Filter to include only indicators that are actually in our snapshot
-    available_indicators = [ind for ind in weights if ind in macro_snapshot]
-    
-    # Sort by importance (weight)
-    sorted_indicators = sorted(
-        available_indicators, 
-        key=lambda x: weights.get(x, 0), 
-        reverse=True
-    )
+    # Keep the indicators that are actually in our snapshot, already sorted by importance (weight)
+    sorted_indicators = [ind for ind in ranked_indicators if ind in macro_snapshot]
     
     # Add yield curve signal specifically
     yield_curve_signal = ""
@@ -953,13 +1334,10 @@ def generate_relevance_weights(
                 value = macro_snapshot[indicator]
                 
                 # Find the appropriate interpretation threshold
-                interpretation = ""
-                signal = ""
-                for threshold, interp, sig in INDICATOR_INTERPRETATIONS[indicator]:
-                    if value >= threshold:
-                        interpretation = interp
-                        signal = sig
-                        break
+                if interpretations is not None and indicator in interpretations:
+                    interpretation, signal = interpretations[indicator]
+                else:
+                    interpretation, signal = interpret_indicator(indicator, value) or ("", "")
                 
                 if interpretation and signal:
                     # Add importance weight too
@@ -4,6 +4,7 @@ from typing import List, Dict, Any
 import pytz
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 # Define financial news RSS feed URLs
 FINANCIAL_FEEDS = [
@@ -15,6 +16,9 @@ FINANCIAL_FEEDS = [
     {"url": "https://feedly.com/f/alert/rss/0c53d59a-2e5e-4daa-8a35-f3c77cf1d1f3", "source": "Bloomberg (via Feedly)"},
 ]
 
+# Maximum number of feeds fetched at once
+FEED_FETCH_WORKERS = 16
+
 def standardize_timestamp(timestamp_str: str) -> str:
     """Convert various timestamp formats to UTC ISO format."""
     if not timestamp_str:
@@ -78,10 +82,54 @@ def standardize_timestamp(timestamp_str: str) -> str:
     # Return in ISO format
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
+def _fetch_feed(feed_info: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Fetch and parse the headlines from a single feed."""
+    headlines = []
+    
+    try:
+        # Parse the feed
+        feed = feedparser.parse(feed_info["url"])
+        
+        # Process each entry in the feed
+        for entry in feed.entries:
+            # Try to get published date from different possible fields
+            published_date = entry.get("published", "")
+            if not published_date:
+                published_date = entry.get("pubDate", "")
+            if not published_date:
+                published_date = entry.get("updated", "")
+            
+            # Extract and clean the relevant data
+            headline = {
+                "title": entry.get("title", "").strip(),
+                "link": entry.get("link", "").strip(),
+                "published": standardize_timestamp(published_date),
+                "source": feed_info["source"]
+            }
+            
+            # Try to get summary/description if available
+            if hasattr(entry, "summary"):
+                headline["summary"] = entry.summary
+            elif hasattr(entry, "description"):
+                headline["summary"] = entry.description
+            
+            # Only add non-empty headlines
+            if headline["title"] and headline["link"]:
+                headlines.append(headline)
+                
+    except Exception as e:
+        print(f"Error fetching feed {feed_info['url']}: {str(e)}")
+    
+    return headlines
+
 def fetch_rss_headlines() -> List[Dict[str, Any]]:
     """
     Fetch headlines from financial RSS feeds.
     
+    Feeds are fetched concurrently, so total latency is bounded by the
+    slowest feed rather than the sum of all of them. Results keep the
+    order of FINANCIAL_FEEDS.
+    
     Returns:
         List of dictionaries containing headline information with keys:
         - title: The headline title
@@ -91,40 +139,9 @@ def fetch_rss_headlines() -> List[Dict[str, Any]]:
     """
     headlines = []
     
-    for feed_info in FINANCIAL_FEEDS:
-        try:
-            # Parse the feed
-            feed = feedparser.parse(feed_info["url"])
-            
-            # Process each entry in the feed
-            for entry in feed.entries:
-                # Try to get published date from different possible fields
-                published_date = entry.get("published", "")
-                if not published_date:
-                    published_date = entry.get("pubDate", "")
-                if not published_date:
-                    published_date = entry.get("updated", "")
-                
-                # Extract and clean the relevant data
-                headline = {
-                    "title": entry.get("title", "").strip(),
-                    "link": entry.get("link", "").strip(),
-                    "published": standardize_timestamp(published_date),
-                    "source": feed_info["source"]
-                }
-                
-                # Try to get summary/description if available
-                if hasattr(entry, "summary"):
-                    headline["summary"] = entry.summary
-                elif hasattr(entry, "description"):
-                    headline["summary"] = entry.description
-                
-                # Only add non-empty headlines
-                if headline["title"] and headline["link"]:
-                    headlines.append(headline)
-                    
-        except Exception as e:
-            print(f"Error fetching feed {feed_info['url']}: {str(e)}")
+    with ThreadPoolExecutor(max_workers=min(FEED_FETCH_WORKERS, len(FINANCIAL_FEEDS))) as executor:
+        for feed_headlines in executor.map(_fetch_feed, FINANCIAL_FEEDS):
+            headlines.extend(feed_headlines)
     
     return headlines
 